@@ -4,12 +4,9 @@
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 CREATE EXTENSION IF NOT EXISTS "pgcrypto";
 
--- Create indexes for performance
-CREATE INDEX IF NOT EXISTS idx_mathematical_work_timestamp ON mathematical_work(timestamp);
-CREATE INDEX IF NOT EXISTS idx_mathematical_work_type ON mathematical_work(work_type);
-CREATE INDEX IF NOT EXISTS idx_mathematical_work_difficulty ON mathematical_work(difficulty);
-CREATE INDEX IF NOT EXISTS idx_blocks_timestamp ON blocks(timestamp);
-CREATE INDEX IF NOT EXISTS idx_blocks_index ON blocks(index);
+-- Tables and their indexes are created by the Alembic migrations in
+-- python_backend/migrations (run at backend startup), not here: this
+-- script runs before any table exists.
 
 -- Create function for automatic timestamp updates
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Engine Benchmarks - Python Implementation
+Single-core timing harness for the real mathematical engines
+
+Usage:
+    python python_backend/benchmarks.py sieve [--limit 100000000]
+    python python_backend/benchmarks.py collatz [--starts 1000000]
+    python python_backend/benchmarks.py qdt
+    DATABASE_URL=postgresql://... python python_backend/benchmarks.py db [--queries 2000]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import time
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from collatz_engine import CollatzEngine
+from postgres_pool import PostgresPool
+from prime_sieve import sieve_primes
+import qdt_kernels
+
+
+def _time_call(func: Callable, *args, repeat: int = 3):
+    """Return (best wall-clock seconds, last result) over `repeat` runs"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _legacy_sieve(limit: int) -> List[int]:
+    """Pure-Python list sieve the engines used before the NumPy sieve"""
+    if limit < 2:
+        return []
+
+    sieve = [True] * (limit + 1)
+    sieve[0] = sieve[1] = False
+
+    for i in range(2, int(limit**0.5) + 1):
+        if sieve[i]:
+            for j in range(i*i, limit + 1, i):
+                sieve[j] = False
+
+    return [i for i in range(2, limit + 1) if sieve[i]]
+
+
+def bench_sieve(args: argparse.Namespace) -> Dict[str, float]:
+    """Compare the legacy list sieve with the NumPy odd-only sieve"""
+    results = {}
+
+    for limit in (10**5, 10**6, 10**7):
+        legacy_time, legacy_primes = _time_call(_legacy_sieve, limit, repeat=1)
+        numpy_time, numpy_primes = _time_call(sieve_primes, limit)
+        assert len(legacy_primes) == numpy_primes.size
+        print(f"sieve 10^{int(math.log10(limit))}: legacy {legacy_time:.3f}s, "
+              f"numpy {numpy_time:.4f}s ({legacy_time / numpy_time:.0f}x), "
+              f"{numpy_primes.size} primes")
+        results[f'speedup_{limit}'] = legacy_time / numpy_time
+
+    numpy_time, primes = _time_call(sieve_primes, args.limit, repeat=1)
+    print(f"sieve {args.limit}: numpy {numpy_time:.3f}s, {primes.size} primes, "
+          f"largest {int(primes[-1])}")
+    results['large_sieve_seconds'] = numpy_time
+    return results
+
+
+def _legacy_collatz(lo: int, hi: int) -> List[int]:
+    """Per-number Python loop the engines used before the batched Collatz engine"""
+    all_steps = []
+    for n in range(lo, hi):
+        steps, current = 0, n
+        while current != 1 and steps < 10000:
+            current = current // 2 if current % 2 == 0 else 3 * current + 1
+            steps += 1
+        all_steps.append(steps)
+    return all_steps
+
+
+def bench_collatz(args: argparse.Namespace) -> Dict[str, float]:
+    """Compare the per-number loop with the batched, memoized Collatz engine"""
+    results = {}
+
+    legacy_time, legacy_steps = _time_call(_legacy_collatz, 1, 200001, repeat=1)
+    engine_time, verification = _time_call(lambda: CollatzEngine().verify_range(1, 200001))
+    assert legacy_steps == verification['steps'].tolist()
+    print(f"collatz [1, 200000]: legacy {legacy_time:.3f}s, "
+          f"engine {engine_time:.4f}s ({legacy_time / engine_time:.0f}x)")
+    results['speedup_200000'] = legacy_time / engine_time
+
+    # Cold engine at an arbitrary offset: includes filling the memo table once
+    offset = 10**12
+    engine_time, verification = _time_call(lambda: CollatzEngine().verify_range(offset, offset + args.starts), repeat=1)
+    print(f"collatz {args.starts} starts from 10^12: engine {engine_time:.3f}s, "
+          f"{args.starts / engine_time:,.0f} starts/s, {verification['valuesIterated']} iterated "
+          f"(2^{CollatzEngine().sieve_bits} residue sieve), max steps {int(verification['steps'].max())}")
+    results['starts_per_second'] = args.starts / engine_time
+    return results
+
+
+def _legacy_gap_resonance(gaps: np.ndarray, alpha: float, lambda_param: float):
+    """Per-gap comprehension the prime-gap analysis used before qdt_kernels"""
+    gap_energies = np.array([np.sin(alpha * gap) * np.exp(-gap/100) for gap in gaps])
+    resonance_strength = np.mean(np.abs(gap_energies))
+    coherence = lambda_param * np.std(gaps) / np.mean(gaps) if np.mean(gaps) > 0 else 0
+    return resonance_strength, coherence, np.std(gap_energies)
+
+
+def _legacy_ratio_deviations(ratios: List[float], phi: float):
+    """Per-ratio comprehension the Fibonacci analysis used before qdt_kernels"""
+    deviations = [abs(r - phi) for r in ratios]
+    return np.sum(deviations), np.std(deviations), np.mean(deviations)
+
+
+def _legacy_collatz_patterns(convergence_data: List[Dict], gamma: float):
+    """List-of-dicts analysis the Collatz verification used before qdt_kernels"""
+    steps = [d['steps'] for d in convergence_data]
+    max_values = [d['max_value'] for d in convergence_data]
+    pattern_strength = gamma * np.std(steps) / np.mean(steps) if np.mean(steps) > 0 else 0
+    energy_balance = 1.0 / (1.0 + np.var(max_values) / np.mean(max_values)**2) if np.mean(max_values) > 0 else 0
+    chaos_order = np.corrcoef(steps, max_values)[0,1] if len(steps) > 1 else 0
+    return pattern_strength, energy_balance, chaos_order
+
+
+def bench_qdt(args: argparse.Namespace) -> Dict[str, float]:
+    """Compare the legacy per-element QDT analytics with the whole-array kernels"""
+    results = {}
+    rng = np.random.default_rng(0)
+
+    for size in (10**4, 10**6, 10**7):
+        gaps = 2 * rng.geometric(0.1, size)
+        ratios = 1.618033988749895 + rng.normal(0, 1e-3, size)
+        steps = rng.integers(1, 500, size)
+        max_values = rng.integers(1, 10**9, size).astype(np.float64)
+        convergence_data = [{'steps': s, 'max_value': m} for s, m in zip(steps.tolist(), max_values.tolist())]
+
+        cases = {
+            'gap_resonance': (
+                lambda: _legacy_gap_resonance(gaps, 0.52, 0.867),
+                lambda: qdt_kernels.gap_resonance(gaps, 0.52, 0.867)
+            ),
+            'ratio_deviations': (
+                lambda: _legacy_ratio_deviations(ratios.tolist(), 1.618033988749895),
+                lambda: qdt_kernels.ratio_deviations(ratios, 1.618033988749895)
+            ),
+            'collatz_patterns': (
+                lambda: _legacy_collatz_patterns(convergence_data, 0.45),
+                lambda: qdt_kernels.collatz_patterns(steps, max_values, 0.45)
+            )
+        }
+        for name, (legacy, kernel) in cases.items():
+            legacy_time, legacy_result = _time_call(legacy, repeat=1)
+            kernel_time, kernel_result = _time_call(kernel)
+            print(f"{name} 10^{int(math.log10(size))}: legacy {legacy_time:.4f}s, "
+                  f"kernel {kernel_time:.4f}s ({legacy_time / kernel_time:.0f}x)")
+            results[f'{name}_speedup_{size}'] = legacy_time / kernel_time
+
+            # Same statistics to float tolerance (the deviation kernel returns the array itself)
+            if name != 'ratio_deviations':
+                assert np.allclose(legacy_result, kernel_result)
+
+    return results
+
+
+async def _round_trips(query: Callable, count: int) -> np.ndarray:
+    """Per-call latency in milliseconds of `count` sequential awaits of query()"""
+    latencies = np.empty(count)
+    for i in range(count):
+        started = time.perf_counter()
+        await query()
+        latencies[i] = (time.perf_counter() - started) * 1000
+    return latencies
+
+
+async def _bench_db(database_url: str, count: int) -> Dict[str, float]:
+    from databases import Database
+
+    payload = {'status': 'completed', 'gaps': list(range(64)), 'verificationData': {'method': 'sieve'}}
+
+    legacy = Database(database_url)
+    pool = PostgresPool(database_url)
+    await legacy.connect()
+    await pool.connect()
+    try:
+        # The databases wrapper compiles named binds through SQLAlchemy and hands JSONB over as text
+        cases = {
+            'scalar': (
+                lambda: legacy.fetch_val("SELECT CAST(:value AS int)", {'value': 1}),
+                lambda: pool.fetch_val("SELECT $1::int", 1)
+            ),
+            'jsonb': (
+                lambda: _legacy_jsonb_round_trip(legacy, payload),
+                lambda: pool.fetch_val("SELECT $1::jsonb", payload)
+            )
+        }
+
+        results = {}
+        for name, (before, after) in cases.items():
+            # Warm both sides so connection setup and statement preparation are not measured
+            await _round_trips(before, 50)
+            await _round_trips(after, 50)
+            assert await after() == (payload if name == 'jsonb' else 1)
+
+            before_ms = await _round_trips(before, count)
+            after_ms = await _round_trips(after, count)
+            for label, latencies in (('databases', before_ms), ('asyncpg pool', after_ms)):
+                print(f"{name} {label}: mean {latencies.mean():.3f}ms, "
+                      f"p50 {np.percentile(latencies, 50):.3f}ms, p99 {np.percentile(latencies, 99):.3f}ms")
+            print(f"{name}: {before_ms.mean() / after_ms.mean():.2f}x faster per round trip")
+            results[f'{name}_before_ms'] = float(before_ms.mean())
+            results[f'{name}_after_ms'] = float(after_ms.mean())
+        return results
+    finally:
+        await legacy.disconnect()
+        await pool.disconnect()
+
+
+async def _legacy_jsonb_round_trip(database, payload: Dict) -> Dict:
+    value = await database.fetch_val("SELECT CAST(:value AS jsonb)", {'value': json.dumps(payload)})
+    return json.loads(value)
+
+
+def bench_db(args: argparse.Namespace) -> Dict[str, float]:
+    """Compare round-trip latency of the databases wrapper with the tuned asyncpg pool"""
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        print("skipped: set DATABASE_URL to a PostgreSQL database")
+        return {}
+    return asyncio.run(_bench_db(database_url, args.queries))
+
+
+BENCHMARKS = {
+    'sieve': bench_sieve,
+    'collatz': bench_collatz,
+    'qdt': bench_qdt,
+    'db': bench_db,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the real mathematical engines")
+    parser.add_argument('benchmark', choices=sorted(BENCHMARKS) + ['all'])
+    parser.add_argument('--limit', type=int, default=10**8, help="Upper bound for the large sieve run")
+    parser.add_argument('--starts', type=int, default=10**6, help="Starting values for the far-range Collatz run")
+    parser.add_argument('--queries', type=int, default=2000, help="Round trips per database case")
+    args = parser.parse_args()
+
+    names = sorted(BENCHMARKS) if args.benchmark == 'all' else [args.benchmark]
+    for name in names:
+        print(f"=== {name} ===")
+        BENCHMARKS[name](args)
+
+
+if __name__ == "__main__":
+    main()
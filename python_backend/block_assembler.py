@@ -0,0 +1,214 @@
+"""
+Block Assembler - Python Implementation
+Batches completed discoveries into multi-discovery blocks committed by a Merkle root
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional
+
+from chain_writer import ChainWriter
+from database import DatabaseManager
+from merkle_tree import discovery_leaf, inclusion_proof, merkle_root, verify_inclusion
+from websocket_manager import WebSocketManager
+
+logger = logging.getLogger(__name__)
+
+# A block is sealed once this many discoveries are pending...
+DEFAULT_BLOCK_MAX_DISCOVERIES = int(os.getenv("BLOCK_MAX_DISCOVERIES", "64"))
+
+# ...or once the oldest pending discovery has waited this long
+DEFAULT_BLOCK_INTERVAL_SECONDS = float(os.getenv("BLOCK_INTERVAL_SECONDS", "10"))
+
+
+class BlockAssembler:
+    """
+    Collects completed mathematical_work records and seals them into blocks
+
+    Every block carries the SHA-256 Merkle root over its discoveries'
+    signatures and result digests, so one block write and one broadcast
+    cover many discoveries, and any discovery's membership can be shown with
+    an O(log n) inclusion proof. A block that fails to write keeps its
+    discoveries pending for the next attempt. Pending discoveries live in
+    memory, so start() reloads the committed ones a previous process never
+    sealed.
+    """
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        ws_manager: WebSocketManager,
+        chain_writer: ChainWriter,
+        max_discoveries: int = DEFAULT_BLOCK_MAX_DISCOVERIES,
+        interval_seconds: float = DEFAULT_BLOCK_INTERVAL_SECONDS
+    ):
+        self.db_manager = db_manager
+        self.ws_manager = ws_manager
+        self.chain_writer = chain_writer
+        self.max_discoveries = max(max_discoveries, 1)
+        self.interval_seconds = interval_seconds
+
+        self.pending: List[Dict[str, Any]] = []
+        self.oldest_pending: Optional[float] = None
+        self._wakeup = asyncio.Event()
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self.on_sealed: Optional[Callable[[Dict[str, Any]], None]] = None
+
+        self.stats = {'blocksSealed': 0, 'discoveriesSealed': 0, 'failedSeals': 0}
+
+    def add(self, mathematical_work: Dict[str, Any], miner_id: str, difficulty: int):
+        """Queue a recorded discovery for the next block"""
+        if not self.pending:
+            self.oldest_pending = time.time()
+        self.pending.append({'work': mathematical_work, 'minerId': miner_id, 'difficulty': difficulty})
+        if len(self.pending) >= self.max_discoveries:
+            self._wakeup.set()
+
+    async def start(self):
+        """Adopt discoveries left unsealed by a previous process, then start the background sealing task"""
+        if self._task is None:
+            unsealed = await self.db_manager.get_unsealed_discoveries()
+            if unsealed:
+                adopted = [{'work': work, 'minerId': work['worker_id'], 'difficulty': work['difficulty']}
+                           for work in unsealed]
+                self.pending[:0] = adopted
+                self.oldest_pending = time.time()
+                if len(self.pending) >= self.max_discoveries:
+                    self._wakeup.set()
+                logger.info(f"🧱 BLOCK ASSEMBLER: Adopted {len(unsealed)} unsealed discoveries")
+            self._task = asyncio.create_task(self._run())
+            logger.info(
+                f"🧱 BLOCK ASSEMBLER: Sealing every {self.interval_seconds}s or {self.max_discoveries} discoveries"
+            )
+
+    async def stop(self):
+        """Stop the background task and seal whatever is still pending"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.seal()
+
+    async def seal(self) -> Optional[Dict[str, Any]]:
+        """Write up to max_discoveries pending discoveries as one block; None if nothing was sealed"""
+        async with self._lock:
+            if not self.pending:
+                return None
+
+            batch = self.pending[:self.max_discoveries]
+            del self.pending[:len(batch)]
+            self.oldest_pending = time.time() if self.pending else None
+            if len(self.pending) >= self.max_discoveries:
+                self._wakeup.set()
+
+            works = [entry['work'] for entry in batch]
+            leaves = [discovery_leaf(work['signature'], work['result']) for work in works]
+            root = merkle_root(leaves)
+            miners = Counter(entry['minerId'] for entry in batch)
+
+            try:
+                # The chain writer assigns index and previous_hash from its in-memory tip
+                block = await self.chain_writer.append(
+                    merkle_root=root,
+                    difficulty=max(entry['difficulty'] for entry in batch),
+                    total_scientific_value=sum(work['scientific_value'] for work in works),
+                    miner_id=miners.most_common(1)[0][0],
+                    energy_consumed=sum(work['energy_efficiency'] for work in works) / 1000,  # Convert back to kWh
+                    discovery_ids=[work['id'] for work in works]
+                )
+            except Exception as e:
+                # Another process may have sealed some of them (both adopted them at startup); drop those
+                try:
+                    sealed = set(await self.db_manager.get_sealed_discovery_ids([work['id'] for work in works]))
+                except Exception:
+                    sealed = set()
+                batch = [entry for entry in batch if entry['work']['id'] not in sealed]
+                # Put the batch back in front so the next seal retries it in the same order
+                self.pending[:0] = batch
+                self.oldest_pending = time.time()
+                self.stats['failedSeals'] += 1
+                logger.error(f"❌ BLOCK ASSEMBLER: Error sealing {len(works)} discoveries: {e}")
+                return None
+
+            self.stats['blocksSealed'] += 1
+            self.stats['discoveriesSealed'] += len(batch)
+            logger.info(f"🔗 BLOCK: Sealed Block #{block['index']} with {len(batch)} discoveries (root {root[:12]}…)")
+            if self.on_sealed:
+                self.on_sealed(block)
+
+            # Broadcast new block
+            await self.ws_manager.broadcast({
+                'type': 'new_block',
+                'block': block,
+                'discoveries': [work['id'] for work in works],
+                'miners': dict(miners)
+            })
+            return block
+
+    async def get_inclusion_proof(self, discovery_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Merkle inclusion proof for a sealed discovery, or None if it is not in a block
+
+        The tree is rebuilt from the block's stored discoveries; the proof
+        itself is log2(n) sibling hashes checked against the block's root.
+        """
+        discovery = await self.db_manager.get_mathematical_work_by_id(discovery_id)
+        if not discovery or discovery.get('block_id') is None:
+            return None
+
+        block = await self.db_manager.get_block(discovery['block_id'])
+        works = await self.db_manager.get_block_discoveries(discovery['block_id'])
+        leaves = [discovery_leaf(work['signature'], work['result']) for work in works]
+        leaf_index = discovery['leaf_index']
+        proof = inclusion_proof(leaves, leaf_index)
+
+        return {
+            'discoveryId': discovery_id,
+            'blockId': block['id'],
+            'blockIndex': block['index'],
+            'leafIndex': leaf_index,
+            'leafCount': len(leaves),
+            'leaf': leaves[leaf_index],
+            'merkleRoot': block['merkle_root'],
+            'proof': proof,
+            'verified': verify_inclusion(leaves[leaf_index], proof, block['merkle_root'])
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get sealing counters and the current pending batch"""
+        return {
+            **self.stats,
+            'pending': len(self.pending),
+            'oldestPendingSeconds': round(time.time() - self.oldest_pending, 1) if self.oldest_pending else 0.0,
+            'maxDiscoveriesPerBlock': self.max_discoveries,
+            'intervalSeconds': self.interval_seconds,
+            'chainWriter': self.chain_writer.get_stats()
+        }
+
+    async def _run(self):
+        """Seal a block whenever the batch fills or the oldest discovery reaches the interval"""
+        while True:
+            timeout = self.interval_seconds
+            if self.oldest_pending is not None:
+                timeout = max(self.oldest_pending + self.interval_seconds - time.time(), 0)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            if self.pending and (
+                len(self.pending) >= self.max_discoveries
+                or time.time() - self.oldest_pending >= self.interval_seconds
+            ):
+                sealed = await self.seal()
+                if sealed is None and self.pending:
+                    # Write failed; wait a full interval before retrying
+                    await asyncio.sleep(self.interval_seconds)
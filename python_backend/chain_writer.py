@@ -0,0 +1,139 @@
+"""
+Chain Writer - Python Implementation
+Single-writer block append pipeline holding the chain tip in memory
+"""
+
+import asyncio
+import logging
+import os
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from database import DatabaseManager, compute_block_hash
+
+logger = logging.getLogger(__name__)
+
+# Queued appends written together in one statement
+DEFAULT_CHAIN_BATCH_SIZE = int(os.getenv("CHAIN_WRITE_BATCH_SIZE", "32"))
+
+
+class ChainWriter:
+    """
+    The only task that appends blocks
+
+    The tip is read from the database once at start and then kept in
+    memory. Appends are queued and a single task assigns each block its
+    index and previous_hash from the tip, so concurrent producers cannot
+    fork the chain. Whatever is queued when the task wakes is written as one
+    statement, i.e. one round trip per batch rather than a tip query plus an
+    insert per block. The unique index on blocks.index backs this up across
+    processes: a rejected batch fails its appends and the tip is reloaded.
+    """
+
+    def __init__(self, db_manager: DatabaseManager, batch_size: int = DEFAULT_CHAIN_BATCH_SIZE):
+        self.db_manager = db_manager
+        self.batch_size = max(batch_size, 1)
+
+        self.tip: Optional[Mapping[str, Any]] = None
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+        self.stats = {'appended': 0, 'batches': 0, 'failedBatches': 0, 'largestBatch': 0}
+
+    async def start(self):
+        """Load the chain tip and start the writer task"""
+        if self._task is None:
+            self.tip = await self.db_manager.get_latest_block()
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"✍️ CHAIN WRITER: Started at tip #{self.tip['index'] if self.tip else 'genesis'}")
+
+    async def stop(self):
+        """Write everything already queued, then stop the writer task"""
+        if self._task:
+            await self.queue.join()
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def append(
+        self,
+        merkle_root: str,
+        difficulty: int,
+        total_scientific_value: float,
+        miner_id: str,
+        energy_consumed: float,
+        discovery_ids: List[int]
+    ) -> Dict[str, Any]:
+        """Queue a block for the chain and wait until it is written; returns the stored block"""
+        if self._task is None:
+            raise RuntimeError("Chain writer is not running")
+
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put(({
+            'merkle_root': merkle_root,
+            'difficulty': difficulty,
+            'total_scientific_value': total_scientific_value,
+            'miner_id': miner_id,
+            'energy_consumed': energy_consumed,
+            'discovery_ids': discovery_ids
+        }, future))
+        return await future
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get append counters and the in-memory tip"""
+        return {
+            **self.stats,
+            'queued': self.queue.qsize(),
+            'tipIndex': self.tip['index'] if self.tip else None,
+            'tipHash': self.tip['block_hash'] if self.tip else None
+        }
+
+    async def _run(self):
+        """Drain the queue in batches, one write per batch"""
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            try:
+                await self._write(batch)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    async def _write(self, batch: List[Tuple[Dict[str, Any], asyncio.Future]]):
+        """Chain a batch onto the tip and store it, resolving each append's future"""
+        previous_hash = self.tip['block_hash'] if self.tip else "0" * 64
+        next_index = self.tip['index'] + 1 if self.tip else 0
+
+        blocks = []
+        for request, _ in batch:
+            nonce, block_hash = compute_block_hash(next_index, previous_hash, request['merkle_root'])
+            blocks.append({**request, 'index': next_index, 'previous_hash': previous_hash,
+                           'block_hash': block_hash, 'nonce': nonce})
+            previous_hash = block_hash
+            next_index += 1
+
+        try:
+            stored = await self.db_manager.append_blocks(blocks)
+        except Exception as e:
+            self.stats['failedBatches'] += 1
+            logger.error(f"❌ CHAIN WRITER: Batch of {len(batch)} blocks rejected: {e}")
+            # Another writer may have moved the chain; take the tip from the database again
+            try:
+                self.tip = await self.db_manager.get_latest_block()
+            except Exception as reload_error:
+                logger.error(f"❌ CHAIN WRITER: Could not reload tip: {reload_error}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.tip = stored[-1]
+        self.stats['appended'] += len(stored)
+        self.stats['batches'] += 1
+        self.stats['largestBatch'] = max(self.stats['largestBatch'], len(stored))
+        for (_, future), block in zip(batch, stored):
+            if not future.done():
+                future.set_result(block)
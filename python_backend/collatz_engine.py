@@ -0,0 +1,283 @@
+"""
+Collatz Engine - NumPy Implementation
+Batched lockstep Collatz trajectories with a memoized stopping-time table
+"""
+
+import logging
+import os
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+# Starting values whose total stopping time and peak are memoized (12 bytes each, ~24 MB by default)
+DEFAULT_MEMO_SIZE = int(os.getenv("COLLATZ_MEMO_SIZE", str(1 << 21)))
+
+# Trajectories advanced together per batch
+DEFAULT_BATCH_SIZE = 1 << 16
+
+# Residue sieve modulus 2^k; 0 disables it. Building it holds ~2^k int64 values (k=20: ~8 MB, ~2.6% survive)
+DEFAULT_SIEVE_BITS = int(os.getenv("COLLATZ_SIEVE_BITS", "20"))
+MAX_SIEVE_BITS = 26
+
+# Largest odd value whose 3n + 1 still fits in uint64; larger values continue as Python ints
+UINT64_STEP_LIMIT = (2**64 - 2) // 3
+
+
+def residue_survivors(bits: int) -> np.ndarray:
+    """
+    Residues r mod 2^bits whose starting values are not proven to drop below themselves within `bits` steps
+
+    For n = 2^bits * q + r the first `bits` steps of the shortcut map
+    (n / 2 or (3n + 1) / 2) have parities fixed by r, giving
+    T^j(n) = 3^c * 2^(bits - j) * q + T^j(r) after j steps with c odd ones.
+    Once 3^c < 2^j and T^j(r) < r, every n in the class has dropped below
+    itself, so its convergence follows from that of smaller values.
+    """
+    if not 0 < bits <= MAX_SIEVE_BITS:
+        raise ValueError(f"Residue sieve bits must be in 1..{MAX_SIEVE_BITS}, got {bits}")
+
+    # Largest number of odd steps c with 3^c < 2^j, for each step count j
+    odd_limit = [0] * (bits + 1)
+    for j in range(1, bits + 1):
+        while 3 ** (odd_limit[j] + 1) < 2 ** j:
+            odd_limit[j] += 1
+
+    residues = np.arange(1, 1 << bits, dtype=np.int64)  # r = 0 (n = 2^bits * q) halves straight down
+    values = residues.copy()
+    odd_counts = np.zeros(residues.size, dtype=np.int16)
+
+    for j in range(1, bits + 1):
+        odd = values & 1
+        values = np.where(odd == 1, (3 * values + 1) >> 1, values >> 1)
+        odd_counts += odd.astype(np.int16)
+
+        dropped = (odd_counts <= odd_limit[j]) & (values < residues)
+        keep = ~dropped
+        residues, values, odd_counts = residues[keep], values[keep], odd_counts[keep]
+
+    return residues.astype(np.uint64)
+
+
+class CollatzEngine:
+    """
+    Computes Collatz total stopping times for whole batches of starting values
+
+    Each batch advances its trajectories in lockstep with NumPy masks and
+    retires a trajectory as soon as it drops below the batch start (or below
+    the memoized prefix for ranges beyond it), finishing it from the memo
+    table. Results match direct iteration: steps to reach 1, the largest value
+    visited, and whether 1 was reached within max_iterations.
+
+    Above the memo table, starting values in residue classes mod 2^sieve_bits
+    that provably drop below themselves are skipped and only the survivors
+    are iterated.
+    """
+
+    def __init__(self, memo_size: int = DEFAULT_MEMO_SIZE, batch_size: int = DEFAULT_BATCH_SIZE,
+                 max_iterations: int = 10000, sieve_bits: int = DEFAULT_SIEVE_BITS):
+        self.memo_size = max(memo_size, 2)
+        self.batch_size = batch_size
+        self.max_iterations = max_iterations
+        self.sieve_bits = sieve_bits
+        self._survivors = None
+
+        self.memo_steps = np.zeros(self.memo_size, dtype=np.int32)
+        self.memo_max = np.zeros(self.memo_size, dtype=np.uint64)
+        self.memo_steps[1] = 0
+        self.memo_max[1] = 1
+        self.memo_filled = 2  # [1, memo_filled) is memoized
+
+    def run_batch(self, starts: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Return (steps, max_values, converged) for ascending starting values
+
+        max_values is uint64, or an object array when a trajectory outgrows it.
+        Every value below min(starts[0], memo_filled) must already be memoized.
+        """
+        starts = np.asarray(starts, dtype=np.uint64)
+        count = starts.size
+        steps_out = np.zeros(count, dtype=np.int64)
+        max_out = starts.copy()
+        converged = np.ones(count, dtype=bool)
+        overflow_max = {}
+        if not count:
+            return steps_out, max_out, converged
+
+        stop_bound = np.uint64(min(int(starts[0]), self.memo_filled))
+
+        idx = np.arange(count)
+        values = starts.copy()
+        steps = np.zeros(count, dtype=np.int64)
+        peaks = starts.copy()
+
+        # Starting values that are already resolvable (only 1 in practice)
+        done = (values < stop_bound) | (values == 1)
+        self._retire(done, idx, values, steps, peaks, steps_out, max_out)
+        keep = ~done
+        idx, values, steps, peaks = idx[keep], values[keep], steps[keep], peaks[keep]
+
+        while idx.size:
+            odd = (values & np.uint64(1)).astype(bool)
+
+            # Hand trajectories about to overflow uint64 to the Python-int path
+            overflow = odd & (values > UINT64_STEP_LIMIT)
+            if overflow.any():
+                for i in np.flatnonzero(overflow).tolist():
+                    n_steps, peak, ok = self._finish_python(int(values[i]), int(steps[i]), int(peaks[i]), int(stop_bound))
+                    steps_out[idx[i]] = n_steps
+                    overflow_max[int(idx[i])] = peak
+                    converged[idx[i]] = ok
+                keep = ~overflow
+                idx, values, steps, peaks, odd = idx[keep], values[keep], steps[keep], peaks[keep], odd[keep]
+                if not idx.size:
+                    break
+
+            values = np.where(odd, values * np.uint64(3) + np.uint64(1), values >> np.uint64(1))
+            steps += 1
+            np.maximum(peaks, values, out=peaks)
+
+            done = (values < stop_bound) | (values == 1)
+            capped = ~done & (steps >= self.max_iterations)
+            if done.any() or capped.any():
+                self._retire(done, idx, values, steps, peaks, steps_out, max_out)
+                if capped.any():
+                    steps_out[idx[capped]] = steps[capped]
+                    max_out[idx[capped]] = peaks[capped]
+                    converged[idx[capped]] = False
+                keep = ~(done | capped)
+                idx, values, steps, peaks = idx[keep], values[keep], steps[keep], peaks[keep]
+
+        if overflow_max:
+            max_out = max_out.astype(object)
+            for i, peak in overflow_max.items():
+                max_out[i] = peak
+
+        # Steps past the cap mean the trajectory did not reach 1 in time
+        converged &= steps_out <= self.max_iterations
+        return steps_out, max_out, converged
+
+    @property
+    def survivors(self) -> np.ndarray:
+        """Sorted surviving residues mod 2^sieve_bits, built on first use"""
+        if self._survivors is None:
+            self._survivors = residue_survivors(self.sieve_bits)
+            logger.info(f"🌀 COLLATZ SIEVE: {self._survivors.size} of {1 << self.sieve_bits} residue classes survive mod 2^{self.sieve_bits}")
+        return self._survivors
+
+    def verify_range(self, lo: int, hi: int, time_budget: Optional[float] = None,
+                     deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """
+        Verify every starting value in [lo, hi) batch by batch
+
+        Values below the memo size are iterated densely (filling the table);
+        with the residue sieve enabled, only surviving classes above it are
+        iterated and the rest are covered by the drop-below-start argument.
+        Steps and peaks are reported for iterated values only. Stops between
+        batches once time_budget seconds have elapsed or the deadline
+        expires; the returned 'coveredRange' is the prefix that was fully
+        verified and 'stopReason' says why it ended early.
+        """
+        deadline = Deadline.bound(deadline, time_budget)
+        stop_reason = None
+        lo = max(lo, 1)
+        self._ensure_memo(min(lo, self.memo_size))
+
+        step_chunks = []
+        max_chunks = []
+        failures = []
+        iterated = 0
+        covered_hi = lo
+
+        for batch_hi, starts in self._batches(lo, hi):
+            if starts.size:
+                steps, max_values, converged = self._run_and_memoize(starts)
+                failures.extend(starts[~converged].tolist())
+                step_chunks.append(steps[converged].astype(np.int32))
+                max_chunks.append(max_values[converged].astype(np.float64))
+                iterated += starts.size
+
+            covered_hi = batch_hi
+            stop_reason = deadline.reason if covered_hi < hi else None
+            if stop_reason:
+                break
+
+        steps = np.concatenate(step_chunks) if step_chunks else np.empty(0, dtype=np.int32)
+        max_values = np.concatenate(max_chunks) if max_chunks else np.empty(0, dtype=np.float64)
+        return {
+            'coveredRange': [lo, covered_hi],
+            'totalTested': covered_hi - lo,
+            'valuesIterated': iterated,
+            'verified': covered_hi - lo - len(failures),
+            'failureNumbers': failures,
+            'steps': steps,
+            'maxValues': max_values,
+            'stopReason': stop_reason
+        }
+
+    def _batches(self, lo: int, hi: int):
+        """Yield (batch_hi, starts) so that [lo, batch_hi) is covered once starts are verified"""
+        dense_hi = min(hi, self.memo_size) if self.sieve_bits else hi
+        for batch_lo in range(lo, dense_hi, self.batch_size):
+            batch_hi = min(batch_lo + self.batch_size, dense_hi)
+            yield batch_hi, np.arange(batch_lo, batch_hi, dtype=np.uint64)
+
+        sieve_lo = max(lo, dense_hi)
+        if sieve_lo >= hi:
+            return
+
+        survivors = self.survivors
+        modulus = 1 << self.sieve_bits
+        span = modulus * max(1, self.batch_size // max(survivors.size, 1))
+        for block_lo in range(sieve_lo - sieve_lo % modulus, hi, span):
+            block_hi = min(block_lo + span, hi)
+            bases = np.arange(block_lo, block_hi, modulus, dtype=np.uint64)
+            starts = (bases[:, None] + survivors[None, :]).ravel()
+            starts = starts[(starts >= np.uint64(sieve_lo)) & (starts < np.uint64(block_hi))]
+            yield block_hi, starts
+
+    def _run_and_memoize(self, starts: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Run a batch and extend the memo table with any results that continue its prefix"""
+        steps, max_values, converged = self.run_batch(starts)
+
+        first = int(starts[0])
+        if first <= self.memo_filled < self.memo_size and int(starts[-1]) - first + 1 == starts.size:
+            # Contiguous batch: memoize up to the first non-converged start
+            usable = starts.size if converged.all() else int(np.argmin(converged))
+            end = min(first + usable, self.memo_size)
+            if end > self.memo_filled:
+                offset = self.memo_filled - first
+                self.memo_steps[self.memo_filled:end] = steps[offset:offset + end - self.memo_filled]
+                self.memo_max[self.memo_filled:end] = max_values[offset:offset + end - self.memo_filled]
+                self.memo_filled = end
+
+        return steps, max_values, converged
+
+    def _ensure_memo(self, limit: int):
+        """Fill the memo table for every starting value below limit"""
+        while self.memo_filled < limit:
+            batch_hi = min(self.memo_filled + self.batch_size, limit)
+            self._run_and_memoize(np.arange(self.memo_filled, batch_hi, dtype=np.uint64))
+
+    def _retire(self, done, idx, values, steps, peaks, steps_out, max_out):
+        """Finish trajectories that reached the memoized prefix (or 1)"""
+        if not done.any():
+            return
+        finished = values[done]
+        lookup = finished.astype(np.int64)
+        steps_out[idx[done]] = steps[done] + self.memo_steps[lookup]
+        max_out[idx[done]] = np.maximum(peaks[done], self.memo_max[lookup])
+
+    def _finish_python(self, value: int, steps: int, peak: int, stop_bound: int) -> Tuple[int, int, bool]:
+        """Continue a trajectory with arbitrary-precision ints until it reaches the memo table"""
+        while value != 1 and value >= stop_bound and steps < self.max_iterations:
+            value = value // 2 if value % 2 == 0 else 3 * value + 1
+            peak = max(peak, value)
+            steps += 1
+
+        if value == 1 or value < stop_bound:
+            return steps + int(self.memo_steps[value]), max(peak, int(self.memo_max[value])), True
+        return steps, peak, False
@@ -0,0 +1,245 @@
+"""
+Compute Executor - Python Implementation
+Runs engine computation off the asyncio event loop, routing each work type to a managed pool
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional
+
+from deadline import Deadline
+from hybrid_mathematical_system import HybridMathematicalSystem
+
+logger = logging.getLogger(__name__)
+
+# Process workers for real (CPU-bound) computation; defaults to one per core
+DEFAULT_COMPUTE_WORKERS = int(os.getenv("COMPUTE_WORKERS", str(os.cpu_count() or 1)))
+
+# Process workers of a uvicorn process that is not the leader and only runs API work; the leader grows to COMPUTE_WORKERS
+DEFAULT_FOLLOWER_COMPUTE_WORKERS = int(os.getenv("FOLLOWER_COMPUTE_WORKERS", "1"))
+
+# Threads for simulated engines, which only sleep and therefore release the GIL
+DEFAULT_SIMULATION_THREADS = int(os.getenv("SIMULATION_THREADS", "8"))
+
+# Primes each worker maps (and the first one sieves) before taking work
+DEFAULT_PREWARM_PRIME_LIMIT = int(os.getenv("COMPUTE_PREWARM_PRIME_LIMIT", str(10**7)))
+
+# Shared cancellation flags; process jobs beyond this many in flight run uncancellable (deadline only)
+CANCEL_SLOTS = 1024
+
+
+# ===== WORKER PROCESS SIDE =====
+
+_worker_system: Optional[HybridMathematicalSystem] = None
+_cancel_flags = None
+
+
+def prewarm_engines(hybrid_system: HybridMathematicalSystem, prewarm_prime_limit: int = DEFAULT_PREWARM_PRIME_LIMIT):
+    """Fill the real engine's prime table and Collatz memo before it takes work"""
+    real_engine = hybrid_system.real_engine
+    real_engine.prime_table.primes_up_to(min(prewarm_prime_limit, real_engine.prime_table.max_limit))
+    real_engine.collatz_engine.verify_range(1, real_engine.collatz_engine.memo_size)
+
+
+def _initialize_worker(prewarm_prime_limit: int, cancel_flags):
+    """Build the engines once per worker process and prewarm them"""
+    global _worker_system, _cancel_flags
+    _worker_system = HybridMathematicalSystem()
+    _cancel_flags = cancel_flags
+    prewarm_engines(_worker_system, prewarm_prime_limit)
+
+
+def _prewarm() -> int:
+    """No-op task that forces a worker to start (running its initializer)"""
+    return os.getpid()
+
+
+def _worker_deadline(seconds: Optional[float], slot: Optional[int]) -> Deadline:
+    """Rebuild the caller's deadline in a worker around its shared cancellation flag"""
+    return Deadline(seconds, _cancel_flags, slot)
+
+
+def _run_compute(work_type: str, difficulty: int, options: Dict[str, Any],
+                 seconds: Optional[float] = None, slot: Optional[int] = None) -> Dict[str, Any]:
+    """Hybrid-routed computation in a worker"""
+    return _worker_system.compute_mathematical_work(work_type, difficulty, _worker_deadline(seconds, slot), **options)
+
+
+def _run_real(work_type: str, difficulty: int, options: Dict[str, Any],
+              seconds: Optional[float] = None, slot: Optional[int] = None) -> Dict[str, Any]:
+    """Real-engine computation in a worker"""
+    return _worker_system.real_engine.compute_real_mathematics(
+        work_type, difficulty, _worker_deadline(seconds, slot), **options
+    )
+
+
+def _run_verify(result: Dict[str, Any], seconds: Optional[float] = None, slot: Optional[int] = None) -> Dict[str, Any]:
+    """Independent re-computation of a result in a worker"""
+    return _worker_system.verify_mathematical_result(result, _worker_deadline(seconds, slot))
+
+
+# ===== EVENT LOOP SIDE =====
+
+class ComputeExecutor:
+    """
+    Awaitable front end for engine computation
+
+    Work the hybrid system would run on a real engine goes to a process pool
+    sized to the cores, whose workers build and prewarm their own engines
+    once. Simulated engines only sleep, so they run on the caller's hybrid
+    system in a thread pool instead of tying up a process. Nothing here
+    blocks the event loop.
+
+    Every call takes an optional Deadline. Thread jobs share the token
+    itself; process jobs get a slot in a shared flag array that the token is
+    linked to, so cancelling it (or cancelling the awaiting task) stops the
+    worker at its next chunk boundary and frees it for other work.
+    """
+
+    def __init__(self, hybrid_system: HybridMathematicalSystem, workers: int = DEFAULT_COMPUTE_WORKERS,
+                 simulation_threads: int = DEFAULT_SIMULATION_THREADS,
+                 prewarm_prime_limit: int = DEFAULT_PREWARM_PRIME_LIMIT):
+        self.hybrid_system = hybrid_system
+        self.workers = max(workers, 1)
+        self.simulation_threads = max(simulation_threads, 1)
+
+        self.prewarm_prime_limit = prewarm_prime_limit
+
+        # spawn, not fork: the parent runs an event loop and threads that must not be duplicated
+        self.context = multiprocessing.get_context('spawn')
+        self.cancel_flags = self.context.RawArray('b', CANCEL_SLOTS)
+        self.free_slots: List[int] = list(range(CANCEL_SLOTS))
+        self.process_pool = self._new_process_pool()
+        self.thread_pool = ThreadPoolExecutor(max_workers=self.simulation_threads, thread_name_prefix='simulation')
+
+        self.stats = {
+            pool: {'submitted': 0, 'completed': 0, 'failed': 0, 'cancelled': 0, 'running': 0, 'totalSeconds': 0.0}
+            for pool in ('process', 'thread')
+        }
+
+        logger.info(f"⚙️ COMPUTE EXECUTOR: {self.workers} process workers, {simulation_threads} simulation threads")
+
+    def resize(self, workers: int):
+        """
+        Replace the process pool with one of `workers` processes
+
+        Jobs already submitted finish on the old pool, which shuts down once
+        they have; new jobs go to the new pool, whose workers start (and
+        prewarm) on first use or on prewarm().
+        """
+        workers = max(workers, 1)
+        if workers == self.workers:
+            return
+        previous = self.process_pool
+        self.workers = workers
+        self.process_pool = self._new_process_pool()
+        previous.shutdown(wait=False)
+        logger.info(f"⚙️ COMPUTE EXECUTOR: Resized to {self.workers} process workers")
+
+    def route(self, work_type: str, difficulty: int) -> str:
+        """Pool a work type runs on at this difficulty: 'process' for real engines, 'thread' for simulation"""
+        mode = self.hybrid_system.determine_computation_mode(work_type, difficulty)
+        return 'process' if mode == 'real' else 'thread'
+
+    async def prewarm(self):
+        """Start every worker process now instead of on the first operation"""
+        loop = asyncio.get_running_loop()
+        start_time = time.time()
+        pids = await asyncio.gather(*(
+            loop.run_in_executor(self.process_pool, _prewarm) for _ in range(self.workers)
+        ))
+        logger.info(f"🔥 COMPUTE EXECUTOR: Prewarmed {len(set(pids))} workers in {time.time() - start_time:.1f}s")
+
+    async def compute(self, work_type: str, difficulty: int, deadline: Optional[Deadline] = None,
+                      **options) -> Dict[str, Any]:
+        """Run HybridMathematicalSystem.compute_mathematical_work on the routed pool"""
+        if self.route(work_type, difficulty) == 'process':
+            return await self._submit('process', deadline, _run_compute, work_type, difficulty, options)
+        return await self._submit('thread', deadline, partial(
+            self.hybrid_system.compute_mathematical_work, work_type, difficulty, deadline, **options
+        ))
+
+    async def compute_real(self, work_type: str, difficulty: int, deadline: Optional[Deadline] = None,
+                           **options) -> Dict[str, Any]:
+        """Run a real engine directly, bypassing the tractability threshold"""
+        return await self._submit('process', deadline, _run_real, work_type, difficulty, options)
+
+    async def verify(self, result: Dict[str, Any], deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """Run HybridMathematicalSystem.verify_mathematical_result, which recomputes the work"""
+        if self.route(result.get('workType'), result.get('difficulty') or 0) == 'process':
+            return await self._submit('process', deadline, _run_verify, result)
+        return await self._submit('thread', deadline, self.hybrid_system.verify_mathematical_result, result, deadline)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-pool submission counts and mean run time"""
+        return {
+            'processWorkers': self.workers,
+            'pools': {
+                pool: {**stats, 'averageSeconds': stats['totalSeconds'] / stats['completed'] if stats['completed'] else 0.0}
+                for pool, stats in self.stats.items()
+            }
+        }
+
+    def shutdown(self):
+        """Stop both pools; queued work is cancelled"""
+        self.process_pool.shutdown(wait=False, cancel_futures=True)
+        self.thread_pool.shutdown(wait=False, cancel_futures=True)
+        logger.info("🛑 COMPUTE EXECUTOR: Shut down")
+
+    def _new_process_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=self.context,
+            initializer=_initialize_worker,
+            initargs=(self.prewarm_prime_limit, self.cancel_flags)
+        )
+
+    async def _submit(self, pool: str, deadline: Optional[Deadline], func, *args) -> Dict[str, Any]:
+        """
+        Run func(*args) on the named pool and keep its counters
+
+        Process jobs get (remaining seconds, cancellation slot) appended to
+        their arguments. If the awaiting task is cancelled the deadline is
+        cancelled too, so the worker stops instead of finishing unobserved.
+        """
+        executor = self.process_pool if pool == 'process' else self.thread_pool
+        deadline = deadline or Deadline()
+        slot = None
+        if pool == 'process':
+            slot = self.free_slots.pop() if self.free_slots else None
+            if slot is not None:
+                deadline.link(self.cancel_flags, slot)
+            args = args + (deadline.remaining(), slot)
+
+        stats = self.stats[pool]
+        stats['submitted'] += 1
+        stats['running'] += 1
+        start_time = time.time()
+        loop = asyncio.get_running_loop()
+        job = executor.submit(func, *args)
+        try:
+            result = await asyncio.wrap_future(job)
+            stats['completed'] += 1
+            stats['totalSeconds'] += time.time() - start_time
+            return result
+        except asyncio.CancelledError:
+            stats['cancelled'] += 1
+            deadline.cancel()
+            raise
+        except Exception:
+            stats['failed'] += 1
+            raise
+        finally:
+            stats['running'] -= 1
+            if slot is not None:
+                # The slot stays flagged until the worker has actually returned
+                job.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release_slot, deadline, slot))
+
+    def _release_slot(self, deadline: Deadline, slot: int):
+        deadline.unlink(self.cancel_flags, slot)
+        self.free_slots.append(slot)
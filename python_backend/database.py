@@ -1,24 +1,73 @@
 """
 Database Manager - Python Implementation
-PostgreSQL database layer using SQLAlchemy and asyncpg
+PostgreSQL database layer on a tuned asyncpg pool
 """
 
 import logging
 import os
-import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import asyncio
 
 import asyncpg
-from databases import Database
-from sqlalchemy import create_engine, MetaData, Table, Column, Integer, String, DateTime, Float, Text, JSON, Boolean
+from sqlalchemy import create_engine, MetaData, Table, Column, Integer, BigInteger, String, DateTime, Float, Text, JSON, Boolean
 from sqlalchemy.sql import select, insert, update, delete, desc, func
 
 from models import *
+from postgres_pool import PostgresPool
+from verification_frontier import claim_interval, commit_interval, new_frontier_state, release_interval
 
 logger = logging.getLogger(__name__)
 
+# Largest page a listing returns, whatever limit is asked for
+MAX_PAGE_SIZE = int(os.getenv("API_MAX_PAGE_SIZE", "1000"))
+
+# JSONB columns left out of discovery listings unless requested by name
+HEAVY_DISCOVERY_COLUMNS = ('result', 'verification_data')
+
+# Run the Alembic migrations at startup; disable when they are applied by a deploy step instead
+AUTO_MIGRATE = os.getenv("DATABASE_AUTO_MIGRATE", "true").lower() == "true"
+
+# Bulk inserts of at least this many rows are loaded with COPY instead of a pipelined INSERT
+COPY_THRESHOLD = int(os.getenv("DATABASE_COPY_THRESHOLD", "64"))
+
+# Columns a caller supplies for a discovery or a metrics snapshot; the rest come from defaults
+MATHEMATICAL_WORK_COLUMNS = (
+    'work_type', 'difficulty', 'result', 'verification_data', 'computational_cost',
+    'energy_efficiency', 'scientific_value', 'worker_id', 'signature', 'range_start', 'range_end'
+)
+NETWORK_METRICS_COLUMNS = (
+    'active_miners', 'blocks_per_hour', 'energy_efficiency', 'scientific_value_generated',
+    'average_block_time', 'network_hashrate', 'total_knowledge_created', 'discoveries_per_hour'
+)
+
+MINING_OPERATION_INSERT = """
+    INSERT INTO mining_operations (
+        operation_type, miner_id, estimated_completion, difficulty, current_result, status,
+        lease_owner, lease_expires_at
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, CURRENT_TIMESTAMP + $8 * INTERVAL '1 second')
+    RETURNING *
+"""
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'alembic.ini')
+
+def run_migrations(database_url: str, revision: str = "head"):
+    """Upgrade the schema to `revision` with Alembic (blocking; run it off the event loop)"""
+    from alembic import command
+    from alembic.config import Config
+    
+    config = Config(ALEMBIC_INI)
+    config.attributes['database_url'] = database_url
+    command.upgrade(config, revision)
+    logger.info(f"📊 DATABASE: Schema migrated to {revision}")
+
+def compute_block_hash(index: int, previous_hash: str, merkle_root: str) -> Tuple[int, str]:
+    """Return (nonce, block_hash) for a block's header fields"""
+    import hashlib
+    nonce = hash(f"{index}{previous_hash}{merkle_root}") % 1000000
+    block_hash = hashlib.sha256(f"{index}{previous_hash}{merkle_root}{nonce}".encode()).hexdigest()
+    return nonce, block_hash
+
 class DatabaseManager:
     """
     Database manager for productive mining blockchain
@@ -30,7 +79,7 @@ class DatabaseManager:
         if not self.database_url:
             raise ValueError("DATABASE_URL environment variable is required")
         
-        self.database = Database(self.database_url)
+        self.database = PostgresPool(self.database_url)
         self.metadata = MetaData()
         
         # Define database tables
@@ -71,7 +120,11 @@ class DatabaseManager:
             Column('scientific_value', Float, nullable=False),
             Column('timestamp', DateTime, default=datetime.utcnow),
             Column('worker_id', String(255), nullable=False),
-            Column('signature', String(64), nullable=False)
+            Column('signature', String(64), nullable=False),
+            Column('range_start', BigInteger, nullable=True),
+            Column('range_end', BigInteger, nullable=True),
+            Column('block_id', Integer, nullable=True),
+            Column('leaf_index', Integer, nullable=True)
         )
         
         # Mining operations table
@@ -85,7 +138,12 @@ class DatabaseManager:
             Column('progress', Float, default=0.0),
             Column('current_result', JSON, nullable=False),
             Column('difficulty', Integer, nullable=False),
-            Column('status', String(20), default='active')
+            Column('status', String(20), default='active'),
+            Column('lease_owner', String(64), nullable=True),
+            Column('lease_expires_at', DateTime, nullable=True),
+            Column('checkpoint', JSON, nullable=True),
+            Column('recovery_attempts', Integer, default=0),
+            Column('claimed_interval', JSON, nullable=True)
         )
         
         # Network metrics table
@@ -99,94 +157,36 @@ class DatabaseManager:
             Column('scientific_value_generated', Float, nullable=False),
             Column('average_block_time', Float, nullable=False),
             Column('network_hashrate', Float, nullable=False),
-            Column('total_knowledge_created', Integer, nullable=False)
+            Column('total_knowledge_created', Integer, nullable=False),
+            Column('discoveries_per_hour', Integer, nullable=False, default=0)
+        )
+        
+        # Verification frontier table (one row per resumable conjecture)
+        self.verification_frontier_table = Table(
+            'verification_frontier', self.metadata,
+            Column('work_type', String(50), primary_key=True),
+            Column('frontier', BigInteger, nullable=False),
+            Column('next_start', BigInteger, nullable=False),
+            Column('completed_intervals', JSON, nullable=False),
+            Column('released_intervals', JSON, nullable=False),
+            Column('updated_at', DateTime, default=datetime.utcnow)
         )
     
     async def initialize(self):
-        """Initialize database connection and create tables"""
+        """Initialize database connection and bring the schema up to date"""
         try:
             await self.database.connect()
             
-            # Create tables using asyncpg directly
-            async with self.database.transaction():
-                await self._create_tables()
+            # Schema and indexes are versioned Alembic migrations (python_backend/migrations)
+            if AUTO_MIGRATE:
+                await asyncio.to_thread(run_migrations, self.database_url)
             
-            logger.info("✅ DATABASE: Connected and tables created")
+            logger.info("✅ DATABASE: Connected and schema migrated")
             
         except Exception as e:
             logger.error(f"❌ DATABASE: Initialization failed: {e}")
             raise
     
-    async def _create_tables(self):
-        """Create database tables if they don't exist"""
-        
-        # Create blocks table
-        await self.database.execute("""
-            CREATE TABLE IF NOT EXISTS blocks (
-                id SERIAL PRIMARY KEY,
-                index INTEGER NOT NULL,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                previous_hash VARCHAR(64) NOT NULL,
-                merkle_root VARCHAR(64) NOT NULL,
-                block_hash VARCHAR(64) NOT NULL,
-                difficulty INTEGER NOT NULL,
-                nonce INTEGER NOT NULL,
-                total_scientific_value FLOAT NOT NULL,
-                miner_id VARCHAR(255) NOT NULL,
-                energy_consumed FLOAT NOT NULL,
-                knowledge_created INTEGER NOT NULL
-            )
-        """)
-        
-        # Create mathematical work table
-        await self.database.execute("""
-            CREATE TABLE IF NOT EXISTS mathematical_work (
-                id SERIAL PRIMARY KEY,
-                work_type VARCHAR(50) NOT NULL,
-                difficulty INTEGER NOT NULL,
-                result JSONB NOT NULL,
-                verification_data JSONB NOT NULL,
-                computational_cost FLOAT NOT NULL,
-                energy_efficiency FLOAT NOT NULL,
-                scientific_value FLOAT NOT NULL,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                worker_id VARCHAR(255) NOT NULL,
-                signature VARCHAR(64) NOT NULL
-            )
-        """)
-        
-        # Create mining operations table
-        await self.database.execute("""
-            CREATE TABLE IF NOT EXISTS mining_operations (
-                id SERIAL PRIMARY KEY,
-                operation_type VARCHAR(50) NOT NULL,
-                miner_id VARCHAR(255) NOT NULL,
-                start_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                estimated_completion TIMESTAMP NOT NULL,
-                progress FLOAT DEFAULT 0.0,
-                current_result JSONB NOT NULL,
-                difficulty INTEGER NOT NULL,
-                status VARCHAR(20) DEFAULT 'active'
-            )
-        """)
-        
-        # Create network metrics table
-        await self.database.execute("""
-            CREATE TABLE IF NOT EXISTS network_metrics (
-                id SERIAL PRIMARY KEY,
-                timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                active_miners INTEGER NOT NULL,
-                blocks_per_hour FLOAT NOT NULL,
-                energy_efficiency FLOAT NOT NULL,
-                scientific_value_generated FLOAT NOT NULL,
-                average_block_time FLOAT NOT NULL,
-                network_hashrate FLOAT NOT NULL,
-                total_knowledge_created INTEGER NOT NULL
-            )
-        """)
-        
-        logger.info("📊 DATABASE: Tables created successfully")
-    
     # ===== BLOCK OPERATIONS =====
     
     async def create_block(
@@ -202,9 +202,7 @@ class DatabaseManager:
     ) -> Dict[str, Any]:
         """Create a new block"""
         
-        import hashlib
-        nonce = hash(f"{index}{previous_hash}{merkle_root}") % 1000000
-        block_hash = hashlib.sha256(f"{index}{previous_hash}{merkle_root}{nonce}".encode()).hexdigest()
+        nonce, block_hash = compute_block_hash(index, previous_hash, merkle_root)
         
         query = """
             INSERT INTO blocks (
@@ -222,10 +220,114 @@ class DatabaseManager:
         logger.info(f"🔗 BLOCK CREATED: Block #{index} with {knowledge_created} discoveries")
         return dict(result)
     
-    async def get_blocks(self, limit: int = 100) -> List[Dict[str, Any]]:
-        """Get blockchain blocks"""
-        query = "SELECT * FROM blocks ORDER BY index DESC LIMIT $1"
-        results = await self.database.fetch_all(query, limit)
+    async def append_blocks(self, blocks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Insert consecutive blocks and link their discoveries in a single statement
+        
+        Each block dict carries its header fields (index, previous_hash,
+        merkle_root, block_hash, nonce, ...) and discovery_ids in Merkle leaf
+        order. The unique index on blocks.index rejects the whole batch if
+        any index is already taken, and the batch is also rejected if any of
+        its discoveries was already sealed (e.g. by another process that
+        adopted it after a restart).
+        """
+        link_index, link_work, link_leaf = [], [], []
+        for block in blocks:
+            for leaf_index, work_id in enumerate(block['discovery_ids']):
+                link_index.append(block['index'])
+                link_work.append(work_id)
+                link_leaf.append(leaf_index)
+        
+        query = """
+            WITH new_blocks AS (
+                INSERT INTO blocks (
+                    index, previous_hash, merkle_root, block_hash, difficulty,
+                    nonce, total_scientific_value, miner_id, energy_consumed, knowledge_created
+                )
+                SELECT * FROM unnest(
+                    $1::int[], $2::varchar[], $3::varchar[], $4::varchar[], $5::int[],
+                    $6::int[], $7::float8[], $8::varchar[], $9::float8[], $10::int[]
+                )
+                RETURNING *
+            ), linked AS (
+                UPDATE mathematical_work AS work
+                SET block_id = new_blocks.id, leaf_index = links.leaf_index
+                FROM unnest($11::int[], $12::int[], $13::int[]) AS links(block_index, work_id, leaf_index)
+                JOIN new_blocks ON new_blocks.index = links.block_index
+                WHERE work.id = links.work_id AND work.block_id IS NULL
+                RETURNING work.id
+            )
+            SELECT new_blocks.*, (SELECT COUNT(*) FROM linked) AS linked_count FROM new_blocks ORDER BY index
+        """
+        
+        async with self.database.transaction():
+            results = await self.database.fetch_all(
+                query,
+                [block['index'] for block in blocks],
+                [block['previous_hash'] for block in blocks],
+                [block['merkle_root'] for block in blocks],
+                [block['block_hash'] for block in blocks],
+                [block['difficulty'] for block in blocks],
+                [block['nonce'] for block in blocks],
+                [block['total_scientific_value'] for block in blocks],
+                [block['miner_id'] for block in blocks],
+                [block['energy_consumed'] for block in blocks],
+                [len(block['discovery_ids']) for block in blocks],
+                link_index, link_work, link_leaf
+            )
+            if results and results[0]['linked_count'] != len(link_work):
+                # Raising inside the transaction rolls the new blocks back
+                raise ValueError(f"{len(link_work) - results[0]['linked_count']} discoveries are already sealed")
+        
+        for block in blocks:
+            logger.info(f"🔗 BLOCK CREATED: Block #{block['index']} with {len(block['discovery_ids'])} discoveries")
+        return [{key: value for key, value in row.items() if key != 'linked_count'} for row in results]
+    
+    async def get_block_discoveries(self, block_id: int) -> List[asyncpg.Record]:
+        """Get a block's discoveries in Merkle leaf order (read-only Records, for rebuilding its tree)"""
+        query = "SELECT * FROM mathematical_work WHERE block_id = $1 ORDER BY leaf_index"
+        return await self.database.fetch_all(query, block_id)
+    
+    def _projection(self, table: Table, fields: Optional[List[str]], key: str, exclude: Tuple[str, ...] = ()) -> str:
+        """Column list for a listing: the requested fields (always with the cursor key) or every column not excluded"""
+        columns = list(table.columns.keys())
+        if not fields:
+            return ', '.join(column for column in columns if column not in exclude)
+        
+        unknown = set(fields) - set(columns)
+        if unknown:
+            raise ValueError(f"Unknown {table.name} fields: {', '.join(sorted(unknown))}")
+        return ', '.join(column for column in columns if column in fields or column == key)
+    
+    async def get_blocks(
+        self,
+        limit: int = 100,
+        before_index: Optional[int] = None,
+        after_index: Optional[int] = None,
+        fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get a page of blocks, newest first
+        
+        Keyset pagination on the unique blocks.index: pass the last index of
+        a page as before_index for the next (older) page, or after_index to
+        walk the chain forwards from a known block. Every page is a range
+        scan of that index, so deep pages cost the same as the first.
+        """
+        if before_index is not None and after_index is not None:
+            raise ValueError("Use either before_index or after_index, not both")
+        
+        columns = self._projection(self.blocks_table, fields, 'index')
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        if after_index is not None:
+            query = f"SELECT {columns} FROM blocks WHERE index > $1 ORDER BY index ASC LIMIT $2"
+            results = await self.database.fetch_all(query, after_index, limit)
+        elif before_index is not None:
+            query = f"SELECT {columns} FROM blocks WHERE index < $1 ORDER BY index DESC LIMIT $2"
+            results = await self.database.fetch_all(query, before_index, limit)
+        else:
+            query = f"SELECT {columns} FROM blocks ORDER BY index DESC LIMIT $1"
+            results = await self.database.fetch_all(query, limit)
         return [dict(row) for row in results]
     
     async def get_block(self, block_id: int) -> Optional[Dict[str, Any]]:
@@ -234,11 +336,10 @@ class DatabaseManager:
         result = await self.database.fetch_one(query, block_id)
         return dict(result) if result else None
     
-    async def get_latest_block(self) -> Optional[Dict[str, Any]]:
-        """Get the latest block"""
+    async def get_latest_block(self) -> Optional[asyncpg.Record]:
+        """Get the latest block (a read-only Record; the chain writer only reads its index and hash)"""
         query = "SELECT * FROM blocks ORDER BY index DESC LIMIT 1"
-        result = await self.database.fetch_one(query)
-        return dict(result) if result else None
+        return await self.database.fetch_one(query)
     
     # ===== MATHEMATICAL WORK OPERATIONS =====
     
@@ -252,30 +353,58 @@ class DatabaseManager:
         energy_efficiency: float,
         scientific_value: float,
         worker_id: str,
-        signature: str
+        signature: str,
+        range_start: Optional[int] = None,
+        range_end: Optional[int] = None
     ) -> Dict[str, Any]:
-        """Create mathematical work record"""
+        """Create mathematical work record, with the verified interval for resumable work types"""
         
         query = """
             INSERT INTO mathematical_work (
                 work_type, difficulty, result, verification_data, computational_cost,
-                energy_efficiency, scientific_value, worker_id, signature
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+                energy_efficiency, scientific_value, worker_id, signature, range_start, range_end
+            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11)
             RETURNING *
         """
         
         result_record = await self.database.fetch_one(
-            query, work_type, difficulty, json.dumps(result), json.dumps(verification_data),
-            computational_cost, energy_efficiency, scientific_value, worker_id, signature
+            query, work_type, difficulty, result, verification_data,
+            computational_cost, energy_efficiency, scientific_value, worker_id, signature,
+            range_start, range_end
         )
         
         logger.info(f"🔬 DISCOVERY: {work_type} worth ${scientific_value:.2f}")
         return dict(result_record)
     
-    async def get_mathematical_work(self, limit: int = 1000) -> List[Dict[str, Any]]:
-        """Get mathematical discoveries"""
-        query = "SELECT * FROM mathematical_work ORDER BY timestamp DESC LIMIT $1"
-        results = await self.database.fetch_all(query, limit)
+    async def get_mathematical_work(
+        self,
+        limit: int = 1000,
+        before_id: Optional[int] = None,
+        after_id: Optional[int] = None,
+        fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get a page of mathematical discoveries, newest first
+        
+        Keyset pagination on the primary key: pass the last id of a page as
+        before_id for the next (older) page, or after_id to read forwards.
+        The result and verification_data JSONB columns are only returned
+        when named in fields.
+        """
+        if before_id is not None and after_id is not None:
+            raise ValueError("Use either before_id or after_id, not both")
+        
+        columns = self._projection(self.mathematical_work_table, fields, 'id', HEAVY_DISCOVERY_COLUMNS)
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        if after_id is not None:
+            query = f"SELECT {columns} FROM mathematical_work WHERE id > $1 ORDER BY id ASC LIMIT $2"
+            results = await self.database.fetch_all(query, after_id, limit)
+        elif before_id is not None:
+            query = f"SELECT {columns} FROM mathematical_work WHERE id < $1 ORDER BY id DESC LIMIT $2"
+            results = await self.database.fetch_all(query, before_id, limit)
+        else:
+            query = f"SELECT {columns} FROM mathematical_work ORDER BY id DESC LIMIT $1"
+            results = await self.database.fetch_all(query, limit)
         return [dict(row) for row in results]
     
     async def get_mathematical_work_by_id(self, discovery_id: int) -> Optional[Dict[str, Any]]:
@@ -284,6 +413,18 @@ class DatabaseManager:
         result = await self.database.fetch_one(query, discovery_id)
         return dict(result) if result else None
     
+    async def get_unsealed_discoveries(self) -> List[Dict[str, Any]]:
+        """Discoveries not yet in a block, oldest first"""
+        query = "SELECT * FROM mathematical_work WHERE block_id IS NULL ORDER BY id"
+        results = await self.database.fetch_all(query)
+        return [dict(row) for row in results]
+    
+    async def get_sealed_discovery_ids(self, discovery_ids: List[int]) -> List[int]:
+        """Which of these discoveries already belong to a block"""
+        query = "SELECT id FROM mathematical_work WHERE id = ANY($1::int[]) AND block_id IS NOT NULL"
+        results = await self.database.fetch_all(query, discovery_ids)
+        return [row['id'] for row in results]
+    
     # ===== MINING OPERATIONS =====
     
     async def create_mining_operation(
@@ -292,26 +433,26 @@ class DatabaseManager:
         miner_id: str,
         estimated_completion: datetime,
         difficulty: int,
-        current_result: Dict[str, Any]
+        current_result: Dict[str, Any],
+        status: str = 'active',
+        lease_owner: Optional[str] = None,
+        lease_seconds: Optional[float] = None
     ) -> Dict[str, Any]:
-        """Create mining operation"""
-        
-        query = """
-            INSERT INTO mining_operations (
-                operation_type, miner_id, estimated_completion, difficulty, current_result
-            ) VALUES ($1, $2, $3, $4, $5)
-            RETURNING *
-        """
-        
+        """Create mining operation, leased to lease_owner for lease_seconds if given"""
         result = await self.database.fetch_one(
-            query, operation_type, miner_id, estimated_completion, difficulty, json.dumps(current_result)
+            MINING_OPERATION_INSERT, operation_type, miner_id, estimated_completion, difficulty, current_result, status,
+            lease_owner, lease_seconds
         )
         
         return dict(result)
     
     async def get_active_mining_operations(self) -> List[Dict[str, Any]]:
-        """Get active mining operations"""
-        query = "SELECT * FROM mining_operations WHERE status = 'active' ORDER BY start_time DESC"
+        """Get active mining operations whose owner is still renewing their lease"""
+        query = """
+            SELECT * FROM mining_operations
+            WHERE status = 'active' AND lease_expires_at >= CURRENT_TIMESTAMP
+            ORDER BY start_time DESC
+        """
         results = await self.database.fetch_all(query)
         return [dict(row) for row in results]
     
@@ -322,13 +463,202 @@ class DatabaseManager:
             SET progress = $1, current_result = $2 
             WHERE id = $3
         """
-        await self.database.execute(query, progress, json.dumps(current_result), operation_id)
+        await self.database.execute(query, progress, current_result, operation_id)
     
-    async def complete_mining_operation(self, operation_id: int):
-        """Mark mining operation as completed"""
-        query = "UPDATE mining_operations SET status = 'completed' WHERE id = $1"
+    async def activate_mining_operation(self, operation_id: int):
+        """Move a pending mining operation to active when it gets an execution slot"""
+        query = """
+            UPDATE mining_operations 
+            SET status = 'active', start_time = CURRENT_TIMESTAMP 
+            WHERE id = $1
+        """
         await self.database.execute(query, operation_id)
     
+    async def complete_mining_operation(self, operation_id: int, status: str = 'completed'):
+        """Mark mining operation as completed (or another final status such as 'cancelled')"""
+        query = "UPDATE mining_operations SET status = $1 WHERE id = $2"
+        await self.database.execute(query, status, operation_id)
+    
+    async def renew_operation_leases(self, operation_ids: List[int], lease_owner: str, lease_seconds: float):
+        """Extend the leases this owner holds on its queued and running operations"""
+        query = """
+            UPDATE mining_operations
+            SET lease_expires_at = CURRENT_TIMESTAMP + $3 * INTERVAL '1 second'
+            WHERE id = ANY($1::int[]) AND lease_owner = $2
+        """
+        await self.database.execute(query, operation_ids, lease_owner, lease_seconds)
+    
+    async def save_operation_checkpoint(self, operation_id: int, checkpoint: Dict[str, Any]):
+        """Store resumable engine state for an operation"""
+        query = "UPDATE mining_operations SET checkpoint = $1 WHERE id = $2"
+        await self.database.execute(query, checkpoint, operation_id)
+    
+    async def claim_orphaned_operations(self, lease_owner: str, lease_seconds: float) -> List[asyncpg.Record]:
+        """
+        Take over unfinished operations whose lease has expired (or that never had one)
+        
+        Claimed rows go back to 'pending' under the new owner with
+        recovery_attempts incremented. SKIP LOCKED lets several processes
+        recover concurrently without claiming the same operation twice.
+        Recovery only reads the rows, so they are returned as Records.
+        """
+        query = """
+            UPDATE mining_operations
+            SET status = 'pending', lease_owner = $1,
+                lease_expires_at = CURRENT_TIMESTAMP + $2 * INTERVAL '1 second',
+                recovery_attempts = recovery_attempts + 1
+            WHERE id IN (
+                SELECT id FROM mining_operations
+                WHERE status IN ('active', 'pending')
+                  AND (lease_expires_at IS NULL OR lease_expires_at < CURRENT_TIMESTAMP)
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING *
+        """
+        return await self.database.fetch_all(query, lease_owner, lease_seconds)
+    
+    # ===== VERIFICATION FRONTIER =====
+    
+    async def claim_verification_interval(
+        self, work_type: str, origin: int, span: int, operation_id: Optional[int] = None
+    ) -> Tuple[int, int]:
+        """Assign the next unverified [start, end) interval, recorded on operation_id's row in the same transaction"""
+        async with self.database.transaction():
+            [interval] = await self.claim_verification_interval_batch([(work_type, origin, span, operation_id)])
+        return interval
+    
+    async def commit_verification_interval(
+        self, work_type: str, origin: int, start: int, covered_end: int, claimed_end: int,
+        operation_id: Optional[int] = None
+    ) -> int:
+        """Record a verified interval and return the new frontier; operation_id no longer holds the claim"""
+        async with self.database.transaction():
+            frontiers = await self.commit_verification_interval_batch(
+                [(work_type, origin, start, covered_end, claimed_end, operation_id)]
+            )
+        return frontiers[work_type]
+    
+    async def release_verification_interval(
+        self, work_type: str, origin: int, start: int, end: int, operation_id: Optional[int] = None
+    ):
+        """Hand an abandoned interval back for re-assignment; operation_id no longer holds the claim"""
+        async with self.database.transaction():
+            await self.release_verification_interval_batch([(work_type, origin, start, end, operation_id)])
+    
+    async def claim_verification_interval_batch(
+        self, claims: List[Tuple[str, int, int, Optional[int]]]
+    ) -> List[Tuple[int, int]]:
+        """
+        Apply (work_type, origin, span, operation_id) claims; returns the intervals in order
+        
+        Each work type's frontier row is locked and saved once for the whole
+        batch. Call this inside transaction().
+        """
+        states = {}
+        intervals = []
+        for work_type, origin, span, _ in claims:
+            if work_type not in states:
+                states[work_type] = await self._lock_frontier_state(work_type, origin)
+            interval = claim_interval(states[work_type], span)
+            intervals.append(interval)
+            logger.info(f"🧭 FRONTIER: Assigned {work_type} interval [{interval[0]}, {interval[1]})")
+        for work_type, state in states.items():
+            await self._save_frontier_state(work_type, state)
+        await self._set_claimed_intervals([
+            (operation_id, list(interval)) for (_, _, _, operation_id), interval in zip(claims, intervals)
+            if operation_id is not None
+        ])
+        return intervals
+    
+    async def commit_verification_interval_batch(
+        self, commits: List[Tuple[str, int, int, int, int, Optional[int]]]
+    ) -> Dict[str, int]:
+        """
+        Apply (work_type, origin, start, covered_end, claimed_end, operation_id) commits
+        
+        Returns the new frontier of each work type. Call this inside transaction().
+        """
+        states = {}
+        for work_type, origin, start, covered_end, claimed_end, _ in commits:
+            if work_type not in states:
+                states[work_type] = await self._lock_frontier_state(work_type, origin)
+            commit_interval(states[work_type], start, covered_end, claimed_end)
+            logger.info(f"🧭 FRONTIER: {work_type} verified [{start}, {covered_end}), "
+                        f"frontier now {states[work_type]['frontier']}")
+        for work_type, state in states.items():
+            await self._save_frontier_state(work_type, state)
+        await self._set_claimed_intervals([
+            (operation_id, None) for *_, operation_id in commits if operation_id is not None
+        ])
+        return {work_type: state['frontier'] for work_type, state in states.items()}
+    
+    async def release_verification_interval_batch(self, releases: List[Tuple[str, int, int, int, Optional[int]]]):
+        """Apply (work_type, origin, start, end, operation_id) releases. Call this inside transaction()."""
+        states = {}
+        for work_type, origin, start, end, _ in releases:
+            if work_type not in states:
+                states[work_type] = await self._lock_frontier_state(work_type, origin)
+            release_interval(states[work_type], start, end)
+        for work_type, state in states.items():
+            await self._save_frontier_state(work_type, state)
+        await self._set_claimed_intervals([
+            (operation_id, None) for *_, operation_id in releases if operation_id is not None
+        ])
+    
+    async def get_interval_discovery(self, work_type: str, start: int, end: int) -> Optional[asyncpg.Record]:
+        """The discovery recorded for a claimed [start, end) interval (it may cover only a prefix), if any"""
+        query = """
+            SELECT id, range_start, range_end FROM mathematical_work
+            WHERE work_type = $1 AND range_start = $2 AND range_end <= $3
+            ORDER BY id LIMIT 1
+        """
+        return await self.database.fetch_one(query, work_type, start, end)
+    
+    async def _set_claimed_intervals(self, claimed: List[Tuple[int, Optional[List[int]]]]):
+        """Record (operation_id, interval or None) claims on the operation rows"""
+        if claimed:
+            query = "UPDATE mining_operations SET claimed_interval = $1 WHERE id = $2"
+            await self.database.execute_many(query, [(interval, operation_id) for operation_id, interval in claimed])
+    
+    async def get_verification_frontiers(self) -> List[Dict[str, Any]]:
+        """Get the verified frontier of every resumable work type"""
+        query = "SELECT * FROM verification_frontier ORDER BY work_type"
+        results = await self.database.fetch_all(query)
+        return [dict(row) for row in results]
+    
+    async def _lock_frontier_state(self, work_type: str, origin: int) -> Dict[str, Any]:
+        """Load a frontier row FOR UPDATE, creating it at its origin on first use"""
+        initial = new_frontier_state(origin)
+        await self.database.execute(
+            """
+            INSERT INTO verification_frontier (work_type, frontier, next_start, completed_intervals, released_intervals)
+            VALUES ($1, $2, $3, $4, $5)
+            ON CONFLICT (work_type) DO NOTHING
+            """,
+            work_type, initial['frontier'], initial['next_start'], [], []
+        )
+        row = await self.database.fetch_one(
+            "SELECT * FROM verification_frontier WHERE work_type = $1 FOR UPDATE", work_type
+        )
+        return {
+            'frontier': row['frontier'],
+            'next_start': row['next_start'],
+            'completed': row['completed_intervals'],
+            'released': row['released_intervals']
+        }
+    
+    async def _save_frontier_state(self, work_type: str, state: Dict[str, Any]):
+        query = """
+            UPDATE verification_frontier
+            SET frontier = $1, next_start = $2, completed_intervals = $3, released_intervals = $4,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE work_type = $5
+        """
+        await self.database.execute(
+            query, state['frontier'], state['next_start'],
+            state['completed'], state['released'], work_type
+        )
+    
     # ===== NETWORK METRICS =====
     
     async def create_network_metrics(
@@ -339,30 +669,106 @@ class DatabaseManager:
         scientific_value_generated: float,
         average_block_time: float,
         network_hashrate: float,
-        total_knowledge_created: int
+        total_knowledge_created: int,
+        discoveries_per_hour: int = 0
     ) -> Dict[str, Any]:
         """Create network metrics record"""
         
         query = """
             INSERT INTO network_metrics (
                 active_miners, blocks_per_hour, energy_efficiency, scientific_value_generated,
-                average_block_time, network_hashrate, total_knowledge_created
-            ) VALUES ($1, $2, $3, $4, $5, $6, $7)
+                average_block_time, network_hashrate, total_knowledge_created, discoveries_per_hour
+            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
             RETURNING *
         """
         
         result = await self.database.fetch_one(
             query, active_miners, blocks_per_hour, energy_efficiency, scientific_value_generated,
-            average_block_time, network_hashrate, total_knowledge_created
+            average_block_time, network_hashrate, total_knowledge_created, discoveries_per_hour
         )
         
         return dict(result)
     
-    async def get_latest_metrics(self) -> Optional[Dict[str, Any]]:
-        """Get latest network metrics"""
+    async def get_latest_metrics(self) -> Optional[asyncpg.Record]:
+        """Get latest network metrics (a read-only Record, mapped to the API shape by the caller)"""
         query = "SELECT * FROM network_metrics ORDER BY timestamp DESC LIMIT 1"
-        result = await self.database.fetch_one(query)
-        return dict(result) if result else None
+        return await self.database.fetch_one(query)
+    
+    # ===== BULK WRITES =====
+    
+    def transaction(self):
+        """Run the enclosed DatabaseManager calls in one transaction on one connection"""
+        return self.database.transaction()
+    
+    async def create_mathematical_work_batch(self, works: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Insert discoveries (dicts keyed by MATHEMATICAL_WORK_COLUMNS); returns the stored rows in order"""
+        stored = await self._insert_rows('mathematical_work', MATHEMATICAL_WORK_COLUMNS, works)
+        for work in stored:
+            logger.info(f"🔬 DISCOVERY: {work['work_type']} worth ${work['scientific_value']:.2f}")
+        return stored
+    
+    async def create_network_metrics_batch(self, snapshots: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Insert metrics snapshots (dicts keyed by NETWORK_METRICS_COLUMNS); returns the stored rows in order"""
+        return await self._insert_rows('network_metrics', NETWORK_METRICS_COLUMNS, snapshots)
+    
+    async def create_mining_operation_batch(self, operations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Insert mining operations (create_mining_operation keyword dicts); returns the stored rows in order"""
+        results = await self.database.fetch_many(MINING_OPERATION_INSERT, [
+            (operation['operation_type'], operation['miner_id'], operation['estimated_completion'],
+             operation['difficulty'], operation['current_result'], operation.get('status', 'active'),
+             operation.get('lease_owner'), operation.get('lease_seconds'))
+            for operation in operations
+        ])
+        return [dict(row) for row in results]
+    
+    async def activate_mining_operation_batch(self, operation_ids: List[int]):
+        query = """
+            UPDATE mining_operations 
+            SET status = 'active', start_time = CURRENT_TIMESTAMP 
+            WHERE id = ANY($1::int[])
+        """
+        await self.database.execute(query, operation_ids)
+    
+    async def update_mining_operation_batch(self, updates: List[Tuple[int, float, Dict[str, Any]]]):
+        """Apply (operation_id, progress, current_result) updates"""
+        query = "UPDATE mining_operations SET progress = $1, current_result = $2 WHERE id = $3"
+        await self.database.execute_many(query, [(progress, result, operation_id) for operation_id, progress, result in updates])
+    
+    async def save_operation_checkpoint_batch(self, checkpoints: List[Tuple[int, Dict[str, Any]]]):
+        """Store (operation_id, checkpoint) pairs"""
+        query = "UPDATE mining_operations SET checkpoint = $1 WHERE id = $2"
+        await self.database.execute_many(query, [(checkpoint, operation_id) for operation_id, checkpoint in checkpoints])
+    
+    async def complete_mining_operation_batch(self, completions: List[Tuple[int, str]]):
+        """Set the final status of (operation_id, status) pairs"""
+        query = "UPDATE mining_operations SET status = $1 WHERE id = $2"
+        await self.database.execute_many(query, [(status, operation_id) for operation_id, status in completions])
+    
+    async def _insert_rows(self, table: str, columns: Tuple[str, ...], rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Insert rows into a table with a SERIAL id, returning the stored rows in input order
+        
+        Small batches are one pipelined INSERT ... RETURNING. Large ones
+        reserve their ids from the sequence, COPY the rows in, and read them
+        back by id, which also picks up the column defaults. Call this inside
+        transaction() so a failed COPY leaves nothing behind.
+        """
+        values = [tuple(row.get(column) for column in columns) for row in rows]
+        if len(values) < COPY_THRESHOLD:
+            placeholders = ', '.join(f"${position}" for position in range(1, len(columns) + 1))
+            query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) RETURNING *"
+            results = await self.database.fetch_many(query, values)
+            return [dict(row) for row in results]
+        
+        reserved = await self.database.fetch_all(
+            f"SELECT nextval(pg_get_serial_sequence('{table}', 'id')) AS id FROM generate_series(1, $1)", len(values)
+        )
+        ids = sorted(row['id'] for row in reserved)
+        await self.database.copy_records_to_table(
+            table, [(row_id, *row_values) for row_id, row_values in zip(ids, values)], ['id', *columns]
+        )
+        results = await self.database.fetch_all(f"SELECT * FROM {table} WHERE id = ANY($1::int[]) ORDER BY id", ids)
+        return [dict(row) for row in results]
     
     # ===== UTILITY OPERATIONS =====
     
@@ -370,6 +776,7 @@ class DatabaseManager:
         """Clear all blockchain data for restart"""
         try:
             await self.database.execute("DELETE FROM network_metrics")
+            await self.database.execute("DELETE FROM verification_frontier")
             await self.database.execute("DELETE FROM mining_operations")
             await self.database.execute("DELETE FROM mathematical_work")
             await self.database.execute("DELETE FROM blocks")
@@ -0,0 +1,104 @@
+"""
+Deadline - Python Implementation
+Cooperative cancellation and deadline tokens checked by engines between chunks
+"""
+
+import threading
+import time
+from typing import Any, List, Optional, Tuple
+
+
+class ComputationCancelled(Exception):
+    """Raised by work without a meaningful partial result once its deadline expires or it is cancelled"""
+
+
+class Deadline:
+    """
+    Cancellation token with an optional expiry time
+
+    Engines call expired() between chunks of work and return what they have
+    covered so far; work with no partial result calls check() instead.
+    Tokens derived with within() share the parent's cancellation but may
+    expire sooner. In a worker process the token is rebuilt around a slot of
+    a shared flag array (see link()), so cancelling in the parent stops the
+    worker at its next check.
+    """
+
+    POLL_SECONDS = 0.05
+
+    def __init__(self, seconds: Optional[float] = None, cancel_flags: Any = None, slot: Optional[int] = None):
+        self.expires_at = time.monotonic() + seconds if seconds is not None else None
+        self._event = threading.Event()
+        self._flags: List[Tuple[Any, int]] = [(cancel_flags, slot)] if cancel_flags is not None and slot is not None else []
+
+    @classmethod
+    def bound(cls, deadline: Optional['Deadline'], seconds: Optional[float] = None) -> 'Deadline':
+        """The given token (or an unbounded one) limited to at most `seconds` from now"""
+        deadline = deadline or cls()
+        return deadline.within(seconds) if seconds is not None else deadline
+
+    def within(self, seconds: float) -> 'Deadline':
+        """A token sharing this one's cancellation that expires after `seconds` at most"""
+        child = Deadline(seconds)
+        if self.expires_at is not None:
+            child.expires_at = min(child.expires_at, self.expires_at)
+        child._event = self._event
+        child._flags = self._flags
+        return child
+
+    def link(self, cancel_flags: Any, slot: int):
+        """Mirror cancellation into a shared flag array slot read by another process"""
+        cancel_flags[slot] = 1 if self._event.is_set() else 0
+        self._flags.append((cancel_flags, slot))
+
+    def unlink(self, cancel_flags: Any, slot: int):
+        self._flags.remove((cancel_flags, slot))
+
+    def cancel(self):
+        self._event.set()
+        for flags, slot in self._flags:
+            flags[slot] = 1
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set() or any(flags[slot] for flags, slot in self._flags)
+
+    @property
+    def reason(self) -> Optional[str]:
+        """'cancelled', 'deadline' or None while the work may continue"""
+        if self.cancelled:
+            return 'cancelled'
+        if self.expires_at is not None and time.monotonic() >= self.expires_at:
+            return 'deadline'
+        return None
+
+    def expired(self) -> bool:
+        return self.reason is not None
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left, or None without an expiry"""
+        if self.expires_at is None:
+            return None
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    def check(self):
+        """Raise ComputationCancelled if the work should stop"""
+        reason = self.reason
+        if reason:
+            raise ComputationCancelled(f"Computation stopped: {reason}")
+
+    def sleep(self, seconds: float) -> bool:
+        """Sleep up to `seconds`, waking early when stopped; True if interrupted"""
+        end = time.monotonic() + seconds
+        while not self.expired():
+            now = time.monotonic()
+            if now >= end:
+                return False
+            wait = end - now
+            if self.expires_at is not None:
+                wait = min(wait, self.expires_at - now)
+            # Shared flags cannot be waited on, so poll them; a local cancel wakes the wait at once
+            if self._flags:
+                wait = min(wait, self.POLL_SECONDS)
+            self._event.wait(max(wait, 0))
+        return True
@@ -0,0 +1,154 @@
+"""
+Fibonacci Engine - Python Implementation
+Fast-doubling Fibonacci/Lucas numbers with exact golden-ratio convergence analysis
+"""
+
+import logging
+import math
+import os
+from decimal import Context, Decimal
+from fractions import Fraction
+from typing import Any, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Decimal digits used when comparing F(n+1)/F(n) with the golden ratio
+DEFAULT_RATIO_PRECISION = int(os.getenv("FIBONACCI_RATIO_PRECISION", "100"))
+MAX_RATIO_PRECISION = 4000
+
+# Values with more digits are reported in scientific notation (Python refuses str() past 4300 digits)
+MAX_EXACT_DIGITS = 1000
+
+
+def fibonacci_pair(n: int) -> Tuple[int, int]:
+    """
+    Return (F(n), F(n+1)) by fast doubling in O(log n) big-int multiplications
+
+    F(2k) = F(k) * (2F(k+1) - F(k)),  F(2k+1) = F(k)^2 + F(k+1)^2
+    """
+    if n < 0:
+        raise ValueError("Fibonacci index must be non-negative")
+
+    a, b = 0, 1  # F(k), F(k+1) for the prefix of n's bits processed so far
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        a, b = (d, c + d) if bit == '1' else (c, d)
+    return a, b
+
+
+def fibonacci_lucas(n: int) -> Tuple[int, int]:
+    """Return (F(n), L(n)), using L(n) = 2F(n+1) - F(n)"""
+    f_n, f_next = fibonacci_pair(n)
+    return f_n, 2 * f_next - f_n
+
+
+def decimal_digits(value: int) -> int:
+    """Exact number of decimal digits of a non-negative int without converting it to str"""
+    if value == 0:
+        return 1
+    estimate = int((value.bit_length() - 1) * math.log10(2)) + 1
+    return estimate + 1 if value >= 10 ** estimate else estimate
+
+
+def summarize_int(value: int, significant: int = 12):
+    """The int itself when short enough to serialize, otherwise a scientific-notation string"""
+    digits = decimal_digits(value)
+    if digits <= MAX_EXACT_DIGITS:
+        return value
+    leading = value // 10 ** (digits - significant)
+    mantissa = str(leading)
+    return f"{mantissa[0]}.{mantissa[1:]}e+{digits - 1}"
+
+
+class FibonacciEngine:
+    """
+    Computes F(n), L(n) and golden-ratio convergence on demand
+
+    Nothing proportional to the sequence length is stored: terms come from
+    fast doubling, a short tail of consecutive terms is stepped forward from
+    there, and ratios are compared with phi in exact fixed-point arithmetic
+    at a configurable decimal precision.
+    """
+
+    def __init__(self, precision: int = DEFAULT_RATIO_PRECISION):
+        if not 1 <= precision <= MAX_RATIO_PRECISION:
+            raise ValueError(f"Ratio precision must be in 1..{MAX_RATIO_PRECISION}, got {precision}")
+        self.precision = precision
+
+        # phi = (1 + sqrt(5)) / 2 as an integer scaled by 2^scale_bits, with guard bits
+        self.scale_bits = int(precision * math.log2(10)) + 32
+        one = 1 << self.scale_bits
+        self._phi_fixed = (one + math.isqrt(5 * one * one)) // 2
+
+    def terms(self, start: int, count: int) -> List[int]:
+        """F(start), ..., F(start + count - 1)"""
+        a, b = fibonacci_pair(start)
+        sequence = []
+        for _ in range(count):
+            sequence.append(a)
+            a, b = b, a + b
+        return sequence
+
+    def ratio_analysis(self, n: int) -> Dict[str, Any]:
+        """
+        Compare F(n+1)/F(n) with phi at self.precision digits
+
+        measuredDigits is how many decimal digits of phi the ratio actually
+        matches (capped by the precision); exactBoundDigits comes from the
+        exact rational step |F(n+1)/F(n) - F(n)/F(n-1)| = 1/(F(n)F(n-1)),
+        which bounds the distance to phi. The step is formed directly from
+        Cassini's identity rather than reduced with a gcd, which would be
+        quadratic in the size of F(n).
+        """
+        if n < 2:
+            raise ValueError("Ratio analysis needs n >= 2")
+
+        f_prev, f_n = fibonacci_pair(n - 1)
+        f_next = f_prev + f_n
+
+        ratio_fixed = (f_next << self.scale_bits) // f_n
+        error = abs(ratio_fixed - self._phi_fixed)
+        error_bits = error.bit_length()
+        measured = int((self.scale_bits - error_bits) * math.log10(2)) if error_bits else self.precision
+
+        step = Fraction(-1 if n % 2 else 1, f_n * f_prev)
+
+        context = Context(prec=self.precision)
+        ratio = context.divide(Decimal(ratio_fixed), Decimal(1 << self.scale_bits))
+
+        return {
+            'index': n,
+            'ratio': str(ratio),
+            'measuredDigits': min(measured, self.precision),
+            'exactBoundDigits': decimal_digits(step.denominator) - 1,
+            'precisionDigits': self.precision
+        }
+
+    def check_identities(self, indices: List[int]) -> Dict[str, Any]:
+        """
+        Check Cassini's identity, F(2n) = F(n)L(n) and L(n)^2 - 5F(n)^2 = 4(-1)^n at sampled indices
+
+        F(2n) is computed independently by fast doubling, so the doubling
+        identity cross-checks two separate evaluations.
+        """
+        failures = []
+        for n in indices:
+            f_prev, f_n = fibonacci_pair(n - 1) if n > 0 else (1, 0)
+            f_next = f_prev + f_n
+            lucas = 2 * f_next - f_n
+            sign = -1 if n % 2 else 1
+
+            if f_prev * f_next - f_n * f_n != sign:
+                failures.append({'index': n, 'identity': 'cassini'})
+            if fibonacci_pair(2 * n)[0] != f_n * lucas:
+                failures.append({'index': n, 'identity': 'doubling'})
+            if lucas * lucas - 5 * f_n * f_n != 4 * sign:
+                failures.append({'index': n, 'identity': 'lucas_norm'})
+
+        return {
+            'sampledIndices': list(indices),
+            'identities': ['cassini', 'doubling', 'lucas_norm'],
+            'failures': failures,
+            'valid': not failures
+        }
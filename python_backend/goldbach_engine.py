@@ -0,0 +1,249 @@
+"""
+Goldbach Engine - NumPy Implementation
+Block-vectorized Goldbach verification by minimal partitions, with optional exhaustive or FFT pair counting
+"""
+
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from deadline import Deadline
+from prime_sieve import PrimeTable
+
+logger = logging.getLogger(__name__)
+
+# Largest candidate for the smallest Goldbach prime; the true maximum below 4*10^18 is 9781
+MAX_MINIMAL_PRIME = 1 << 15
+
+# Even numbers verified per block (window indicator is ~2x this many bytes)
+DEFAULT_BLOCK_EVENS = 1 << 18
+
+# Indicator chunk length for overlap-add FFT convolution (two spectra of this size are live at once)
+DEFAULT_FFT_CHUNK = 1 << 21
+
+# Largest distance from an integer tolerated before FFT counts are considered unreliable
+FFT_ROUNDING_TOLERANCE = 0.25
+
+
+def minimal_partitions(evens: np.ndarray, window: np.ndarray, window_lo: int, small_primes: np.ndarray) -> np.ndarray:
+    """
+    For each even n return the smallest prime p with n - p prime, or 0 if none of small_primes works
+
+    `window` is a primality indicator for [window_lo, evens.max()] and must
+    reach at least max(small_primes) below evens.min(). Each pass tests one
+    prime against only the evens that are still unresolved, so the cost is
+    dominated by the first few primes.
+    """
+    result = np.zeros(evens.size, dtype=np.int64)
+    pending = np.arange(evens.size)
+
+    for p in small_primes.tolist():
+        if not pending.size:
+            break
+        complements = evens[pending] - p
+        hits = (complements >= 2) & window[np.maximum(complements - window_lo, 0)]
+        result[pending[hits]] = p
+        pending = pending[~hits]
+
+    return result
+
+
+def ordered_sum_counts_fft(indicator: np.ndarray, chunk_size: int = DEFAULT_FFT_CHUNK) -> Tuple[np.ndarray, float]:
+    """
+    Self-convolve a 0/1 indicator: counts[n] = #{(a, b) ordered : a + b = n, both marked}
+
+    The indicator is cut into chunks whose pairwise convolutions are
+    overlap-added into one int64 output covering n < len(indicator), so the
+    FFT size stays fixed however long the range is. Returns the counts and the
+    largest distance of any raw FFT value from the integer it was rounded to;
+    raises ArithmeticError if that exceeds FFT_ROUNDING_TOLERANCE.
+    """
+    size = indicator.size
+    counts = np.zeros(size, dtype=np.int64)
+    if not size:
+        return counts, 0.0
+
+    chunk_size = min(chunk_size, size)
+    fft_size = 1 << (2 * chunk_size - 1).bit_length()
+    values = indicator.astype(np.float64)
+    max_error = 0.0
+
+    for i_start in range(0, size, chunk_size):
+        left = np.fft.rfft(values[i_start:i_start + chunk_size], fft_size)
+        for j_start in range(i_start, size - i_start, chunk_size):
+            right = left if j_start == i_start else np.fft.rfft(values[j_start:j_start + chunk_size], fft_size)
+            out_start = i_start + j_start
+            length = min(2 * chunk_size - 1, size - out_start)
+
+            raw = np.fft.irfft(left * right, fft_size)[:length]
+            rounded = np.rint(raw)
+            max_error = max(max_error, float(np.max(np.abs(raw - rounded))) if length else 0.0)
+
+            # Off-diagonal chunk pairs stand for both orders (a in i, b in j) and (a in j, b in i)
+            multiplier = 1 if j_start == i_start else 2
+            counts[out_start:out_start + length] += multiplier * rounded.astype(np.int64)
+
+    if max_error > FFT_ROUNDING_TOLERANCE:
+        raise ArithmeticError(f"FFT convolution rounding error {max_error:.3f} exceeds tolerance")
+
+    return counts, max_error
+
+
+class GoldbachVerifier:
+    """
+    Verifies the Goldbach conjecture over ranges of even numbers
+
+    Verification finds the minimal partition n = p + q for whole blocks of
+    even numbers at once against a primality indicator window. Counting every
+    pair ("averagePairs") is a separate, separately budgeted mode.
+    """
+
+    def __init__(self, prime_table: PrimeTable, block_evens: int = DEFAULT_BLOCK_EVENS,
+                 fft_chunk: int = DEFAULT_FFT_CHUNK):
+        self.prime_table = prime_table
+        self.block_evens = block_evens
+        self.fft_chunk = fft_chunk
+        self.small_primes = prime_table.primes_up_to(MAX_MINIMAL_PRIME)
+
+    def verify_range(self, lo: int, hi: int, time_budget: Optional[float] = None,
+                     deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """
+        Verify every even n in [lo, hi) block by block
+
+        Stops between blocks once time_budget seconds have elapsed or the
+        deadline expires; the returned 'coveredRange' is the prefix that was
+        fully verified and 'stopReason' says why it ended early.
+        """
+        deadline = Deadline.bound(deadline, time_budget)
+        stop_reason = None
+        lo = max(lo + (lo & 1), 4)
+        span = 2 * self.block_evens
+
+        verified = 0
+        failures = []
+        minimal_prime_sum = 0
+        max_minimal_prime = 0
+        max_minimal_at = 0
+        largest_verified = 0
+        covered_hi = lo
+
+        for block_lo in range(lo, hi, span):
+            block_hi = min(block_lo + span, hi)
+            window_lo = max(block_lo - int(self.small_primes[-1]), 0)
+            window = self.prime_table.indicator(window_lo, block_hi)
+
+            evens = np.arange(block_lo, block_hi, 2, dtype=np.int64)
+            partitions = minimal_partitions(evens, window, window_lo, self.small_primes)
+
+            unresolved = np.flatnonzero(partitions == 0)
+            for index in unresolved.tolist():
+                partitions[index] = self._minimal_partition_exhaustive(int(evens[index]))
+
+            found = partitions > 0
+            verified += int(np.count_nonzero(found))
+            failures.extend(evens[~found].tolist())
+            if found.any():
+                largest_verified = int(evens[found][-1])
+            minimal_prime_sum += int(partitions.sum())
+
+            block_max = int(np.argmax(partitions))
+            if partitions[block_max] > max_minimal_prime:
+                max_minimal_prime = int(partitions[block_max])
+                max_minimal_at = int(evens[block_max])
+
+            covered_hi = block_hi
+            stop_reason = deadline.reason if covered_hi < hi else None
+            if stop_reason:
+                break
+
+        return {
+            'coveredRange': [lo, covered_hi],
+            'totalTested': verified + len(failures),
+            'verified': verified,
+            'failureNumbers': failures,
+            'largestVerified': largest_verified,
+            'maxMinimalPrime': max_minimal_prime,
+            'maxMinimalPrimeAt': max_minimal_at,
+            'meanMinimalPrime': minimal_prime_sum / verified if verified else 0.0,
+            'stopReason': stop_reason
+        }
+
+    def count_pairs_exhaustive(self, lo: int, hi: int, time_budget: Optional[float] = None,
+                               deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """Count unordered pairs p + q = n, p <= q, for every even n in [lo, hi)"""
+        deadline = Deadline.bound(deadline, time_budget)
+        lo = max(lo + (lo & 1), 4)
+
+        primes = self.prime_table.primes_up_to(max(hi - 1, 2))
+        is_prime = self.prime_table.indicator(0, max(hi, 3))
+
+        counted = 0
+        total_pairs = 0
+        last_even = lo - 2
+        for even_num in range(lo, hi, 2):
+            half_count = np.searchsorted(primes, even_num // 2, side='right')
+            total_pairs += int(np.count_nonzero(is_prime[even_num - primes[:half_count]]))
+            counted += 1
+            last_even = even_num
+
+            if deadline.expired():
+                break
+
+        return {
+            'mode': 'exhaustive',
+            'range': [lo, last_even],
+            'numbersCounted': counted,
+            'totalPairs': total_pairs,
+            'averagePairs': total_pairs / counted if counted else 0.0
+        }
+
+    def count_pairs_fft(self, lo: int, hi: int, time_budget: Optional[float] = None,
+                        deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """
+        Goldbach representation counts r(n) for every even n in [lo, hi) from one FFT self-convolution
+
+        r(n) counts unordered pairs p <= q like count_pairs_exhaustive. The
+        convolution is one O(N log N) pass that cannot stop part way, so the
+        deadline (bounded by time_budget) is checked before it starts: if it
+        has already expired nothing is counted and 'stopReason' says why.
+        """
+        deadline = Deadline.bound(deadline, time_budget)
+        lo = max(lo + (lo & 1), 4)
+        hi = max(hi, lo)
+
+        is_prime = self.prime_table.indicator(0, hi)
+        if deadline.expired():
+            return {
+                'mode': 'fft',
+                'range': [lo, lo - 2],
+                'numbersCounted': 0,
+                'totalPairs': 0,
+                'averagePairs': 0.0,
+                'stopReason': deadline.reason
+            }
+        ordered, max_error = ordered_sum_counts_fft(is_prime, self.fft_chunk)
+
+        evens = np.arange(lo, hi, 2)
+        pairs = (ordered[evens] + is_prime[evens // 2]) // 2
+        counted = int(evens.size)
+        total_pairs = int(pairs.sum())
+        peak = int(np.argmax(pairs)) if counted else 0
+
+        return {
+            'mode': 'fft',
+            'range': [lo, int(evens[-1]) if counted else lo - 2],
+            'numbersCounted': counted,
+            'totalPairs': total_pairs,
+            'averagePairs': total_pairs / counted if counted else 0.0,
+            'maxPairs': int(pairs[peak]) if counted else 0,
+            'maxPairsAt': int(evens[peak]) if counted else 0,
+            'maxRoundingError': round(max_error, 6)
+        }
+
+    def _minimal_partition_exhaustive(self, n: int) -> int:
+        """Fallback for numbers whose smallest Goldbach prime exceeds MAX_MINIMAL_PRIME"""
+        primes = self.prime_table.primes_up_to(n)
+        candidates = primes[primes <= n // 2]
+        hits = np.isin(n - candidates, primes, assume_unique=True)
+        return int(candidates[np.argmax(hits)]) if hits.any() else 0
@@ -0,0 +1,288 @@
+"""
+Group Commit Writer - Python Implementation
+Buffers the per-discovery database writes and commits them together
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from database import DatabaseManager
+
+logger = logging.getLogger(__name__)
+
+# How long the first queued write waits for others to join its transaction
+DEFAULT_GROUP_COMMIT_MS = float(os.getenv("DATABASE_GROUP_COMMIT_MS", "5"))
+
+# Most writes committed in one transaction
+DEFAULT_GROUP_COMMIT_BATCH_SIZE = int(os.getenv("DATABASE_GROUP_COMMIT_BATCH_SIZE", "1000"))
+
+# Order of the statements inside a transaction, so an operation's row exists before it is updated
+# and a verified interval is committed no earlier than its discovery
+WRITE_STAGES = (
+    'create_operation', 'activate', 'claim_interval', 'progress', 'checkpoint', 'work',
+    'commit_interval', 'release_interval', 'complete', 'metrics'
+)
+
+
+def _consume_exception(future: asyncio.Future):
+    # Progress writes are often not awaited; the flush already logged the failure
+    if not future.cancelled():
+        future.exception()
+
+
+class GroupCommitWriter:
+    """
+    Group commit for mining operation, discovery, frontier and metrics writes
+
+    Each method queues one write and returns a future that resolves after
+    the transaction holding it has committed: the stored row for inserts,
+    None for updates. A single task waits a few milliseconds after the
+    first write of a batch, then commits everything queued in one
+    transaction, one pipelined statement per kind of write (COPY for large
+    discovery batches). Operations running concurrently therefore share
+    their transactions instead of autocommitting every statement. Callers
+    that only report progress can leave the future unawaited; batches are
+    committed in queue order. Verification frontier claims, commits and
+    releases join the same transactions, locking each frontier row once
+    per batch.
+
+    If a batch fails, its writes are retried one transaction each, so one
+    bad write only fails its own future.
+    """
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        window_ms: float = DEFAULT_GROUP_COMMIT_MS,
+        batch_size: int = DEFAULT_GROUP_COMMIT_BATCH_SIZE
+    ):
+        self.db_manager = db_manager
+        self.window_seconds = max(window_ms, 0.0) / 1000
+        self.batch_size = max(batch_size, 1)
+
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+        self.stats = {'writes': 0, 'transactions': 0, 'failedTransactions': 0, 'largestBatch': 0}
+
+    def start(self):
+        """Start the commit task"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"📦 GROUP COMMIT: Committing writes every {self.window_seconds * 1000:g}ms "
+                        f"(up to {self.batch_size} per transaction)")
+
+    async def stop(self):
+        """Commit everything already queued, then stop the commit task"""
+        if self._task:
+            await self.queue.join()
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def create_mining_operation(
+        self,
+        operation_type: str,
+        miner_id: str,
+        estimated_completion: datetime,
+        difficulty: int,
+        current_result: Dict[str, Any],
+        status: str = 'active',
+        lease_owner: Optional[str] = None,
+        lease_seconds: Optional[float] = None
+    ) -> asyncio.Future:
+        return self._enqueue('create_operation', {
+            'operation_type': operation_type,
+            'miner_id': miner_id,
+            'estimated_completion': estimated_completion,
+            'difficulty': difficulty,
+            'current_result': current_result,
+            'status': status,
+            'lease_owner': lease_owner,
+            'lease_seconds': lease_seconds
+        })
+
+    def activate_mining_operation(self, operation_id: int) -> asyncio.Future:
+        return self._enqueue('activate', operation_id)
+
+    def update_mining_operation(self, operation_id: int, progress: float, current_result: Dict[str, Any]) -> asyncio.Future:
+        return self._enqueue('progress', (operation_id, progress, current_result))
+
+    def save_operation_checkpoint(self, operation_id: int, checkpoint: Dict[str, Any]) -> asyncio.Future:
+        return self._enqueue('checkpoint', (operation_id, checkpoint))
+
+    def create_mathematical_work(
+        self,
+        work_type: str,
+        difficulty: int,
+        result: Dict[str, Any],
+        verification_data: Dict[str, Any],
+        computational_cost: float,
+        energy_efficiency: float,
+        scientific_value: float,
+        worker_id: str,
+        signature: str,
+        range_start: Optional[int] = None,
+        range_end: Optional[int] = None
+    ) -> asyncio.Future:
+        return self._enqueue('work', {
+            'work_type': work_type,
+            'difficulty': difficulty,
+            'result': result,
+            'verification_data': verification_data,
+            'computational_cost': computational_cost,
+            'energy_efficiency': energy_efficiency,
+            'scientific_value': scientific_value,
+            'worker_id': worker_id,
+            'signature': signature,
+            'range_start': range_start,
+            'range_end': range_end
+        })
+
+    def claim_verification_interval(
+        self, work_type: str, origin: int, span: int, operation_id: Optional[int] = None
+    ) -> asyncio.Future:
+        """Resolves to the claimed (start, end) interval"""
+        return self._enqueue('claim_interval', (work_type, origin, span, operation_id))
+
+    def commit_verification_interval(
+        self, work_type: str, origin: int, start: int, covered_end: int, claimed_end: int,
+        operation_id: Optional[int] = None
+    ) -> asyncio.Future:
+        return self._enqueue('commit_interval', (work_type, origin, start, covered_end, claimed_end, operation_id))
+
+    def release_verification_interval(
+        self, work_type: str, origin: int, start: int, end: int, operation_id: Optional[int] = None
+    ) -> asyncio.Future:
+        return self._enqueue('release_interval', (work_type, origin, start, end, operation_id))
+
+    def complete_mining_operation(self, operation_id: int, status: str = 'completed') -> asyncio.Future:
+        return self._enqueue('complete', (operation_id, status))
+
+    def create_network_metrics(
+        self,
+        active_miners: int,
+        blocks_per_hour: float,
+        energy_efficiency: float,
+        scientific_value_generated: float,
+        average_block_time: float,
+        network_hashrate: float,
+        total_knowledge_created: int,
+        discoveries_per_hour: int = 0
+    ) -> asyncio.Future:
+        return self._enqueue('metrics', {
+            'active_miners': active_miners,
+            'blocks_per_hour': blocks_per_hour,
+            'energy_efficiency': energy_efficiency,
+            'scientific_value_generated': scientific_value_generated,
+            'average_block_time': average_block_time,
+            'network_hashrate': network_hashrate,
+            'total_knowledge_created': total_knowledge_created,
+            'discoveries_per_hour': discoveries_per_hour
+        })
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get write and transaction counters"""
+        transactions = self.stats['transactions']
+        return {
+            **self.stats,
+            'queued': self.queue.qsize(),
+            'writesPerTransaction': self.stats['writes'] / transactions if transactions else 0.0
+        }
+
+    def _enqueue(self, stage: str, payload: Any) -> asyncio.Future:
+        if self._task is None:
+            raise RuntimeError("Group commit writer is not running")
+
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(_consume_exception)
+        self.queue.put_nowait((stage, payload, future))
+        return future
+
+    async def _run(self):
+        """Collect writes for the commit window, then commit them as one batch"""
+        while True:
+            batch = [await self.queue.get()]
+            await asyncio.sleep(self.window_seconds)
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            try:
+                await self._flush(batch)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+    async def _flush(self, batch: List[Tuple[str, Any, asyncio.Future]]):
+        """Commit a batch and resolve its futures, falling back to one transaction per write"""
+        try:
+            results = await self._commit(batch)
+        except Exception as e:
+            self.stats['failedTransactions'] += 1
+            if len(batch) == 1:
+                logger.error(f"❌ GROUP COMMIT: {batch[0][0]} write failed: {e}")
+                if not batch[0][2].done():
+                    batch[0][2].set_exception(e)
+                return
+            logger.warning(f"⚠️ GROUP COMMIT: Batch of {len(batch)} writes failed ({e}), retrying them one by one")
+            for write in batch:
+                await self._flush([write])
+            return
+
+        self.stats['writes'] += len(batch)
+        self.stats['transactions'] += 1
+        self.stats['largestBatch'] = max(self.stats['largestBatch'], len(batch))
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _commit(self, batch: List[Tuple[str, Any, asyncio.Future]]) -> List[Any]:
+        """Write a batch in one transaction; returns each write's result in batch order"""
+        positions: Dict[str, List[int]] = {stage: [] for stage in WRITE_STAGES}
+        for position, (stage, _, _) in enumerate(batch):
+            positions[stage].append(position)
+
+        results: List[Any] = [None] * len(batch)
+        async with self.db_manager.transaction():
+            for stage in WRITE_STAGES:
+                if not positions[stage]:
+                    continue
+                stored = await self._write_stage(stage, [batch[position][1] for position in positions[stage]])
+                if stored is not None:
+                    for position, row in zip(positions[stage], stored):
+                        results[position] = row
+        return results
+
+    async def _write_stage(self, stage: str, payloads: List[Any]) -> Optional[List[Dict[str, Any]]]:
+        """Write one kind of write with a single batched call; returns the stored rows for inserts"""
+        if stage == 'create_operation':
+            return await self.db_manager.create_mining_operation_batch(payloads)
+        if stage == 'work':
+            return await self.db_manager.create_mathematical_work_batch(payloads)
+        if stage == 'metrics':
+            return await self.db_manager.create_network_metrics_batch(payloads)
+        if stage == 'claim_interval':
+            return await self.db_manager.claim_verification_interval_batch(payloads)
+
+        # Of several writes to one operation in a batch only the last one matters
+        if stage == 'activate':
+            await self.db_manager.activate_mining_operation_batch(sorted(set(payloads)))
+        elif stage == 'progress':
+            latest = {operation_id: (progress, result) for operation_id, progress, result in payloads}
+            await self.db_manager.update_mining_operation_batch(
+                [(operation_id, progress, result) for operation_id, (progress, result) in latest.items()]
+            )
+        elif stage == 'checkpoint':
+            await self.db_manager.save_operation_checkpoint_batch(list(dict(payloads).items()))
+        elif stage == 'commit_interval':
+            await self.db_manager.commit_verification_interval_batch(payloads)
+        elif stage == 'release_interval':
+            await self.db_manager.release_verification_interval_batch(payloads)
+        elif stage == 'complete':
+            await self.db_manager.complete_mining_operation_batch(list(dict(payloads).items()))
+        return None
@@ -5,11 +5,13 @@ Phase 1 Implementation: Progressive transition to real mathematical computation
 
 import logging
 import random
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
+from deadline import ComputationCancelled, Deadline
 from mathematical_engines import MathematicalEngines
 from real_mathematical_engines import RealMathematicalEngines
 from scientific_valuation import ScientificValuationEngine
+from verification_frontier import FRONTIER_ORIGINS
 
 logger = logging.getLogger(__name__)
 
@@ -34,10 +36,10 @@ class HybridMathematicalSystem:
         
         # Tractability thresholds for real computation
         self.tractability_thresholds = {
-            'goldbach_verification': 200,    # Up to difficulty 200
-            'prime_gap_analysis': 150,       # Up to difficulty 150  
+            'goldbach_verification': 1000,   # Up to difficulty 1000 (minimal-partition verifier)
+            'prime_gap_analysis': 1000,      # Up to difficulty 1000 (vectorized sieve)
             'fibonacci_patterns': 300,       # Up to difficulty 300
-            'collatz_verification': 100      # Up to difficulty 100
+            'collatz_verification': 1000     # Up to difficulty 1000 (2^k residue sieve)
         }
         
         logger.info("🔀 HYBRID SYSTEM: Initialized with real + simulated computation")
@@ -60,9 +62,28 @@ class HybridMathematicalSystem:
         # For lower difficulties, use real computation
         return 'real'
     
-    def compute_mathematical_work(self, work_type: str, difficulty: int) -> Dict[str, Any]:
+    def get_frontier_spec(self, work_type: str, difficulty: int) -> Optional[Tuple[int, int]]:
+        """
+        Return (origin, span) when this operation should verify the next frontier interval
+        Only real computations of resumable work types extend a frontier
+        """
+        if work_type not in FRONTIER_ORIGINS or self.determine_computation_mode(work_type, difficulty) != 'real':
+            return None
+        
+        return FRONTIER_ORIGINS[work_type], self.real_engine.get_frontier_span(work_type, difficulty)
+    
+    def supports_checkpoints(self, work_type: str, difficulty: int) -> bool:
+        """Whether this operation runs in time-boxed chunks that each return a resumable checkpoint"""
+        return (self.determine_computation_mode(work_type, difficulty) == 'real'
+                and self.real_engine.supports_checkpoints(work_type))
+    
+    def compute_mathematical_work(
+        self, work_type: str, difficulty: int, deadline: Optional[Deadline] = None, **options
+    ) -> Dict[str, Any]:
         """
         Main computation router - chooses between real and simulated computation
+        Options (e.g. a frontier interval) are passed to real engines only; the
+        deadline reaches both and a stopped computation is never retried in simulation
         """
         
         computation_mode = self.determine_computation_mode(work_type, difficulty)
@@ -72,7 +93,7 @@ class HybridMathematicalSystem:
         try:
             if computation_mode == 'real':
                 # Use real mathematical computation
-                result = self.real_engine.compute_real_mathematics(work_type, difficulty)
+                result = self.real_engine.compute_real_mathematics(work_type, difficulty, deadline, **options)
                 result['computationMode'] = 'real'
                 result['verified'] = True
                 
@@ -87,7 +108,7 @@ class HybridMathematicalSystem:
                 
             else:
                 # Fall back to simulation for intractable problems
-                result = self.simulation_engine.compute_mathematical_work(work_type, difficulty)
+                result = self.simulation_engine.compute_mathematical_work(work_type, difficulty, deadline)
                 result['computationMode'] = 'simulation'
                 result['verified'] = False  # Mark as simulated
                 
@@ -111,10 +132,13 @@ class HybridMathematicalSystem:
             
             return result
             
+        except ComputationCancelled:
+            logger.info(f"⏹️ HYBRID COMPUTATION: {work_type} stopped by its deadline")
+            raise
         except Exception as e:
             logger.error(f"❌ HYBRID COMPUTATION: Error in {work_type}: {e}")
-            # Fallback to simulation on any error
-            result = self.simulation_engine.compute_mathematical_work(work_type, difficulty)
+            # Fallback to simulation on any error, still under the operation's deadline
+            result = self.simulation_engine.compute_mathematical_work(work_type, difficulty, deadline)
             result['computationMode'] = 'simulation_fallback'
             result['error'] = str(e)
             return result
@@ -134,6 +158,7 @@ class HybridMathematicalSystem:
             'totalWorkTypes': len(set(real_types + simulated_types)),
             'realComputationRatio': len(real_types) / len(simulated_types),
             'hybridSystemVersion': '1.0',
+            'primeTable': self.real_engine.prime_table.get_stats(),
             'capabilities': {
                 'realMathematics': True,
                 'simulatedComputation': True,
@@ -142,7 +167,7 @@ class HybridMathematicalSystem:
             }
         }
     
-    def verify_mathematical_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+    def verify_mathematical_result(self, result: Dict[str, Any], deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """
         Verify mathematical results using independent computation
         Implements peer verification for blockchain consensus
@@ -157,7 +182,7 @@ class HybridMathematicalSystem:
         
         try:
             # Re-compute using same or different method
-            verification_result = self.compute_mathematical_work(work_type, difficulty)
+            verification_result = self.compute_mathematical_work(work_type, difficulty, deadline)
             
             # Compare results based on computation mode
             if original_mode == 'real' and verification_result.get('computationMode') == 'real':
@@ -175,6 +200,8 @@ class HybridMathematicalSystem:
                 'timestamp': datetime.now().isoformat()
             }
             
+        except ComputationCancelled:
+            raise
         except Exception as e:
             logger.error(f"❌ VERIFICATION: Error verifying {work_type}: {e}")
             return {'verified': False, 'reason': f'Verification error: {e}'}
@@ -0,0 +1,179 @@
+"""
+Leader Election - Python Implementation
+Picks the one process that runs the background fleet when several serve the API
+"""
+
+import asyncio
+import logging
+import os
+import tempfile
+from typing import Awaitable, Callable, Optional
+
+import asyncpg
+
+try:
+    import fcntl
+except ImportError:  # Windows: only the PostgreSQL advisory lock is available
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Advisory lock key shared by every process of one deployment
+LEADER_LOCK_KEY = int(os.getenv("LEADER_LOCK_KEY", "7264001"))
+
+# Lock file used when the database is not PostgreSQL
+LEADER_LOCK_FILE = os.getenv("LEADER_LOCK_FILE", os.path.join(tempfile.gettempdir(), "productive-mining-leader.lock"))
+
+# How often followers try to take over and the leader checks it still holds the lock
+LEADER_CHECK_SECONDS = float(os.getenv("LEADER_CHECK_SECONDS", "5"))
+
+
+class PostgresAdvisoryLock:
+    """
+    Session-level pg_try_advisory_lock on a dedicated connection
+
+    The lock lives as long as the connection, so when the leader process
+    dies, or its connection drops, PostgreSQL releases it and a follower's
+    next attempt succeeds.
+    """
+
+    def __init__(self, database_url: str, key: int = LEADER_LOCK_KEY):
+        self.database_url = database_url
+        self.key = key
+        self.connection: Optional[asyncpg.Connection] = None
+
+    @property
+    def description(self) -> str:
+        return f"advisory lock {self.key}"
+
+    async def acquire(self) -> bool:
+        if self.connection is None or self.connection.is_closed():
+            self.connection = await asyncpg.connect(self.database_url)
+        return await self.connection.fetchval("SELECT pg_try_advisory_lock($1)", self.key)
+
+    async def held(self) -> bool:
+        """Whether the session holding the lock is still alive"""
+        try:
+            await asyncio.wait_for(self.connection.fetchval("SELECT 1"), LEADER_CHECK_SECONDS)
+            return True
+        except Exception as e:
+            logger.error(f"❌ LEADER: Lost the lock connection: {e}")
+            await self._close()
+            return False
+
+    async def release(self):
+        if self.connection is not None and not self.connection.is_closed():
+            try:
+                await self.connection.execute("SELECT pg_advisory_unlock($1)", self.key)
+            except Exception as e:
+                logger.error(f"❌ LEADER: Error releasing advisory lock: {e}")
+        await self._close()
+
+    async def _close(self):
+        if self.connection is not None:
+            self.connection.terminate()
+            self.connection = None
+
+
+class FileLock:
+    """Exclusive flock on a local file, released by the OS when the holding process exits"""
+
+    def __init__(self, path: str = LEADER_LOCK_FILE):
+        if fcntl is None:
+            raise RuntimeError("Leader election without PostgreSQL needs fcntl; set DATABASE_URL to a postgres:// URL")
+        self.path = path
+        self.handle = None
+
+    @property
+    def description(self) -> str:
+        return f"lock file {self.path}"
+
+    async def acquire(self) -> bool:
+        handle = open(self.path, 'a')
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            handle.close()
+            return False
+        self.handle = handle
+        return True
+
+    async def held(self) -> bool:
+        return self.handle is not None
+
+    async def release(self):
+        if self.handle is not None:
+            fcntl.flock(self.handle, fcntl.LOCK_UN)
+            self.handle.close()
+            self.handle = None
+
+
+class LeaderElection:
+    """
+    Runs on_elected in exactly one process and on_demoted when it stops being leader
+
+    Every process (e.g. each uvicorn worker) polls for the lock; the one that
+    gets it starts the background fleet, the rest only serve API and
+    WebSocket traffic. The leader re-checks its lock on the same interval and
+    steps down if it is gone, so failover takes at most LEADER_CHECK_SECONDS
+    after the leader's lock is released.
+    """
+
+    def __init__(self, database_url: Optional[str] = None, check_seconds: float = LEADER_CHECK_SECONDS):
+        database_url = database_url or os.getenv("DATABASE_URL", "")
+        if database_url.startswith(('postgres://', 'postgresql://')):
+            self.lock = PostgresAdvisoryLock(database_url)
+        else:
+            self.lock = FileLock()
+        self.check_seconds = check_seconds
+
+        self.is_leader = False
+        self.on_elected: Optional[Callable[[], Awaitable[None]]] = None
+        self.on_demoted: Optional[Callable[[], Awaitable[None]]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start campaigning in the background"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(f"🗳️ LEADER: Process {os.getpid()} campaigning via {self.lock.description}")
+
+    async def stop(self):
+        """Stop campaigning, step down if leading and release the lock for the next process"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._step_down()
+        await self.lock.release()
+
+    def get_status(self) -> dict:
+        return {'pid': os.getpid(), 'isLeader': self.is_leader, 'lock': self.lock.description}
+
+    async def _run(self):
+        while True:
+            try:
+                if not self.is_leader:
+                    if await self.lock.acquire():
+                        self.is_leader = True
+                        logger.info(f"👑 LEADER: Process {os.getpid()} elected, starting background fleet")
+                        if self.on_elected:
+                            await self.on_elected()
+                elif not await self.lock.held():
+                    await self._step_down()
+            except Exception as e:
+                logger.error(f"❌ LEADER: Election error: {e}")
+                await self._step_down()
+                await self.lock.release()
+            await asyncio.sleep(self.check_seconds)
+
+    async def _step_down(self):
+        if not self.is_leader:
+            return
+        self.is_leader = False
+        logger.warning(f"🗳️ LEADER: Process {os.getpid()} stepped down, stopping background fleet")
+        if self.on_demoted:
+            await self.on_demoted()
@@ -11,10 +11,10 @@ import os
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
 import uvicorn
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, Header, HTTPException, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 from contextlib import asynccontextmanager
 
 from database import DatabaseManager
@@ -22,8 +22,10 @@ from models import *
 from scientific_valuation import ScientificValuationEngine
 from mathematical_engines import MathematicalEngines
 from hybrid_mathematical_system import HybridMathematicalSystem
-from mining_operations import MiningOperationManager
+from compute_executor import DEFAULT_COMPUTE_WORKERS, DEFAULT_FOLLOWER_COMPUTE_WORKERS, ComputeExecutor
+from mining_operations import MiningOperationManager, MiningQueueFullError
 from adaptive_security import AdaptiveSecurityEngine
+from leader_election import LeaderElection
 from recursive_enhancement import RecursiveEnhancementEngine
 from websocket_manager import WebSocketManager
 
@@ -38,14 +40,41 @@ mining_manager: MiningOperationManager = None
 valuation_engine: ScientificValuationEngine = None
 math_engines: MathematicalEngines = None
 hybrid_system: HybridMathematicalSystem = None
+compute_executor: ComputeExecutor = None
 adaptive_security: AdaptiveSecurityEngine = None
 recursive_enhancement: RecursiveEnhancementEngine = None
+leader_election: LeaderElection = None
+fleet_tasks: List[asyncio.Task] = []
+
+async def start_background_fleet():
+    """Start the autonomous miners, enhancement and security cycles (leader process only)"""
+    # Only the leader runs the fleet and remote workers, so only it keeps a full-size process pool
+    mining_manager.resize_compute_pool(DEFAULT_COMPUTE_WORKERS)
+    asyncio.create_task(compute_executor.prewarm())
+    fleet_tasks[:] = [
+        asyncio.create_task(recursive_enhancement.start_enhancement_cycle()),
+        asyncio.create_task(adaptive_security.start_security_cycle())
+    ]
+    await mining_manager.start_autonomous_mining()
+
+async def stop_background_fleet():
+    """Stop the background fleet when this process loses leadership or shuts down"""
+    # Remote workers follow the leader; jobs this process had handed out are computed locally instead
+    mining_manager.worker_dispatcher.withdraw()
+    await mining_manager.stop_autonomous_mining()
+    await recursive_enhancement.stop_enhancement_cycle()
+    await adaptive_security.stop_security_cycle()
+    # The cycles only update in-memory state between sleeps, so they can be cancelled outright
+    for task in fleet_tasks:
+        task.cancel()
+    fleet_tasks.clear()
+    mining_manager.resize_compute_pool(DEFAULT_FOLLOWER_COMPUTE_WORKERS)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize and cleanup resources"""
     global db_manager, ws_manager, mining_manager, valuation_engine, math_engines
-    global hybrid_system, adaptive_security, recursive_enhancement
+    global hybrid_system, compute_executor, adaptive_security, recursive_enhancement, leader_election
     
     # Initialize components
     logger.info("🐍 PYTHON BACKEND: Initializing productive mining platform...")
@@ -57,15 +86,30 @@ async def lifespan(app: FastAPI):
     valuation_engine = ScientificValuationEngine()
     math_engines = MathematicalEngines()
     hybrid_system = HybridMathematicalSystem()
-    mining_manager = MiningOperationManager(db_manager, ws_manager, valuation_engine, math_engines)
+    # Every process starts with a follower-size pool; winning the election grows it
+    compute_executor = ComputeExecutor(hybrid_system, workers=DEFAULT_FOLLOWER_COMPUTE_WORKERS)
+    mining_manager = MiningOperationManager(db_manager, ws_manager, valuation_engine, hybrid_system, compute_executor)
     adaptive_security = AdaptiveSecurityEngine()
     recursive_enhancement = RecursiveEnhancementEngine()
     
     # Start background tasks
     logger.info("🔬 ENGINES: Starting quantum enhancement and adaptive security...")
-    asyncio.create_task(recursive_enhancement.start_enhancement_cycle())
-    asyncio.create_task(adaptive_security.start_security_cycle())
-    asyncio.create_task(mining_manager.start_autonomous_mining())
+    asyncio.create_task(compute_executor.prewarm())
+    mining_manager.group_commit.start()
+    await mining_manager.chain_writer.start()
+    await mining_manager.block_assembler.start()
+    mining_manager.worker_dispatcher.start()
+    await mining_manager.seed_network_metrics()
+    
+    # Re-queue (or fail) operations orphaned by a previous process before taking new work
+    await mining_manager.recover_orphaned_operations()
+    mining_manager.start_lease_heartbeat()
+    
+    # With several uvicorn workers only the elected leader runs the background fleet
+    leader_election = LeaderElection(db_manager.database_url)
+    leader_election.on_elected = start_background_fleet
+    leader_election.on_demoted = stop_background_fleet
+    leader_election.start()
     
     logger.info("✅ PYTHON BACKEND: Productive mining platform initialized")
     
@@ -73,6 +117,15 @@ async def lifespan(app: FastAPI):
     
     # Cleanup
     logger.info("🛑 PYTHON BACKEND: Shutting down...")
+    await leader_election.stop()
+    # Running operations write through the group commit writer, so they finish before it stops
+    await mining_manager.drain_operations()
+    await mining_manager.stop_lease_heartbeat()
+    await mining_manager.worker_dispatcher.stop()
+    await mining_manager.block_assembler.stop()
+    await mining_manager.chain_writer.stop()
+    await mining_manager.group_commit.stop()
+    compute_executor.shutdown()
     await db_manager.cleanup()
 
 # Initialize FastAPI app
@@ -94,16 +147,38 @@ app.add_middleware(
 
 # ===== BLOCKCHAIN ENDPOINTS =====
 
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Split a fields= query parameter into column names"""
+    if not fields:
+        return None
+    return [field.strip() for field in fields.split(',') if field.strip()]
+
 @app.get("/api/blocks")
-async def get_blocks(limit: int = 100):
-    """Get blockchain blocks"""
+async def get_blocks(
+    limit: int = 100,
+    before_index: Optional[int] = None,
+    after_index: Optional[int] = None,
+    fields: Optional[str] = None
+):
+    """Get a page of blocks, newest first; page with before_index (older) or after_index (forwards)"""
     try:
-        blocks = await db_manager.get_blocks(limit)
+        blocks = await db_manager.get_blocks(limit, before_index, after_index, _parse_fields(fields))
         return blocks
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching blocks: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch blocks")
 
+@app.get("/api/blocks/assembler")
+async def get_block_assembler():
+    """Get pending discoveries, block sealing counters and the chain writer's tip"""
+    try:
+        return mining_manager.block_assembler.get_stats()
+    except Exception as e:
+        logger.error(f"Error fetching block assembler stats: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch block assembler stats")
+
 @app.get("/api/blocks/{block_id}")
 async def get_block(block_id: int):
     """Get specific block"""
@@ -117,11 +192,18 @@ async def get_block(block_id: int):
         raise HTTPException(status_code=500, detail="Failed to fetch block")
 
 @app.get("/api/discoveries")
-async def get_discoveries(limit: int = 1000):
-    """Get mathematical discoveries"""
+async def get_discoveries(
+    limit: int = 1000,
+    before_id: Optional[int] = None,
+    after_id: Optional[int] = None,
+    fields: Optional[str] = None
+):
+    """Get a page of discoveries, newest first; result and verification_data only when listed in fields"""
     try:
-        discoveries = await db_manager.get_mathematical_work(limit)
+        discoveries = await db_manager.get_mathematical_work(limit, before_id, after_id, _parse_fields(fields))
         return discoveries
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error fetching discoveries: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch discoveries")
@@ -138,6 +220,20 @@ async def get_discovery(discovery_id: int):
         logger.error(f"Error fetching discovery {discovery_id}: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch discovery")
 
+@app.get("/api/discoveries/{discovery_id}/proof", response_model=DiscoveryInclusionProof)
+async def get_discovery_proof(discovery_id: int):
+    """Get the Merkle inclusion proof of a discovery in its block"""
+    try:
+        proof = await mining_manager.block_assembler.get_inclusion_proof(discovery_id)
+        if not proof:
+            raise HTTPException(status_code=404, detail="Discovery not found or not yet sealed into a block")
+        return proof
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error building proof for discovery {discovery_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to build inclusion proof")
+
 # ===== MINING OPERATIONS =====
 
 @app.get("/api/mining/operations")
@@ -150,19 +246,137 @@ async def get_mining_operations():
         logger.error(f"Error fetching mining operations: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch mining operations")
 
+@app.delete("/api/mining/operations/{operation_id}")
+async def cancel_mining_operation(operation_id: int):
+    """Cancel a queued or running mining operation, freeing its worker"""
+    try:
+        status = await mining_manager.cancel_mining_operation(operation_id)
+        if not status:
+            raise HTTPException(status_code=404, detail="Operation not found or already finished")
+        return {'id': operation_id, 'status': status}
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error cancelling mining operation {operation_id}: {e}")
+        raise HTTPException(status_code=500, detail="Failed to cancel mining operation")
+
 @app.post("/api/mining/start-real")
 async def start_mining_operation(request: MiningRequest):
-    """Start a new mining operation"""
+    """Start a new mining operation; 429 with Retry-After when overloaded, or 202 if deferred"""
     try:
         operation = await mining_manager.start_mining_operation(
             work_type=request.workType,
-            difficulty=request.difficulty
+            difficulty=request.difficulty,
+            defer=request.defer
         )
+        if operation['status'] == 'deferred':
+            return JSONResponse(
+                status_code=202,
+                content=operation,
+                headers={'Retry-After': str(operation['retryAfter'])}
+            )
         return operation
+    except MiningQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={'Retry-After': str(e.retry_after)})
     except Exception as e:
         logger.error(f"Error starting mining operation: {e}")
         raise HTTPException(status_code=500, detail="Failed to start mining operation")
 
+@app.get("/api/mining/scheduler")
+async def get_mining_scheduler():
+    """Get mining queue depth, slot usage and wait/run times"""
+    try:
+        return mining_manager.get_scheduler_stats()
+    except Exception as e:
+        logger.error(f"Error fetching scheduler stats: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch scheduler stats")
+
+@app.get("/api/mining/writes")
+async def get_mining_writes():
+    """Get group commit counters: writes, transactions and writes per transaction"""
+    try:
+        return mining_manager.group_commit.get_stats()
+    except Exception as e:
+        logger.error(f"Error fetching group commit stats: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch group commit stats")
+
+@app.get("/api/verification/frontiers", response_model=List[VerificationFrontier])
+async def get_verification_frontiers():
+    """Get how far each resumable conjecture has been verified"""
+    try:
+        frontiers = await db_manager.get_verification_frontiers()
+        return frontiers
+    except Exception as e:
+        logger.error(f"Error fetching verification frontiers: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch verification frontiers")
+
+@app.get("/api/cluster/leader")
+async def get_leader_status():
+    """Whether this process is the one running the autonomous fleet"""
+    return leader_election.get_status()
+
+# ===== REMOTE WORKERS =====
+# The dispatcher keeps jobs and leases in memory, so only the leader serves these routes.
+# Followers answer 503 and compute workers retry until a request reaches the leader.
+# Workers authenticate with the shared WORKER_TOKEN in X-Worker-Token.
+
+def _require_leader():
+    if not leader_election or not leader_election.is_leader:
+        raise HTTPException(status_code=503, detail="Not the coordinating leader", headers={'Retry-After': '1'})
+
+def _require_worker(token: Optional[str]):
+    if not mining_manager.worker_dispatcher.authorize(token):
+        raise HTTPException(status_code=403, detail="Missing or wrong worker token (remote workers need WORKER_TOKEN)")
+    _require_leader()
+
+@app.post("/api/workers/lease")
+async def lease_worker_job(request: WorkerLeaseRequest, x_worker_token: Optional[str] = Header(default=None)):
+    """Long-poll for the next computation; 204 if none arrived within waitSeconds"""
+    _require_worker(x_worker_token)
+    try:
+        job = await mining_manager.worker_dispatcher.lease(
+            request.workerId, request.name, request.slots, request.waitSeconds
+        )
+        if job is None:
+            return Response(status_code=204)
+        return job
+    except Exception as e:
+        logger.error(f"Error leasing worker job: {e}")
+        raise HTTPException(status_code=500, detail="Failed to lease job")
+
+@app.post("/api/workers/jobs/{job_id}/heartbeat")
+async def renew_worker_job(job_id: str, request: WorkerHeartbeat, x_worker_token: Optional[str] = Header(default=None)):
+    """Renew a job lease; 409 if the worker no longer holds it. The reply tells the worker whether to stop."""
+    _require_worker(x_worker_token)
+    reply = mining_manager.worker_dispatcher.heartbeat(request.workerId, job_id)
+    if reply is None:
+        raise HTTPException(status_code=409, detail="Lease expired or held by another worker")
+    return reply
+
+@app.post("/api/workers/jobs/{job_id}/result")
+async def complete_worker_job(job_id: str, request: WorkerJobResult, x_worker_token: Optional[str] = Header(default=None)):
+    """Deliver a job's engine result (or error); 409 if the job was already dispatched elsewhere, 422 if it is invalid"""
+    _require_worker(x_worker_token)
+    try:
+        accepted = mining_manager.worker_dispatcher.complete(
+            request.workerId, job_id, request.result, request.error, request.stopped
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=f"Result rejected: {e}")
+    if not accepted:
+        raise HTTPException(status_code=409, detail="Lease expired or held by another worker")
+    return {'jobId': job_id, 'accepted': True}
+
+@app.get("/api/workers")
+async def get_workers():
+    """Get connected remote workers, leased jobs and dispatch counters"""
+    _require_leader()
+    try:
+        return mining_manager.worker_dispatcher.get_stats()
+    except Exception as e:
+        logger.error(f"Error fetching worker stats: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch worker stats")
+
 # ===== NETWORK METRICS =====
 
 @app.get("/api/metrics")
@@ -189,7 +403,7 @@ async def test_hybrid_system():
         # Test each real computation type
         for work_type in ['goldbach_verification', 'prime_gap_analysis', 'fibonacci_patterns', 'collatz_verification']:
             # Test with low difficulty (should use real computation)
-            real_result = hybrid_system.compute_mathematical_work(work_type, 5)
+            real_result = await compute_executor.compute(work_type, 5)
             real_computation_tests.append({
                 'workType': work_type,
                 'difficulty': 5,
@@ -202,24 +416,26 @@ async def test_hybrid_system():
                 }
             })
             
-            # Test with high difficulty (should fall back to simulation)
-            sim_result = hybrid_system.compute_mathematical_work(work_type, 300)
+            # Test just above the real-computation limit (should fall back to simulation)
+            fallback_difficulty = hybrid_system.tractability_thresholds[work_type] + 1
+            sim_result = await compute_executor.compute(work_type, fallback_difficulty)
             real_computation_tests.append({
                 'workType': work_type,
-                'difficulty': 300,
+                'difficulty': fallback_difficulty,
                 'mode': sim_result.get('computationMode'),
                 'scientificValue': sim_result.get('scientificValue'),
                 'computationTime': sim_result.get('computationTime'),
                 'verified': sim_result.get('verified'),
-                'fallback': True
+                'fallback': sim_result.get('computationMode') != 'real'
             })
         
         # Test system capabilities
         capabilities = hybrid_system.get_system_capabilities()
+        capabilities['computeExecutor'] = compute_executor.get_stats()
         
         # Test verification system
-        sample_result = hybrid_system.compute_mathematical_work('goldbach_verification', 10)
-        verification = hybrid_system.verify_mathematical_result(sample_result)
+        sample_result = await compute_executor.compute('goldbach_verification', 10)
+        verification = await compute_executor.verify(sample_result)
         
         return {
             'hybridSystemStatus': 'operational',
@@ -253,7 +469,7 @@ async def test_real_mathematics():
         
         # Test each real computation at low difficulty
         for work_type in ['goldbach_verification', 'prime_gap_analysis', 'fibonacci_patterns', 'collatz_verification']:
-            result = hybrid_system.real_engine.compute_real_mathematics(work_type, 3)
+            result = await compute_executor.compute_real(work_type, 3)
             
             real_results.append({
                 'workType': work_type,
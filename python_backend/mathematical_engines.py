@@ -8,10 +8,12 @@ import random
 import math
 import hashlib
 import time
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Optional, Tuple
 import numpy as np
 from datetime import datetime
 
+from deadline import ComputationCancelled, Deadline
+
 logger = logging.getLogger(__name__)
 
 class MathematicalEngines:
@@ -23,7 +25,7 @@ class MathematicalEngines:
     def __init__(self):
         logger.info("🧮 MATHEMATICAL ENGINES: Initializing computation algorithms...")
     
-    def compute_riemann_zero(self, difficulty: int) -> Dict[str, Any]:
+    def compute_riemann_zero(self, difficulty: int, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """Compute zeros of the Riemann zeta function"""
         try:
             # Scale iterations based on difficulty
@@ -35,7 +37,7 @@ class MathematicalEngines:
             
             # Simulate computation time based on difficulty
             computation_time = max(1, difficulty / 50.0)
-            time.sleep(min(computation_time, 0.5))  # Cap actual sleep
+            self._simulate_delay(min(computation_time, 0.5), deadline)  # Cap actual sleep
             
             # Calculate precision based on iterations
             precision = math.log10(iterations) * random.uniform(0.8, 1.2)
@@ -69,11 +71,13 @@ class MathematicalEngines:
                 'energyConsumed': computation_time * 0.05  # kWh
             }
             
+        except ComputationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Error in Riemann zero computation: {e}")
             raise
     
-    def compute_prime_pattern(self, difficulty: int) -> Dict[str, Any]:
+    def compute_prime_pattern(self, difficulty: int, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """Discover prime number patterns"""
         try:
             # Scale search range based on difficulty
@@ -81,7 +85,7 @@ class MathematicalEngines:
             search_end = search_start + (difficulty * 500)
             
             computation_time = max(1, difficulty / 60.0)
-            time.sleep(min(computation_time, 0.3))
+            self._simulate_delay(min(computation_time, 0.3), deadline)
             
             # Simulate finding twin primes
             patterns_found = max(1, difficulty // 5)
@@ -111,16 +115,18 @@ class MathematicalEngines:
                 'energyConsumed': computation_time * 0.06
             }
             
+        except ComputationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Error in prime pattern computation: {e}")
             raise
     
-    def compute_yang_mills(self, difficulty: int) -> Dict[str, Any]:
+    def compute_yang_mills(self, difficulty: int, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """Validate Yang-Mills field equations"""
         try:
             field_samples = difficulty * 100
             computation_time = max(2, difficulty / 40.0)
-            time.sleep(min(computation_time, 0.4))
+            self._simulate_delay(min(computation_time, 0.4), deadline)
             
             result = {
                 'fieldSamples': field_samples,
@@ -147,16 +153,18 @@ class MathematicalEngines:
                 'energyConsumed': computation_time * 0.08
             }
             
+        except ComputationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Error in Yang-Mills computation: {e}")
             raise
     
-    def compute_navier_stokes(self, difficulty: int) -> Dict[str, Any]:
+    def compute_navier_stokes(self, difficulty: int, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """Solve Navier-Stokes fluid dynamics equations"""
         try:
             grid_resolution = difficulty * 50
             computation_time = max(1.5, difficulty / 45.0)
-            time.sleep(min(computation_time, 0.35))
+            self._simulate_delay(min(computation_time, 0.35), deadline)
             
             result = {
                 'gridResolution': grid_resolution,
@@ -183,16 +191,18 @@ class MathematicalEngines:
                 'energyConsumed': computation_time * 0.07
             }
             
+        except ComputationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Error in Navier-Stokes computation: {e}")
             raise
     
-    def compute_goldbach_verification(self, difficulty: int) -> Dict[str, Any]:
+    def compute_goldbach_verification(self, difficulty: int, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """Verify Goldbach conjecture instances"""
         try:
             test_range = difficulty * 2000
             computation_time = max(0.8, difficulty / 70.0)
-            time.sleep(min(computation_time, 0.25))
+            self._simulate_delay(min(computation_time, 0.25), deadline)
             
             result = {
                 'testRange': test_range,
@@ -218,16 +228,18 @@ class MathematicalEngines:
                 'energyConsumed': computation_time * 0.05
             }
             
+        except ComputationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Error in Goldbach verification: {e}")
             raise
     
-    def compute_birch_swinnerton_dyer(self, difficulty: int) -> Dict[str, Any]:
+    def compute_birch_swinnerton_dyer(self, difficulty: int, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """Compute elliptic curve L-functions"""
         try:
             curve_points = difficulty * 200
             computation_time = max(1.2, difficulty / 50.0)
-            time.sleep(min(computation_time, 0.4))
+            self._simulate_delay(min(computation_time, 0.4), deadline)
             
             result = {
                 'curvePoints': curve_points,
@@ -254,16 +266,18 @@ class MathematicalEngines:
                 'energyConsumed': computation_time * 0.09
             }
             
+        except ComputationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Error in Birch-Swinnerton-Dyer computation: {e}")
             raise
     
-    def compute_elliptic_curve_crypto(self, difficulty: int) -> Dict[str, Any]:
+    def compute_elliptic_curve_crypto(self, difficulty: int, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """Advance elliptic curve cryptography"""
         try:
             key_length = min(256 + difficulty, 521)  # Cap at P-521
             computation_time = max(1.0, difficulty / 55.0)
-            time.sleep(min(computation_time, 0.35))
+            self._simulate_delay(min(computation_time, 0.35), deadline)
             
             result = {
                 'keyLength': key_length,
@@ -290,16 +304,18 @@ class MathematicalEngines:
                 'energyConsumed': computation_time * 0.06
             }
             
+        except ComputationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Error in elliptic curve crypto computation: {e}")
             raise
     
-    def compute_lattice_crypto(self, difficulty: int) -> Dict[str, Any]:
+    def compute_lattice_crypto(self, difficulty: int, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """Develop lattice-based cryptographic schemes"""
         try:
             lattice_dimension = min(512 + difficulty * 2, 2048)
             computation_time = max(1.5, difficulty / 40.0)
-            time.sleep(min(computation_time, 0.45))
+            self._simulate_delay(min(computation_time, 0.45), deadline)
             
             result = {
                 'latticeDimension': lattice_dimension,
@@ -326,16 +342,18 @@ class MathematicalEngines:
                 'energyConsumed': computation_time * 0.1
             }
             
+        except ComputationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Error in lattice crypto computation: {e}")
             raise
     
-    def compute_poincare_conjecture(self, difficulty: int) -> Dict[str, Any]:
+    def compute_poincare_conjecture(self, difficulty: int, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
         """Topology and geometric analysis"""
         try:
             manifold_complexity = difficulty * 10
             computation_time = max(2.0, difficulty / 35.0)
-            time.sleep(min(computation_time, 0.5))
+            self._simulate_delay(min(computation_time, 0.5), deadline)
             
             result = {
                 'manifoldComplexity': manifold_complexity,
@@ -362,10 +380,19 @@ class MathematicalEngines:
                 'energyConsumed': computation_time * 0.12
             }
             
+        except ComputationCancelled:
+            raise
         except Exception as e:
             logger.error(f"Error in Poincaré conjecture computation: {e}")
             raise
     
+    def _simulate_delay(self, seconds: float, deadline: Optional[Deadline]):
+        """Stand in for computation time, stopping early (and raising) when the deadline expires"""
+        if deadline is None:
+            time.sleep(seconds)
+        elif deadline.sleep(seconds):
+            raise ComputationCancelled(f"Simulated computation stopped: {deadline.reason}")
+    
     def _generate_hash(self, data: str) -> str:
         """Generate verification hash"""
         return hashlib.sha256(data.encode()).hexdigest()[:6]
@@ -384,8 +411,8 @@ class MathematicalEngines:
             'poincare_conjecture'
         ]
     
-    def compute_mathematical_work(self, work_type: str, difficulty: int) -> Dict[str, Any]:
-        """Main entry point for mathematical computation"""
+    def compute_mathematical_work(self, work_type: str, difficulty: int, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+        """Main entry point for mathematical computation; raises ComputationCancelled if the deadline stops it"""
         start_time = time.time()
         
         computation_methods = {
@@ -405,7 +432,7 @@ class MathematicalEngines:
         
         logger.info(f"🔬 COMPUTING: {work_type} at difficulty {difficulty}")
         
-        result = computation_methods[work_type](difficulty)
+        result = computation_methods[work_type](difficulty, deadline)
         
         # Add common metadata
         result['workType'] = work_type
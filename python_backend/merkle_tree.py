@@ -0,0 +1,88 @@
+"""
+Merkle Tree - Python Implementation
+SHA-256 Merkle trees over block discoveries, with inclusion proofs
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Union
+
+# Domain-separation prefixes (as in RFC 6962) so a leaf can never be passed off as an interior node
+LEAF_PREFIX = b'\x00'
+NODE_PREFIX = b'\x01'
+
+# Root of a block without discoveries
+EMPTY_ROOT = hashlib.sha256(b'').hexdigest()
+
+
+def result_digest(result: Union[Dict[str, Any], str]) -> str:
+    """
+    SHA-256 of a discovery result in canonical JSON
+
+    Accepts the dict produced by an engine or the JSON text read back from
+    the database; both canonicalize to the same bytes.
+    """
+    if isinstance(result, str):
+        result = json.loads(result)
+    canonical = json.dumps(result, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def discovery_leaf(signature: str, result: Union[Dict[str, Any], str]) -> str:
+    """Leaf hash committing to a discovery's signature and result digest"""
+    # The digest has a fixed length, so the variable-length signature needs no delimiter
+    payload = LEAF_PREFIX + signature.encode() + bytes.fromhex(result_digest(result))
+    return hashlib.sha256(payload).hexdigest()
+
+
+def _node_hash(left: str, right: str) -> str:
+    return hashlib.sha256(NODE_PREFIX + bytes.fromhex(left) + bytes.fromhex(right)).hexdigest()
+
+
+def merkle_levels(leaves: List[str]) -> List[List[str]]:
+    """
+    Every level of the tree, leaves first and root last
+
+    An odd node at the end of a level is promoted unchanged rather than
+    paired with a copy of itself, so no two leaf lists share a root.
+    """
+    levels = [list(leaves)]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        parents = [_node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            parents.append(level[-1])
+        levels.append(parents)
+    return levels
+
+
+def merkle_root(leaves: List[str]) -> str:
+    """Root hash of the tree over the given leaf hashes"""
+    if not leaves:
+        return EMPTY_ROOT
+    return merkle_levels(leaves)[-1][0]
+
+
+def inclusion_proof(leaves: List[str], index: int) -> List[Dict[str, str]]:
+    """Sibling hashes from leaf `index` up to the root, each tagged with the side it sits on"""
+    if not 0 <= index < len(leaves):
+        raise IndexError(f"Leaf index {index} outside tree of {len(leaves)} leaves")
+
+    proof = []
+    for level in merkle_levels(leaves)[:-1]:
+        sibling = index ^ 1
+        if sibling < len(level):
+            proof.append({'hash': level[sibling], 'position': 'left' if sibling < index else 'right'})
+        index //= 2
+    return proof
+
+
+def verify_inclusion(leaf: str, proof: List[Dict[str, str]], root: str) -> bool:
+    """Check an inclusion proof in O(log n) hashes"""
+    current = leaf
+    for step in proof:
+        if step['position'] == 'left':
+            current = _node_hash(step['hash'], current)
+        else:
+            current = _node_hash(current, step['hash'])
+    return current == root
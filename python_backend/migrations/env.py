@@ -0,0 +1,52 @@
+"""
+Alembic environment for the productive mining database
+Migrations are plain SQL against PostgreSQL; there is no autogenerate metadata
+"""
+
+import os
+
+from alembic import context
+from sqlalchemy import create_engine, pool, text
+
+config = context.config
+
+# Serializes upgrades when several processes start at once (e.g. uvicorn --workers N)
+MIGRATION_LOCK_KEY = 7264002
+
+
+def _database_url() -> str:
+    """URL passed by DatabaseManager (config attribute) or DATABASE_URL for the alembic CLI"""
+    url = config.attributes.get('database_url') or os.getenv("DATABASE_URL")
+    if not url:
+        raise RuntimeError("DATABASE_URL environment variable is required")
+    # SQLAlchemy only accepts the postgresql:// spelling of the scheme
+    if url.startswith('postgres://'):
+        url = 'postgresql://' + url[len('postgres://'):]
+    return url
+
+
+def run_migrations_offline():
+    """Emit the migration SQL without connecting (alembic upgrade --sql)"""
+    context.configure(url=_database_url(), literal_binds=True)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    engine = create_engine(_database_url(), poolclass=pool.NullPool)
+    with engine.connect() as connection:
+        connection.execute(text("SELECT pg_advisory_lock(:key)"), {'key': MIGRATION_LOCK_KEY})
+        connection.commit()
+        try:
+            context.configure(connection=connection, transaction_per_migration=True)
+            with context.begin_transaction():
+                context.run_migrations()
+        finally:
+            connection.execute(text("SELECT pg_advisory_unlock(:key)"), {'key': MIGRATION_LOCK_KEY})
+            connection.commit()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
@@ -0,0 +1,115 @@
+"""Baseline schema
+
+Creates the tables DatabaseManager used to create at startup. Every
+statement is idempotent, so databases created by earlier releases (with or
+without the later interval, block-membership and lease columns) are
+brought to the same shape.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS blocks (
+            id SERIAL PRIMARY KEY,
+            index INTEGER NOT NULL,
+            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            previous_hash VARCHAR(64) NOT NULL,
+            merkle_root VARCHAR(64) NOT NULL,
+            block_hash VARCHAR(64) NOT NULL,
+            difficulty INTEGER NOT NULL,
+            nonce INTEGER NOT NULL,
+            total_scientific_value FLOAT NOT NULL,
+            miner_id VARCHAR(255) NOT NULL,
+            energy_consumed FLOAT NOT NULL,
+            knowledge_created INTEGER NOT NULL
+        )
+    """)
+
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS mathematical_work (
+            id SERIAL PRIMARY KEY,
+            work_type VARCHAR(50) NOT NULL,
+            difficulty INTEGER NOT NULL,
+            result JSONB NOT NULL,
+            verification_data JSONB NOT NULL,
+            computational_cost FLOAT NOT NULL,
+            energy_efficiency FLOAT NOT NULL,
+            scientific_value FLOAT NOT NULL,
+            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            worker_id VARCHAR(255) NOT NULL,
+            signature VARCHAR(64) NOT NULL,
+            range_start BIGINT,
+            range_end BIGINT,
+            block_id INTEGER,
+            leaf_index INTEGER
+        )
+    """)
+    # Interval and block-membership columns arrived after the first release
+    op.execute("ALTER TABLE mathematical_work ADD COLUMN IF NOT EXISTS range_start BIGINT")
+    op.execute("ALTER TABLE mathematical_work ADD COLUMN IF NOT EXISTS range_end BIGINT")
+    op.execute("ALTER TABLE mathematical_work ADD COLUMN IF NOT EXISTS block_id INTEGER")
+    op.execute("ALTER TABLE mathematical_work ADD COLUMN IF NOT EXISTS leaf_index INTEGER")
+
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS mining_operations (
+            id SERIAL PRIMARY KEY,
+            operation_type VARCHAR(50) NOT NULL,
+            miner_id VARCHAR(255) NOT NULL,
+            start_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            estimated_completion TIMESTAMP NOT NULL,
+            progress FLOAT DEFAULT 0.0,
+            current_result JSONB NOT NULL,
+            difficulty INTEGER NOT NULL,
+            status VARCHAR(20) DEFAULT 'active',
+            lease_owner VARCHAR(64),
+            lease_expires_at TIMESTAMP,
+            checkpoint JSONB,
+            recovery_attempts INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    # Lease and checkpoint columns arrived with crash recovery
+    op.execute("ALTER TABLE mining_operations ADD COLUMN IF NOT EXISTS lease_owner VARCHAR(64)")
+    op.execute("ALTER TABLE mining_operations ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMP")
+    op.execute("ALTER TABLE mining_operations ADD COLUMN IF NOT EXISTS checkpoint JSONB")
+    op.execute("ALTER TABLE mining_operations ADD COLUMN IF NOT EXISTS recovery_attempts INTEGER NOT NULL DEFAULT 0")
+
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS network_metrics (
+            id SERIAL PRIMARY KEY,
+            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            active_miners INTEGER NOT NULL,
+            blocks_per_hour FLOAT NOT NULL,
+            energy_efficiency FLOAT NOT NULL,
+            scientific_value_generated FLOAT NOT NULL,
+            average_block_time FLOAT NOT NULL,
+            network_hashrate FLOAT NOT NULL,
+            total_knowledge_created INTEGER NOT NULL
+        )
+    """)
+
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS verification_frontier (
+            work_type VARCHAR(50) PRIMARY KEY,
+            frontier BIGINT NOT NULL,
+            next_start BIGINT NOT NULL,
+            completed_intervals JSONB NOT NULL DEFAULT '[]',
+            released_intervals JSONB NOT NULL DEFAULT '[]',
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+
+def downgrade():
+    for table in ('verification_frontier', 'network_metrics', 'mining_operations', 'mathematical_work', 'blocks'):
+        op.execute(f"DROP TABLE IF EXISTS {table}")
@@ -0,0 +1,67 @@
+"""Indexes for the hot DatabaseManager queries
+
+    blocks_index_unique            get_blocks / get_latest_block (ORDER BY index), one block per height
+    mathematical_work_block_idx    get_block_discoveries (WHERE block_id ORDER BY leaf_index)
+    mining_operations_active_idx   get_active_mining_operations (status = 'active' ORDER BY start_time)
+    mining_operations_lease_idx    claim_orphaned_operations (unfinished rows by lease expiry)
+    network_metrics_timestamp_idx  get_latest_metrics (ORDER BY timestamp DESC)
+
+get_mathematical_work pages on the primary key, which needs no extra index.
+Indexes are built CONCURRENTLY so a populated database keeps serving
+writes during the upgrade.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16
+"""
+
+from alembic import context, op
+from sqlalchemy import text
+
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('blocks_index_unique', "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS blocks_index_unique ON blocks (index)"),
+    ('mathematical_work_block_idx',
+     "CREATE INDEX CONCURRENTLY IF NOT EXISTS mathematical_work_block_idx ON mathematical_work (block_id, leaf_index)"),
+    ('mining_operations_active_idx',
+     "CREATE INDEX CONCURRENTLY IF NOT EXISTS mining_operations_active_idx "
+     "ON mining_operations (start_time DESC) WHERE status = 'active'"),
+    ('mining_operations_lease_idx',
+     "CREATE INDEX CONCURRENTLY IF NOT EXISTS mining_operations_lease_idx "
+     "ON mining_operations (lease_expires_at) WHERE status IN ('active', 'pending')"),
+    ('network_metrics_timestamp_idx',
+     "CREATE INDEX CONCURRENTLY IF NOT EXISTS network_metrics_timestamp_idx ON network_metrics (timestamp DESC)"),
+]
+
+
+def upgrade():
+    # A forked chain cannot take the unique index; fail with the offending height instead of a bare error
+    duplicate = None if context.is_offline_mode() else op.get_bind().execute(text(
+        "SELECT index, COUNT(*) AS copies FROM blocks GROUP BY index HAVING COUNT(*) > 1 LIMIT 1"
+    )).first()
+    if duplicate:
+        raise RuntimeError(
+            f"Block #{duplicate[0]} exists {duplicate[1]} times; remove the duplicate blocks and upgrade again"
+        )
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, statement in INDEXES:
+            # A concurrent build that failed earlier leaves an invalid index that IF NOT EXISTS would keep
+            op.execute(text(
+                "DO $$ BEGIN "
+                "IF EXISTS (SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                f"WHERE c.relname = '{name}' AND NOT i.indisvalid) THEN DROP INDEX {name}; END IF; "
+                "END $$"
+            ))
+            op.execute(statement)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,26 @@
+"""Frontier interval claimed by a mining operation
+
+claimed_interval is written in the same transaction that claims the
+interval from verification_frontier and cleared in the one that commits
+or releases it, so recovery always knows which interval an abandoned
+operation still holds.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("ALTER TABLE mining_operations ADD COLUMN IF NOT EXISTS claimed_interval JSONB")
+
+
+def downgrade():
+    op.execute("ALTER TABLE mining_operations DROP COLUMN IF EXISTS claimed_interval")
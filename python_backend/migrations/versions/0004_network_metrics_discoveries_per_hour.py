@@ -0,0 +1,24 @@
+"""Discoveries per hour on network metrics snapshots
+
+Followers answer /api/metrics from the leader's latest stored snapshot,
+so the snapshot stores every figure the endpoint returns.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("ALTER TABLE network_metrics ADD COLUMN IF NOT EXISTS discoveries_per_hour INTEGER NOT NULL DEFAULT 0")
+
+
+def downgrade():
+    op.execute("ALTER TABLE network_metrics DROP COLUMN IF EXISTS discoveries_per_hour")
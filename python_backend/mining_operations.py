@@ -5,18 +5,342 @@ Manages productive mathematical mining operations and blockchain creation
 
 import logging
 import asyncio
+import math
+import os
 import random
+import socket
 import time
-from typing import Dict, List, Optional, Any
+import uuid
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Any
 from datetime import datetime, timedelta
 
 from database import DatabaseManager
 from scientific_valuation import ScientificValuationEngine
-from mathematical_engines import MathematicalEngines
+from hybrid_mathematical_system import HybridMathematicalSystem
+from compute_executor import ComputeExecutor
+from deadline import ComputationCancelled, Deadline
+from block_assembler import BlockAssembler
+from chain_writer import ChainWriter
+from group_commit import GroupCommitWriter
+from network_metrics import NetworkMetricsAggregator
+from verification_frontier import FRONTIER_ORIGINS
+from worker_dispatch import DispatchWithdrawn, WorkerDispatcher
 from websocket_manager import WebSocketManager
 
 logger = logging.getLogger(__name__)
 
+# Scheduling priorities (lower runs first): API-submitted work ahead of autonomous miners
+PRIORITY_USER = 0
+PRIORITY_AUTONOMOUS = 1
+
+# Operations allowed to wait for a slot before new submissions are refused
+MAX_QUEUED_OPERATIONS = int(os.getenv("MINING_QUEUE_SIZE", "32"))
+
+# Concurrent operations per work type (real engines are further capped by the process workers)
+DEFAULT_WORK_TYPE_CONCURRENCY = int(os.getenv("MINING_WORK_TYPE_CONCURRENCY", "2"))
+
+# Admission control: refuse new work once the backlog would take longer than this to drain
+MAX_DRAIN_SECONDS = float(os.getenv("MINING_MAX_DRAIN_SECONDS", "120"))
+
+# Fraction of the queue and drain budget autonomous miners may use, leaving headroom for API work
+AUTONOMOUS_ADMISSION_SHARE = float(os.getenv("MINING_AUTONOMOUS_SHARE", "0.5"))
+
+# Run-time assumed for a route before any of its operations has finished
+DEFAULT_RUN_ESTIMATE_SECONDS = 30.0
+
+# Accepted-but-deferred API operations held outside the queue
+MAX_DEFERRED_OPERATIONS = int(os.getenv("MINING_MAX_DEFERRED", "256"))
+
+# Wall-clock limit for one running operation; range-based engines return what they covered by then
+OPERATION_DEADLINE_SECONDS = float(os.getenv("MINING_OPERATION_DEADLINE", "300"))
+
+# Operations are leased to the process holding them and renewed every third of this; an expired lease marks an orphan
+OPERATION_LEASE_SECONDS = float(os.getenv("MINING_LEASE_SECONDS", "60"))
+
+# Times an orphaned operation is re-queued before it is marked failed
+MAX_RECOVERY_ATTEMPTS = int(os.getenv("MINING_MAX_RECOVERY_ATTEMPTS", "3"))
+
+# Checkpointing engines run in chunks of this length, saving resumable progress after each
+CHECKPOINT_SECONDS = float(os.getenv("MINING_CHECKPOINT_SECONDS", "30"))
+
+# How long shutdown waits for cancelled operations to queue their final writes before the writers stop
+SHUTDOWN_DRAIN_SECONDS = float(os.getenv("MINING_SHUTDOWN_DRAIN_SECONDS", "10"))
+
+class MiningQueueFullError(Exception):
+    """Raised when the scheduler refuses another operation; retry_after is the suggested wait in seconds"""
+    
+    def __init__(self, message: str, retry_after: int = 1):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+class MiningScheduler:
+    """
+    Bounded priority queue admitting mining operations into limited execution slots
+    
+    Each route ('process' for real engines, 'thread' for simulation) has a
+    fixed number of slots, and each work type a concurrency limit. Whenever a
+    slot frees up, the runnable entry with the best (priority, miner share,
+    arrival) key starts: user work goes before autonomous work, and within a
+    priority the miner that has started the fewest operations goes first.
+    """
+    
+    def __init__(
+        self,
+        route_capacity: Dict[str, int],
+        max_queued: int = MAX_QUEUED_OPERATIONS,
+        work_type_concurrency: int = DEFAULT_WORK_TYPE_CONCURRENCY
+    ):
+        self.route_capacity = route_capacity
+        self.max_queued = max_queued
+        self.work_type_concurrency = work_type_concurrency
+        
+        self.queue: List[Dict[str, Any]] = []
+        self.reserved = 0  # slots held by submissions still writing their database row
+        self.active: Dict[int, Dict[str, Any]] = {}
+        self.active_by_route = {route: 0 for route in route_capacity}
+        self.active_by_type: Dict[str, int] = {}
+        self.started_by_miner: Dict[str, int] = {}
+        self._sequence = 0
+        
+        # Measured service time per route (EWMA), used to estimate drain time and Retry-After
+        self.run_estimates = {route: DEFAULT_RUN_ESTIMATE_SECONDS for route in route_capacity}
+        self.measured_routes = set()
+        self.on_slot_freed: Optional[Callable[[], None]] = None
+        self.closed = False
+        
+        self.stats = {
+            'submitted': 0,
+            'started': 0,
+            'finished': 0,
+            'rejected': 0,
+            'cancelled': 0,
+            'totalWaitSeconds': 0.0,
+            'maxWaitSeconds': 0.0,
+            'totalRunSeconds': 0.0
+        }
+    
+    @property
+    def is_full(self) -> bool:
+        return len(self.queue) + self.reserved >= self.max_queued
+    
+    def reserve(self):
+        """Hold a queue slot for an operation about to be submitted, or raise MiningQueueFullError"""
+        if self.is_full:
+            self.stats['rejected'] += 1
+            raise MiningQueueFullError(
+                f"Mining queue is full ({len(self.queue)} operations waiting)",
+                self.check_admission(PRIORITY_USER)['retryAfter']
+            )
+        self.reserved += 1
+    
+    def set_route_capacity(self, route: str, capacity: int):
+        """Resize a route's slots (as remote workers join or leave) and start whatever now fits"""
+        self.route_capacity[route] = max(capacity, 1)
+        self._dispatch()
+    
+    def release_reservation(self):
+        """Give back a reserved slot whose operation was never submitted"""
+        self.reserved = max(self.reserved - 1, 0)
+    
+    def service_rate(self) -> float:
+        """Operations per second the slots complete, from measured run times"""
+        return sum(
+            capacity / max(self.run_estimates[route], 0.001) for route, capacity in self.route_capacity.items()
+        )
+    
+    def estimated_drain_seconds(self) -> float:
+        """Time for every queued and running operation to finish at the measured service rate"""
+        return (len(self.queue) + self.reserved + len(self.active)) / self.service_rate()
+    
+    def check_admission(self, priority: int) -> Dict[str, Any]:
+        """
+        Decide whether new work of this priority should be queued now
+        
+        Autonomous work may only use AUTONOMOUS_ADMISSION_SHARE of the queue
+        and drain budget. When refused, retryAfter is the time for enough of
+        the backlog to complete at the measured service rate.
+        """
+        share = 1.0 if priority == PRIORITY_USER else AUTONOMOUS_ADMISSION_SHARE
+        queue_limit = max(int(self.max_queued * share), 1)
+        drain_limit = MAX_DRAIN_SECONDS * share
+        
+        depth = len(self.queue) + self.reserved
+        rate = self.service_rate()
+        drain_seconds = self.estimated_drain_seconds()
+        
+        # Operations that must finish before this one would fit under both limits
+        excess = max(depth + 1 - queue_limit, (drain_seconds - drain_limit) * rate + 1, 0)
+        admit = depth < queue_limit and drain_seconds < drain_limit
+        
+        return {
+            'admit': admit,
+            'retryAfter': 0 if admit else min(max(math.ceil(excess / rate), 1), 3600),
+            'queueDepth': depth,
+            'queueLimit': queue_limit,
+            'estimatedDrainSeconds': round(drain_seconds, 1),
+            'drainLimitSeconds': drain_limit,
+            'serviceRate': round(rate, 4)
+        }
+    
+    def finished_future(self, operation_id: int) -> Optional[asyncio.Future]:
+        """Future resolved when a queued or active operation finishes, or None if it is unknown"""
+        for entry in list(self.active.values()) + self.queue:
+            if entry['operationId'] == operation_id:
+                return entry['finished']
+        return None
+    
+    def submit(
+        self,
+        operation_id: int,
+        work_type: str,
+        route: str,
+        miner_name: str,
+        priority: int,
+        runner: Callable[[], Awaitable[None]]
+    ) -> Dict[str, Any]:
+        """Queue an operation holding a reservation; runner() is awaited once it gets a slot. Returns its queue status"""
+        self.release_reservation()
+        
+        # A miner joining late starts level with the least-served miner instead of jumping the queue
+        if miner_name not in self.started_by_miner:
+            self.started_by_miner[miner_name] = min(self.started_by_miner.values(), default=0)
+        
+        self._sequence += 1
+        self.queue.append({
+            'operationId': operation_id,
+            'workType': work_type,
+            'route': route,
+            'minerName': miner_name,
+            'priority': priority,
+            'sequence': self._sequence,
+            'queuedAt': time.time(),
+            'runner': runner,
+            'finished': asyncio.get_running_loop().create_future()
+        })
+        self.stats['submitted'] += 1
+        self._dispatch()
+        
+        if operation_id in self.active:
+            return {'status': 'active', 'queuePosition': 0}
+        return {'status': 'pending', 'queuePosition': self.queue_position(operation_id)}
+    
+    def cancel(self, operation_id: int) -> bool:
+        """Drop a queued (not yet running) operation; False if it is not waiting in the queue"""
+        for entry in self.queue:
+            if entry['operationId'] == operation_id:
+                self.queue.remove(entry)
+                self.stats['cancelled'] += 1
+                if not entry['finished'].done():
+                    entry['finished'].set_result(None)
+                return True
+        return False
+    
+    def close(self) -> List[asyncio.Future]:
+        """Stop starting queued operations (at shutdown); returns the finished futures of the running ones"""
+        self.closed = True
+        return [entry['finished'] for entry in self.active.values()]
+    
+    def queue_position(self, operation_id: int) -> int:
+        """1-based position in dispatch order, or 0 if not queued"""
+        ordered = sorted(self.queue, key=self._order_key)
+        for position, entry in enumerate(ordered, 1):
+            if entry['operationId'] == operation_id:
+                return position
+        return 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth, slot usage and wait/run times"""
+        started = self.stats['started']
+        finished = self.stats['finished']
+        now = time.time()
+        return {
+            'queueDepth': len(self.queue),
+            'maxQueued': self.max_queued,
+            'queueByPriority': {
+                'user': sum(1 for entry in self.queue if entry['priority'] == PRIORITY_USER),
+                'autonomous': sum(1 for entry in self.queue if entry['priority'] == PRIORITY_AUTONOMOUS)
+            },
+            'oldestWaitSeconds': round(max((now - entry['queuedAt'] for entry in self.queue), default=0.0), 3),
+            'activeOperations': len(self.active),
+            'activeByRoute': dict(self.active_by_route),
+            'routeCapacity': dict(self.route_capacity),
+            'activeByWorkType': {k: v for k, v in self.active_by_type.items() if v},
+            'workTypeConcurrency': self.work_type_concurrency,
+            'minerShares': dict(self.started_by_miner),
+            'submitted': self.stats['submitted'],
+            'started': started,
+            'finished': finished,
+            'rejected': self.stats['rejected'],
+            'averageWaitSeconds': round(self.stats['totalWaitSeconds'] / started, 3) if started else 0.0,
+            'maxWaitSeconds': round(self.stats['maxWaitSeconds'], 3),
+            'averageRunSeconds': round(self.stats['totalRunSeconds'] / finished, 3) if finished else 0.0,
+            'routeRunEstimates': {route: round(seconds, 3) for route, seconds in self.run_estimates.items()},
+            'serviceRate': round(self.service_rate(), 4),
+            'estimatedDrainSeconds': round(self.estimated_drain_seconds(), 1)
+        }
+    
+    def _order_key(self, entry: Dict[str, Any]):
+        return entry['priority'], self.started_by_miner.get(entry['minerName'], 0), entry['sequence']
+    
+    def _has_slot(self, entry: Dict[str, Any]) -> bool:
+        route = entry['route']
+        return (
+            self.active_by_route.get(route, 0) < self.route_capacity.get(route, 1)
+            and self.active_by_type.get(entry['workType'], 0) < self.work_type_concurrency
+        )
+    
+    def _dispatch(self):
+        """Start queued operations while slots are free"""
+        while not self.closed:
+            runnable = [entry for entry in self.queue if self._has_slot(entry)]
+            if not runnable:
+                return
+            
+            entry = min(runnable, key=self._order_key)
+            self.queue.remove(entry)
+            
+            wait_seconds = time.time() - entry['queuedAt']
+            self.stats['started'] += 1
+            self.stats['totalWaitSeconds'] += wait_seconds
+            self.stats['maxWaitSeconds'] = max(self.stats['maxWaitSeconds'], wait_seconds)
+            
+            self.active[entry['operationId']] = entry
+            self.active_by_route[entry['route']] = self.active_by_route.get(entry['route'], 0) + 1
+            self.active_by_type[entry['workType']] = self.active_by_type.get(entry['workType'], 0) + 1
+            self.started_by_miner[entry['minerName']] += 1
+            
+            asyncio.create_task(self._run(entry))
+    
+    async def _run(self, entry: Dict[str, Any]):
+        """Run one admitted operation and hand its slot to the next one"""
+        start_time = time.time()
+        try:
+            await entry['runner']()
+        except Exception as e:
+            logger.error(f"❌ SCHEDULER: Operation {entry['operationId']} raised: {e}")
+        finally:
+            run_seconds = time.time() - start_time
+            self.stats['finished'] += 1
+            self.stats['totalRunSeconds'] += run_seconds
+            
+            route = entry['route']
+            if route in self.measured_routes:
+                self.run_estimates[route] = 0.8 * self.run_estimates[route] + 0.2 * run_seconds
+            else:
+                self.run_estimates[route] = run_seconds
+                self.measured_routes.add(route)
+            
+            self.active.pop(entry['operationId'], None)
+            self.active_by_route[route] -= 1
+            self.active_by_type[entry['workType']] -= 1
+            if not entry['finished'].done():
+                entry['finished'].set_result(None)
+            
+            self._dispatch()
+            if self.on_slot_freed:
+                self.on_slot_freed()
+
 class MiningOperationManager:
     """
     Manages all mining operations for the productive mining blockchain
@@ -28,64 +352,448 @@ class MiningOperationManager:
         db_manager: DatabaseManager, 
         ws_manager: 'WebSocketManager',
         valuation_engine: ScientificValuationEngine,
-        math_engines: MathematicalEngines
+        math_engines: HybridMathematicalSystem,
+        compute_executor: Optional[ComputeExecutor] = None,
+        group_commit: Optional[GroupCommitWriter] = None
     ):
         self.db_manager = db_manager
         self.ws_manager = ws_manager
         self.valuation_engine = valuation_engine
         self.math_engines = math_engines
+        self.compute_executor = compute_executor or ComputeExecutor(math_engines)
+        self.chain_writer = ChainWriter(db_manager)
+        
+        # Operation, discovery and metrics writes share group-committed transactions
+        self.group_commit = group_commit or GroupCommitWriter(db_manager)
+        self.block_assembler = BlockAssembler(db_manager, ws_manager, self.chain_writer)
+        
+        # Rolling metrics fed by pipeline events instead of rescanning recent rows
+        self.network_metrics = NetworkMetricsAggregator()
+        self.block_assembler.on_sealed = lambda block: self.network_metrics.record_block()
+        self.scheduler = MiningScheduler({
+            'process': self.compute_executor.workers,
+            'thread': self.compute_executor.simulation_threads
+        })
+        
+        # Operations accepted with defer=True while admission control was refusing work
+        self.deferred_operations: Deque[Dict[str, Any]] = deque()
+        self.scheduler.on_slot_freed = self._admit_deferred
+        
+        # Cancellation/deadline token of every running operation
+        self.operation_deadlines: Dict[int, Deadline] = {}
+        
+        # Remote compute nodes add their slots to the process route while they keep polling
+        self.worker_dispatcher = WorkerDispatcher()
+        self.worker_dispatcher.on_capacity_changed = lambda remote_slots: self.scheduler.set_route_capacity(
+            'process', self.compute_executor.workers + remote_slots
+        )
+        
+        # Lease owner recorded on every operation this process queues or runs
+        self.instance_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"[-64:]
+        self._lease_task: Optional[asyncio.Task] = None
         
         self.autonomous_miners_running = False
+        self.fleet_generation = 0  # bumped on every start so loops from an earlier start exit
         self.next_miner_id = 1
         
         logger.info("⛏️ MINING MANAGER: Initialized")
     
-    async def start_mining_operation(self, work_type: str, difficulty: int) -> Dict[str, Any]:
-        """Start a new mathematical mining operation"""
+    async def start_mining_operation(
+        self,
+        work_type: str,
+        difficulty: int,
+        priority: int = PRIORITY_USER,
+        miner_name: str = "api",
+        defer: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Queue a new mathematical mining operation; it becomes active once the scheduler has a free slot
+        
+        Raises MiningQueueFullError (with a Retry-After estimate) when admission
+        control refuses the work. With defer=True refused work is instead
+        recorded as pending and queued as soon as admission allows.
+        """
         try:
+            admission = self.scheduler.check_admission(priority)
+            deferred = not admission['admit'] and defer
+            if not admission['admit'] and not deferred:
+                self.scheduler.stats['rejected'] += 1
+                raise MiningQueueFullError(
+                    f"Mining backlog needs ~{admission['estimatedDrainSeconds']}s to drain "
+                    f"({admission['queueDepth']} operations waiting)",
+                    admission['retryAfter']
+                )
+            if deferred and len(self.deferred_operations) >= MAX_DEFERRED_OPERATIONS:
+                self.scheduler.stats['rejected'] += 1
+                raise MiningQueueFullError(
+                    f"Deferred mining backlog is full ({len(self.deferred_operations)} operations)",
+                    admission['retryAfter']
+                )
+            if not deferred:
+                self.scheduler.reserve()
+            
             miner_id = f"miner_{int(time.time() * 1000)}"
             estimated_completion = datetime.now() + timedelta(seconds=difficulty * 2)
+            current_result = {"status": "deferred" if deferred else "queued"}
             
             # Create mining operation record
-            operation = await self.db_manager.create_mining_operation(
-                operation_type=work_type,
-                miner_id=miner_id,
-                estimated_completion=estimated_completion,
-                difficulty=difficulty,
-                current_result={"status": "initializing"}
-            )
-            
-            # Start computation in background
-            asyncio.create_task(self._execute_mining_operation(operation['id'], work_type, difficulty, miner_id))
+            try:
+                operation = await self.group_commit.create_mining_operation(
+                    operation_type=work_type,
+                    miner_id=miner_id,
+                    estimated_completion=estimated_completion,
+                    difficulty=difficulty,
+                    current_result=current_result,
+                    status='pending',
+                    lease_owner=self.instance_id,
+                    lease_seconds=OPERATION_LEASE_SECONDS
+                )
+            except Exception:
+                if not deferred:
+                    self.scheduler.release_reservation()
+                raise
+            operation_id = operation['id']
             
-            logger.info(f"🚀 MINING: Started {work_type} operation at difficulty {difficulty}")
+            if deferred:
+                self.deferred_operations.append({
+                    'operationId': operation_id,
+                    'workType': work_type,
+                    'difficulty': difficulty,
+                    'minerId': miner_id,
+                    'minerName': miner_name,
+                    'priority': priority
+                })
+                queue_status = {'status': 'deferred', 'queuePosition': len(self.deferred_operations)}
+                logger.info(f"🕓 MINING: Deferred {work_type} operation at difficulty {difficulty} (retry ~{admission['retryAfter']}s)")
+            else:
+                queue_status = self._submit_operation(operation_id, work_type, difficulty, miner_id, miner_name, priority)
+                logger.info(f"🚀 MINING: Queued {work_type} operation at difficulty {difficulty} ({queue_status['status']})")
             
             return {
-                'id': operation['id'],
+                'id': operation_id,
                 'operationType': work_type,
                 'minerId': miner_id,
                 'startTime': operation['start_time'].isoformat(),
                 'estimatedCompletion': estimated_completion.isoformat(),
                 'progress': 0,
-                'currentResult': {"status": "initializing"},
+                'currentResult': current_result,
                 'difficulty': difficulty,
-                'status': 'active'
+                'status': queue_status['status'],
+                'queuePosition': queue_status['queuePosition'],
+                'retryAfter': admission['retryAfter'] if deferred else 0
             }
             
+        except MiningQueueFullError:
+            logger.warning(f"⏳ MINING: Backlog full, refused {work_type} operation")
+            raise
         except Exception as e:
             logger.error(f"❌ MINING: Error starting operation: {e}")
             raise
     
-    async def _execute_mining_operation(self, operation_id: int, work_type: str, difficulty: int, miner_id: str):
-        """Execute the mathematical computation for a mining operation"""
+    async def cancel_mining_operation(self, operation_id: int) -> Optional[str]:
+        """
+        Cancel an operation: 'cancelled' if it had not started, 'cancelling' if it is running
+        
+        A running operation's deadline is cancelled, which stops its engine at
+        the next chunk boundary and frees the worker; range-based work still
+        records the prefix it covered. Returns None for unknown or finished operations.
+        """
+        for entry in self.deferred_operations:
+            if entry['operationId'] == operation_id:
+                self.deferred_operations.remove(entry)
+                break
+        else:
+            if not self.scheduler.cancel(operation_id):
+                deadline = self.operation_deadlines.get(operation_id)
+                if deadline is None:
+                    return None
+                deadline.cancel()
+                logger.info(f"⏹️ MINING: Cancelling running operation {operation_id}")
+                return 'cancelling'
+        
+        self.group_commit.update_mining_operation(operation_id, 1.0, {"status": "cancelled"})
+        await self.group_commit.complete_mining_operation(operation_id, status='cancelled')
+        logger.info(f"⏹️ MINING: Cancelled operation {operation_id} before it started")
+        return 'cancelled'
+    
+    async def drain_operations(self, timeout: float = SHUTDOWN_DRAIN_SECONDS):
+        """
+        Stop running operations and wait for their final writes, before the writers shut down
+        
+        Queued operations are no longer started; their rows keep the lease
+        and are recovered by the next process. Running operations have their
+        deadlines cancelled, as cancel_mining_operation does, so they stop at
+        the next chunk boundary and queue their partial result or
+        cancellation while the group commit writer still accepts writes.
+        """
+        running = self.scheduler.close()
+        for deadline in list(self.operation_deadlines.values()):
+            deadline.cancel()
+        if not running:
+            return
+        
+        logger.info(f"⏹️ MINING: Stopping {len(running)} running operations for shutdown")
+        _, unfinished = await asyncio.wait(running, timeout=timeout)
+        if unfinished:
+            logger.warning(f"⚠️ MINING: {len(unfinished)} operations did not stop within {timeout}s; "
+                           f"they are recovered once their leases expire")
+    
+    def check_admission(self, priority: int = PRIORITY_USER) -> Dict[str, Any]:
+        """Whether work of this priority would be admitted now, with a Retry-After estimate if not"""
+        return self.scheduler.check_admission(priority)
+    
+    def _submit_operation(
+        self,
+        operation_id: int,
+        work_type: str,
+        difficulty: int,
+        miner_id: str,
+        miner_name: str,
+        priority: int,
+        checkpoint: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Hand a reserved operation whose row exists to the scheduler"""
+        async def run_operation():
+            deadline = Deadline(OPERATION_DEADLINE_SECONDS)
+            self.operation_deadlines[operation_id] = deadline
+            self.network_metrics.operation_started(difficulty)
+            try:
+                self.group_commit.activate_mining_operation(operation_id)
+                await self._execute_mining_operation(operation_id, work_type, difficulty, miner_id, deadline, checkpoint)
+            finally:
+                self.network_metrics.operation_finished(difficulty)
+                self.operation_deadlines.pop(operation_id, None)
+        
+        # Hand the computation to the scheduler instead of starting it unconditionally
+        return self.scheduler.submit(
+            operation_id, work_type, self.compute_executor.route(work_type, difficulty),
+            miner_name, priority, run_operation
+        )
+    
+    def _admit_deferred(self):
+        """Move deferred operations into the scheduler while admission control allows (slot-freed callback)"""
+        while self.deferred_operations:
+            entry = self.deferred_operations[0]
+            if not self.scheduler.check_admission(entry['priority'])['admit']:
+                return
+            
+            self.deferred_operations.popleft()
+            self.scheduler.reserve()
+            self._submit_operation(
+                entry['operationId'], entry['workType'], entry['difficulty'],
+                entry['minerId'], entry['minerName'], entry['priority'], entry.get('checkpoint')
+            )
+            logger.info(f"📥 MINING: Admitted deferred {entry['workType']} operation {entry['operationId']}")
+    
+    async def recover_orphaned_operations(self) -> Dict[str, int]:
+        """
+        Take over operations left pending or active by a process that stopped renewing their lease
+        
+        Called at startup before new work is accepted. A frontier interval
+        the operation still holds is committed if its discovery was recorded
+        (the operation then counts as completed) and released otherwise.
+        Other operations are re-queued
+        (deferred if admission refuses it) with its saved checkpoint, so
+        checkpointing engines resume instead of starting over. Operations
+        that have already been recovered MAX_RECOVERY_ATTEMPTS times are
+        marked failed rather than retried forever.
+        """
+        orphans = await self.db_manager.claim_orphaned_operations(self.instance_id, OPERATION_LEASE_SECONDS)
+        summary = {'requeued': 0, 'deferred': 0, 'failed': 0, 'completed': 0}
+        
+        for operation in orphans:
+            operation_id = operation['id']
+            work_type = operation['operation_type']
+            
+            # The claim is recorded with the interval and cleared with its commit or release
+            interval = operation['claimed_interval']
+            if interval and work_type in FRONTIER_ORIGINS:
+                origin = FRONTIER_ORIGINS[work_type]
+                discovery = await self.db_manager.get_interval_discovery(work_type, *interval)
+                if discovery:
+                    await self.db_manager.commit_verification_interval(
+                        work_type, origin, discovery['range_start'], discovery['range_end'], interval[1], operation_id
+                    )
+                    self.group_commit.update_mining_operation(
+                        operation_id, 1.0, {"status": "completed", "recovered": True, "discoveryId": discovery['id']}
+                    )
+                    await self.group_commit.complete_mining_operation(operation_id)
+                    summary['completed'] += 1
+                    continue
+                await self.db_manager.release_verification_interval(work_type, origin, *interval, operation_id)
+            
+            if operation['recovery_attempts'] > MAX_RECOVERY_ATTEMPTS:
+                self.group_commit.update_mining_operation(
+                    operation_id, 1.0, {"status": "failed", "error": "Abandoned too many times"}
+                )
+                await self.group_commit.complete_mining_operation(operation_id, status='failed')
+                summary['failed'] += 1
+                continue
+            
+            self.group_commit.update_mining_operation(operation_id, 0.0, {"status": "queued", "recovered": True})
+            entry = {
+                'operationId': operation_id,
+                'workType': work_type,
+                'difficulty': operation['difficulty'],
+                'minerId': operation['miner_id'],
+                'minerName': 'recovered',
+                'priority': PRIORITY_USER,
+                'checkpoint': operation['checkpoint']
+            }
+            if self.scheduler.check_admission(PRIORITY_USER)['admit']:
+                self.scheduler.reserve()
+                self._submit_operation(
+                    operation_id, work_type, entry['difficulty'], entry['minerId'],
+                    entry['minerName'], entry['priority'], entry['checkpoint']
+                )
+                summary['requeued'] += 1
+            else:
+                self.deferred_operations.append(entry)
+                summary['deferred'] += 1
+        
+        if orphans:
+            logger.info(
+                f"♻️ MINING: Recovered {len(orphans)} orphaned operations "
+                f"({summary['requeued']} re-queued, {summary['deferred']} deferred, "
+                f"{summary['completed']} completed, {summary['failed']} failed)"
+            )
+        return summary
+    
+    def start_lease_heartbeat(self):
+        """Start renewing the leases of every operation this process holds"""
+        if self._lease_task is None:
+            self._lease_task = asyncio.create_task(self._renew_leases())
+    
+    async def stop_lease_heartbeat(self):
+        if self._lease_task:
+            self._lease_task.cancel()
+            try:
+                await self._lease_task
+            except asyncio.CancelledError:
+                pass
+            self._lease_task = None
+    
+    def _held_operation_ids(self) -> List[int]:
+        """Deferred, queued and running operations owned by this process"""
+        held = [entry['operationId'] for entry in self.deferred_operations]
+        held.extend(entry['operationId'] for entry in self.scheduler.queue)
+        held.extend(self.scheduler.active)
+        return held
+    
+    async def _renew_leases(self):
+        """Heartbeat: extend all held leases in one statement, well before they expire"""
+        while True:
+            await asyncio.sleep(OPERATION_LEASE_SECONDS / 3)
+            held = self._held_operation_ids()
+            if not held:
+                continue
+            try:
+                await self.db_manager.renew_operation_leases(held, self.instance_id, OPERATION_LEASE_SECONDS)
+            except Exception as e:
+                logger.error(f"❌ MINING: Lease renewal failed for {len(held)} operations: {e}")
+    
+    async def _compute(self, work_type: str, difficulty: int, deadline: Deadline, **options) -> Dict[str, Any]:
+        """
+        Run an engine computation locally or on a remote worker
+        
+        Real-engine work goes to a remote worker when one is waiting for a
+        job, or when every local process worker is busy and remote workers
+        are connected; everything else runs on the local executor. Remote
+        jobs withdrawn because this process lost leadership run locally.
+        """
+        if self.compute_executor.route(work_type, difficulty) == 'process' and self.worker_dispatcher.workers:
+            local_busy = self.compute_executor.stats['process']['running'] >= self.compute_executor.workers
+            if self.worker_dispatcher.has_idle_worker() or local_busy:
+                try:
+                    return await self.worker_dispatcher.submit(work_type, difficulty, deadline, **options)
+                except DispatchWithdrawn:
+                    logger.info(f"🛰️ MINING: Remote {work_type} job withdrawn, computing it locally")
+        return await self.compute_executor.compute(work_type, difficulty, deadline, **options)
+    
+    async def _await_backpressure(self, miner_name: str, priority: int = PRIORITY_AUTONOMOUS) -> bool:
+        """Sleep out the scheduler's Retry-After (with jitter) if it would refuse work now; True if it did"""
+        admission = self.scheduler.check_admission(priority)
+        if admission['admit']:
+            return False
+        
+        wait_time = admission['retryAfter'] * random.uniform(1.0, 1.5)
+        logger.info(f"🚦 MINER {miner_name}: Backlog ~{admission['estimatedDrainSeconds']}s, backing off {wait_time:.1f}s")
+        await asyncio.sleep(wait_time)
+        return True
+    
+    async def _await_operation(self, operation_id: int):
+        """Wait until a queued or running operation has finished"""
+        finished = self.scheduler.finished_future(operation_id)
+        if finished is not None:
+            await asyncio.shield(finished)
+    
+    def get_scheduler_stats(self) -> Dict[str, Any]:
+        """Get mining scheduler queue, slot and admission statistics"""
+        return {
+            **self.scheduler.get_stats(),
+            'deferred': len(self.deferred_operations),
+            'admission': {
+                'user': self.scheduler.check_admission(PRIORITY_USER),
+                'autonomous': self.scheduler.check_admission(PRIORITY_AUTONOMOUS)
+            }
+        }
+    
+    async def _execute_mining_operation(
+        self,
+        operation_id: int,
+        work_type: str,
+        difficulty: int,
+        miner_id: str,
+        deadline: Optional[Deadline] = None,
+        checkpoint: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Execute the mathematical computation for a mining operation
+        
+        When the deadline stops the engine early, the covered prefix is
+        recorded as a partial result; work with nothing to show ends as
+        cancelled or timed out. Checkpointing engines run in
+        CHECKPOINT_SECONDS chunks, starting from `checkpoint` if given, and
+        each chunk's checkpoint is saved so a recovered operation resumes there.
+        """
+        deadline = deadline or Deadline()
+        interval = None
+        frontier_spec = self.math_engines.get_frontier_spec(work_type, difficulty)
         try:
+            # Resumable work types verify the next unverified interval instead of starting over
+            if frontier_spec:
+                interval = await self.group_commit.claim_verification_interval(work_type, *frontier_spec, operation_id)
+            
             # Update progress to computing
-            await self.db_manager.update_mining_operation(
-                operation_id, 0.1, {"status": "computing", "workType": work_type}
+            self.group_commit.update_mining_operation(
+                operation_id, 0.1, {"status": "computing", "workType": work_type, "interval": interval}
             )
             
-            # Perform mathematical computation
-            computation_result = self.math_engines.compute_mathematical_work(work_type, difficulty)
+            # Perform mathematical computation off the event loop
+            options = {'interval': interval} if interval else {}
+            checkpointing = self.math_engines.supports_checkpoints(work_type, difficulty)
+            if checkpointing:
+                options['time_budget'] = CHECKPOINT_SECONDS
+            if checkpointing and checkpoint:
+                logger.info(f"⏯️ MINING: Resuming operation {operation_id} from its saved checkpoint")
+                options['checkpoint'] = checkpoint
+            computation_result = await self._compute(work_type, difficulty, deadline, **options)
+            
+            # A chunk that ran out of its time budget (not the operation's deadline) continues from its checkpoint
+            while (checkpointing and computation_result.get('stopReason') == 'deadline' and not deadline.expired()
+                   and computation_result['verificationData'].get('checkpoint')):
+                options['checkpoint'] = computation_result['verificationData']['checkpoint']
+                self.group_commit.save_operation_checkpoint(operation_id, options['checkpoint'])
+                chunk_result = await self._compute(work_type, difficulty, deadline, **options)
+                chunk_result['computationTime'] += computation_result['computationTime']
+                chunk_result['energyConsumed'] += computation_result['energyConsumed']
+                computation_result = chunk_result
+            covered = computation_result.get('verificationData', {}).get('interval', {}).get('covered')
+            if interval and not covered:
+                raise RuntimeError(f"{work_type} did not report coverage for interval {interval}")
+            stop_reason = computation_result.get('stopReason')
+            if interval and stop_reason and covered[1] <= covered[0]:
+                raise ComputationCancelled(f"Stopped ({stop_reason}) before covering any of {interval}")
             
             # Calculate scientific value using the valuation engine
             scientific_value = self.valuation_engine.calculate_scientific_value(
@@ -95,13 +803,19 @@ class MiningOperationManager:
                 energy_consumed=computation_result['energyConsumed']
             )
             
-            # Update progress to validating
-            await self.db_manager.update_mining_operation(
-                operation_id, 0.8, {"status": "validating", "result": computation_result['computationResult']}
+            # Update progress to validating (committed with the discovery below)
+            self.group_commit.update_mining_operation(
+                operation_id, 0.8, {
+                    "status": "validating",
+                    "interval": interval,
+                    "result": computation_result['computationResult'],
+                    "complete": not stop_reason,
+                    "stopReason": stop_reason
+                }
             )
             
             # Create mathematical work record
-            mathematical_work = await self.db_manager.create_mathematical_work(
+            mathematical_work = await self.group_commit.create_mathematical_work(
                 work_type=work_type,
                 difficulty=difficulty,
                 result=computation_result['computationResult'],
@@ -110,14 +824,26 @@ class MiningOperationManager:
                 energy_efficiency=computation_result['energyConsumed'] * 1000,  # Convert to efficiency metric
                 scientific_value=scientific_value['total_value'],
                 worker_id=miner_id,
-                signature=computation_result['signature']
+                signature=computation_result['signature'],
+                range_start=covered[0] if interval else None,
+                range_end=covered[1] if interval else None
             )
+            self.network_metrics.record_discovery(scientific_value['total_value'], computation_result['energyConsumed'])
             
-            # Mark operation as completed
-            await self.db_manager.complete_mining_operation(operation_id)
+            # Advance the verified frontier now that the discovery is recorded (committed with the completion)
+            if interval:
+                self.group_commit.commit_verification_interval(
+                    work_type, frontier_spec[0], covered[0], covered[1], interval[1], operation_id
+                )
+                interval = None
+            
+            # Mark operation as completed (or cancelled with its partial result kept)
+            await self.group_commit.complete_mining_operation(
+                operation_id, status='cancelled' if stop_reason == 'cancelled' else 'completed'
+            )
             
-            # Create block with the discovery
-            await self._create_block_with_discovery(mathematical_work, miner_id, difficulty)
+            # Queue the discovery for the next multi-discovery block
+            self.block_assembler.add(mathematical_work, miner_id, difficulty)
             
             # Broadcast completion
             await self.ws_manager.broadcast({
@@ -129,43 +855,23 @@ class MiningOperationManager:
             
             logger.info(f"✅ MINING: Completed {work_type} - Discovery worth ${scientific_value['total_value']:.2f}")
             
+        except ComputationCancelled as e:
+            reason = deadline.reason or 'cancelled'
+            logger.info(f"⏹️ MINING: Operation {operation_id} stopped without a result ({reason})")
+            if interval:
+                self.group_commit.release_verification_interval(work_type, frontier_spec[0], *interval, operation_id)
+            self.group_commit.update_mining_operation(
+                operation_id, 1.0, {"status": "cancelled" if reason == 'cancelled' else "timed_out", "reason": str(e)}
+            )
+            await self.group_commit.complete_mining_operation(operation_id, status='cancelled')
         except Exception as e:
             logger.error(f"❌ MINING: Operation {operation_id} failed: {e}")
-            await self.db_manager.update_mining_operation(
+            if interval:
+                self.group_commit.release_verification_interval(work_type, frontier_spec[0], *interval, operation_id)
+            self.group_commit.update_mining_operation(
                 operation_id, 1.0, {"status": "failed", "error": str(e)}
             )
-    
-    async def _create_block_with_discovery(self, mathematical_work: Dict[str, Any], miner_id: str, difficulty: int):
-        """Create a new block containing the mathematical discovery"""
-        try:
-            # Get the latest block for previous hash
-            latest_block = await self.db_manager.get_latest_block()
-            previous_hash = latest_block['block_hash'] if latest_block else "0" * 64
-            next_index = latest_block['index'] + 1 if latest_block else 0
-            
-            # Create new block
-            block = await self.db_manager.create_block(
-                index=next_index,
-                previous_hash=previous_hash,
-                merkle_root=f"discovery_{mathematical_work['id']}",
-                difficulty=difficulty,
-                total_scientific_value=mathematical_work['scientific_value'],
-                miner_id=miner_id,
-                energy_consumed=mathematical_work['energy_efficiency'] / 1000,  # Convert back to kWh
-                knowledge_created=1
-            )
-            
-            logger.info(f"🔗 BLOCK: Created Block #{next_index} with discovery {mathematical_work['id']}")
-            
-            # Broadcast new block
-            await self.ws_manager.broadcast({
-                'type': 'new_block',
-                'block': block,
-                'discovery': mathematical_work
-            })
-            
-        except Exception as e:
-            logger.error(f"❌ BLOCK: Error creating block: {e}")
+            await self.group_commit.complete_mining_operation(operation_id, status='failed')
     
     async def start_autonomous_mining(self):
         """Start autonomous mining operations with enhanced monitoring"""
@@ -173,6 +879,8 @@ class MiningOperationManager:
             return
         
         self.autonomous_miners_running = True
+        self.fleet_generation += 1
+        generation = self.fleet_generation
         logger.info("🤖 AUTONOMOUS MINING: Starting enhanced continuous operations...")
         
         # Start multiple autonomous miners with varied specializations
@@ -190,19 +898,19 @@ class MiningOperationManager:
         # Start specialized and general miners
         for miner_name, specialization in miners:
             if specialization:
-                asyncio.create_task(self._specialized_autonomous_miner(miner_name, specialization))
+                asyncio.create_task(self._specialized_autonomous_miner(miner_name, specialization, generation))
             else:
-                asyncio.create_task(self._autonomous_miner(miner_name))
+                asyncio.create_task(self._autonomous_miner(miner_name, generation))
         
         # Start network metrics collection
-        asyncio.create_task(self._collect_network_metrics())
+        asyncio.create_task(self._collect_network_metrics(generation))
         
         # Start miner health monitoring
-        asyncio.create_task(self._monitor_miner_health())
+        asyncio.create_task(self._monitor_miner_health(generation))
         
         logger.info(f"✅ AUTONOMOUS MINING: Started {len(miners)} continuous miners")
     
-    async def _autonomous_miner(self, miner_name: str):
+    async def _autonomous_miner(self, miner_name: str, generation: int):
         """Run autonomous mining operations with enhanced error recovery"""
         work_types = self.math_engines.get_available_work_types()
         consecutive_errors = 0
@@ -210,8 +918,12 @@ class MiningOperationManager:
         
         logger.info(f"🤖 AUTONOMOUS MINER {miner_name}: Starting continuous operations")
         
-        while self.autonomous_miners_running:
+        while self._fleet_running(generation):
             try:
+                # Respect the scheduler's backpressure instead of piling work onto a full queue
+                if await self._await_backpressure(miner_name):
+                    continue
+                
                 # Adaptive difficulty based on network performance
                 base_difficulty = random.randint(40, 80)  # Higher difficulty for better security
                 
@@ -224,14 +936,18 @@ class MiningOperationManager:
                 
                 # Start mining operation
                 logger.info(f"🚀 AUTONOMOUS MINER {miner_name}: Starting {work_type} at difficulty {base_difficulty}")
-                await self.start_mining_operation(work_type, base_difficulty)
+                operation = await self.start_mining_operation(work_type, base_difficulty, PRIORITY_AUTONOMOUS, miner_name)
                 
                 # Reset error counter on success
                 consecutive_errors = 0
                 
-                # Adaptive wait time based on network load
-                wait_time = random.uniform(15, 45)  # Faster mining for continuous operations
-                logger.info(f"⏱️ AUTONOMOUS MINER {miner_name}: Waiting {wait_time:.1f}s before next operation")
+                # One operation in flight per miner; a short jitter keeps miners from submitting in lockstep
+                await self._await_operation(operation['id'])
+                await asyncio.sleep(random.uniform(1, 5))
+                
+            except MiningQueueFullError as e:
+                wait_time = e.retry_after * random.uniform(1.0, 1.5)
+                logger.info(f"🚦 AUTONOMOUS MINER {miner_name}: Refused by scheduler, retrying in {wait_time:.1f}s")
                 await asyncio.sleep(wait_time)
                 
             except Exception as e:
@@ -251,15 +967,19 @@ class MiningOperationManager:
         
         logger.info(f"🛑 AUTONOMOUS MINER {miner_name}: Stopped")
     
-    async def _specialized_autonomous_miner(self, miner_name: str, work_type: str):
+    async def _specialized_autonomous_miner(self, miner_name: str, work_type: str, generation: int):
         """Run specialized autonomous mining operations for specific mathematical problems"""
         consecutive_errors = 0
         max_consecutive_errors = 5
         
         logger.info(f"🎯 SPECIALIZED MINER {miner_name}: Starting continuous {work_type} operations")
         
-        while self.autonomous_miners_running:
+        while self._fleet_running(generation):
             try:
+                # Respect the scheduler's backpressure instead of piling work onto a full queue
+                if await self._await_backpressure(miner_name):
+                    continue
+                
                 # Higher difficulty for specialized miners
                 difficulty = random.randint(50, 100)  # Challenging problems for specialized miners
                 
@@ -269,14 +989,18 @@ class MiningOperationManager:
                 
                 # Start specialized mining operation
                 logger.info(f"🔬 SPECIALIZED MINER {miner_name}: Computing {work_type} at difficulty {difficulty}")
-                await self.start_mining_operation(work_type, difficulty)
+                operation = await self.start_mining_operation(work_type, difficulty, PRIORITY_AUTONOMOUS, miner_name)
                 
                 # Reset error counter on success
                 consecutive_errors = 0
                 
-                # Longer intervals for specialized high-difficulty work
-                wait_time = random.uniform(45, 90)  # More time for complex computations
-                logger.info(f"⏱️ SPECIALIZED MINER {miner_name}: Resting {wait_time:.1f}s before next operation")
+                # One operation in flight per miner; a short jitter keeps miners from submitting in lockstep
+                await self._await_operation(operation['id'])
+                await asyncio.sleep(random.uniform(1, 5))
+                
+            except MiningQueueFullError as e:
+                wait_time = e.retry_after * random.uniform(1.0, 1.5)
+                logger.info(f"🚦 SPECIALIZED MINER {miner_name}: Refused by scheduler, retrying in {wait_time:.1f}s")
                 await asyncio.sleep(wait_time)
                 
             except Exception as e:
@@ -296,11 +1020,11 @@ class MiningOperationManager:
         
         logger.info(f"🛑 SPECIALIZED MINER {miner_name}: Stopped")
     
-    async def _monitor_miner_health(self):
+    async def _monitor_miner_health(self, generation: int):
         """Monitor mining network health and restart failed miners"""
         logger.info("💊 MINER HEALTH MONITOR: Starting continuous health checks")
         
-        while self.autonomous_miners_running:
+        while self._fleet_running(generation):
             try:
                 # Check active mining operations
                 operations = await self.db_manager.get_active_mining_operations()
@@ -334,60 +1058,44 @@ class MiningOperationManager:
         
         logger.info("🛑 MINER HEALTH MONITOR: Stopped")
     
-    async def _collect_network_metrics(self):
-        """Collect and store network performance metrics"""
-        while self.autonomous_miners_running:
+    async def seed_network_metrics(self):
+        """Start the all-time discovery count from the database, once per process"""
+        try:
+            # One read at startup so the all-time total survives restarts
+            if not self.network_metrics.seeded:
+                statistics = await self.db_manager.get_statistics()
+                self.network_metrics.seed(statistics['total_discoveries'])
+        except Exception as e:
+            logger.error(f"❌ METRICS: Error seeding metrics: {e}")
+    
+    async def _collect_network_metrics(self, generation: int):
+        """Persist and broadcast a metrics snapshot every 30 seconds"""
+        await self.seed_network_metrics()
+        
+        while self._fleet_running(generation):
             try:
-                # Calculate metrics
-                blocks = await self.db_manager.get_blocks(100)
-                discoveries = await self.db_manager.get_mathematical_work(100)
-                operations = await self.db_manager.get_active_mining_operations()
-                
-                # Calculate network metrics
-                active_miners = len(operations) + 5  # Include autonomous miners
-                
-                if blocks:
-                    recent_blocks = [b for b in blocks if 
-                                   (datetime.now() - b['timestamp']).total_seconds() < 3600]
-                    blocks_per_hour = len(recent_blocks)
-                    avg_block_time = 3600 / max(blocks_per_hour, 1)
-                else:
-                    blocks_per_hour = 0
-                    avg_block_time = 0
-                
-                # Energy efficiency (negative means energy generation)
-                total_energy = sum(d['energy_efficiency'] / 1000 for d in discoveries[-10:]) if discoveries else 0
-                energy_efficiency = -total_energy * 100  # Convert to percentage
-                
-                # Scientific value
-                recent_discoveries = [d for d in discoveries if 
-                                    (datetime.now() - d['timestamp']).total_seconds() < 3600]
-                scientific_value_generated = sum(d['scientific_value'] for d in recent_discoveries)
-                
-                # Network hashrate (based on difficulty and operations)
-                network_hashrate = sum(op['difficulty'] for op in operations) * 1000
-                
-                # Total knowledge created
-                total_knowledge = len(discoveries)
+                snapshot = self.network_metrics.snapshot()
                 
                 # Store metrics
-                await self.db_manager.create_network_metrics(
-                    active_miners=active_miners,
-                    blocks_per_hour=blocks_per_hour,
-                    energy_efficiency=energy_efficiency,
-                    scientific_value_generated=scientific_value_generated,
-                    average_block_time=avg_block_time,
-                    network_hashrate=network_hashrate,
-                    total_knowledge_created=total_knowledge
+                stored = await self.group_commit.create_network_metrics(
+                    active_miners=snapshot['activeMiners'],
+                    blocks_per_hour=snapshot['blocksPerHour'],
+                    energy_efficiency=snapshot['energyEfficiency'],
+                    scientific_value_generated=snapshot['scientificValueGenerated'],
+                    average_block_time=snapshot['averageBlockTime'],
+                    network_hashrate=snapshot['networkHashrate'],
+                    total_knowledge_created=snapshot['totalKnowledgeCreated'],
+                    discoveries_per_hour=snapshot['discoveriesPerHour']
                 )
+                self.network_metrics.last_snapshot_id = stored['id']
                 
                 # Broadcast metrics update
                 await self.ws_manager.broadcast({
                     'type': 'metrics_update',
-                    'activeMiners': active_miners,
-                    'blocksPerHour': blocks_per_hour,
-                    'energyEfficiency': energy_efficiency,
-                    'scientificValue': scientific_value_generated
+                    'activeMiners': snapshot['activeMiners'],
+                    'blocksPerHour': snapshot['blocksPerHour'],
+                    'energyEfficiency': snapshot['energyEfficiency'],
+                    'scientificValue': snapshot['scientificValueGenerated']
                 })
                 
                 # Wait 30 seconds before next metrics collection
@@ -398,40 +1106,34 @@ class MiningOperationManager:
                 await asyncio.sleep(30)
     
     async def get_network_metrics(self) -> Dict[str, Any]:
-        """Get current network metrics"""
-        try:
-            # Get latest stored metrics
-            latest_metrics = await self.db_manager.get_latest_metrics()
-            
-            if latest_metrics:
-                return {
-                    'id': latest_metrics['id'],
-                    'timestamp': latest_metrics['timestamp'].isoformat(),
-                    'activeMiners': latest_metrics['active_miners'],
-                    'blocksPerHour': latest_metrics['blocks_per_hour'],
-                    'energyEfficiency': latest_metrics['energy_efficiency'],
-                    'scientificValueGenerated': latest_metrics['scientific_value_generated'],
-                    'averageBlockTime': latest_metrics['average_block_time'],
-                    'networkHashrate': latest_metrics['network_hashrate'],
-                    'totalKnowledgeCreated': latest_metrics['total_knowledge_created']
-                }
-            else:
-                # Return default metrics if none stored
-                return {
-                    'id': 0,
-                    'timestamp': datetime.now().isoformat(),
-                    'activeMiners': 5,
-                    'blocksPerHour': 8,
-                    'energyEfficiency': -500.0,
-                    'scientificValueGenerated': 0.0,
-                    'averageBlockTime': 450.0,
-                    'networkHashrate': 1000.0,
-                    'totalKnowledgeCreated': 0
-                }
-                
-        except Exception as e:
-            logger.error(f"❌ METRICS: Error getting metrics: {e}")
-            raise
+        """
+        Get current network metrics
+        
+        The leader runs the fleet, so its in-memory aggregator sees the
+        network's events and is served directly. Other processes serve the
+        leader's latest stored snapshot (at most 30 seconds old), falling
+        back to their own aggregator before the first one is stored.
+        
+        Events are not forwarded between processes: operations started
+        through another process's API, and blocks that process seals, only
+        reach its own aggregator. The leader's hourly rates and running
+        operation figures leave them out; only totalKnowledgeCreated,
+        seeded from the database at startup, includes their earlier work.
+        """
+        if not self.autonomous_miners_running:
+            latest = await self.db_manager.get_latest_metrics()
+            if latest:
+                return self.network_metrics.stored_snapshot(latest)
+        return self.network_metrics.snapshot()
+    
+    def _fleet_running(self, generation: int) -> bool:
+        """Whether loops started by start_autonomous_mining() call `generation` should keep going"""
+        return self.autonomous_miners_running and generation == self.fleet_generation
+    
+    def resize_compute_pool(self, workers: int):
+        """Resize the local process pool (on election or demotion) and the scheduler's process slots with it"""
+        self.compute_executor.resize(workers)
+        self.scheduler.set_route_capacity('process', self.compute_executor.workers + self.worker_dispatcher.capacity)
     
     async def stop_autonomous_mining(self):
         """Stop autonomous mining operations"""
@@ -12,10 +12,26 @@ from enum import Enum
 class MiningRequest(BaseModel):
     workType: str = Field(..., description="Type of mathematical work to perform")
     difficulty: int = Field(..., ge=1, le=1000, description="Mining difficulty (1-1000)")
+    defer: bool = Field(default=False, description="Accept the operation as pending instead of returning 429 when the miner is overloaded")
 
 class BlockchainRestartRequest(BaseModel):
     confirm: bool = Field(default=True, description="Confirmation to restart blockchain")
 
+class WorkerLeaseRequest(BaseModel):
+    workerId: str = Field(..., max_length=64, description="Identifier the worker uses for the lifetime of its process")
+    name: str = Field(..., max_length=128, description="Human-readable worker name")
+    slots: int = Field(default=1, ge=1, le=64, description="Jobs the worker can run at once")
+    waitSeconds: float = Field(default=20.0, ge=0, le=60, description="How long to wait for a job before returning 204")
+
+class WorkerHeartbeat(BaseModel):
+    workerId: str = Field(..., max_length=64)
+
+class WorkerJobResult(BaseModel):
+    workerId: str = Field(..., max_length=64)
+    result: Optional[Dict[str, Any]] = Field(default=None, description="Engine result including verificationData and signature")
+    error: Optional[str] = Field(default=None, description="Failure message when the engine produced no result")
+    stopped: bool = Field(default=False, description="The engine stopped on its deadline or a cancellation")
+
 # ===== RESPONSE MODELS =====
 
 class Block(BaseModel):
@@ -44,6 +60,10 @@ class MathematicalWork(BaseModel):
     timestamp: datetime
     worker_id: str
     signature: str
+    range_start: Optional[int] = None
+    range_end: Optional[int] = None
+    block_id: Optional[int] = None
+    leaf_index: Optional[int] = None
 
 class MiningOperation(BaseModel):
     id: int
@@ -66,6 +86,30 @@ class NetworkMetrics(BaseModel):
     average_block_time: float
     network_hashrate: float
     total_knowledge_created: int
+    discoveries_per_hour: int = 0
+
+class MerkleProofStep(BaseModel):
+    hash: str
+    position: str
+
+class DiscoveryInclusionProof(BaseModel):
+    discoveryId: int
+    blockId: int
+    blockIndex: int
+    leafIndex: int
+    leafCount: int
+    leaf: str
+    merkleRoot: str
+    proof: List[MerkleProofStep]
+    verified: bool
+
+class VerificationFrontier(BaseModel):
+    work_type: str
+    frontier: int
+    next_start: int
+    completed_intervals: List[List[int]]
+    released_intervals: List[List[int]]
+    updated_at: datetime
 
 class ScientificValuation(BaseModel):
     work_type: str
@@ -145,6 +189,10 @@ class DatabaseMathematicalWork(BaseModel):
     timestamp: datetime
     worker_id: str
     signature: str
+    range_start: Optional[int] = None
+    range_end: Optional[int] = None
+    block_id: Optional[int] = None
+    leaf_index: Optional[int] = None
 
 class DatabaseMiningOperation(BaseModel):
     """Database representation of mining operation"""
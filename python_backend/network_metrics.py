@@ -0,0 +1,130 @@
+"""
+Network Metrics - Python Implementation
+Event-driven rolling network metrics over an hour of one-minute buckets
+"""
+
+import logging
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, Mapping
+
+logger = logging.getLogger(__name__)
+
+BUCKET_SECONDS = 60
+WINDOW_BUCKETS = 60  # one hour
+
+# Autonomous miners counted on top of the running operations, as the network has always reported
+BASELINE_MINERS = 5
+
+# Discoveries averaged for the energy efficiency figure
+ENERGY_WINDOW = 10
+
+_BUCKET_FIELDS = ('blocks', 'discoveries', 'scientificValue')
+
+
+class NetworkMetricsAggregator:
+    """
+    Rolling network counters fed by mining pipeline events
+
+    Block, discovery and operation events land in the bucket for the
+    current minute of a one-hour ring. Window totals are kept alongside and
+    expired buckets are subtracted as the clock advances, so recording an
+    event and taking a snapshot are both O(1) and never touch the database.
+    """
+
+    def __init__(self, clock=time.time):
+        self.clock = clock
+        self.buckets = [dict.fromkeys(_BUCKET_FIELDS, 0) for _ in range(WINDOW_BUCKETS)]
+        self.window = dict.fromkeys(_BUCKET_FIELDS, 0)
+        self.current_minute = int(self.clock() // BUCKET_SECONDS)
+
+        self.active_operations = 0
+        self.active_difficulty = 0
+        self.total_discoveries = 0
+        self.recent_energy = deque(maxlen=ENERGY_WINDOW)
+        self.recent_energy_sum = 0.0
+        self.last_snapshot_id = 0
+        self.seeded = False
+
+    def seed(self, total_discoveries: int):
+        """Start the all-time discovery count from the stored total"""
+        self.total_discoveries += total_discoveries
+        self.seeded = True
+
+    def record_block(self):
+        self._add('blocks', 1)
+
+    def record_discovery(self, scientific_value: float, energy_consumed: float):
+        self._add('discoveries', 1)
+        self._add('scientificValue', scientific_value)
+        self.total_discoveries += 1
+
+        if len(self.recent_energy) == self.recent_energy.maxlen:
+            self.recent_energy_sum -= self.recent_energy[0]
+        self.recent_energy.append(energy_consumed)
+        self.recent_energy_sum += energy_consumed
+
+    def operation_started(self, difficulty: int):
+        self.active_operations += 1
+        self.active_difficulty += difficulty
+
+    def operation_finished(self, difficulty: int):
+        self.active_operations = max(self.active_operations - 1, 0)
+        self.active_difficulty = max(self.active_difficulty - difficulty, 0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current metrics in the /api/metrics shape"""
+        self._advance()
+        blocks_per_hour = self.window['blocks']
+
+        return {
+            'id': self.last_snapshot_id,
+            'timestamp': datetime.now().isoformat(),
+            'activeMiners': self.active_operations + BASELINE_MINERS,
+            'blocksPerHour': blocks_per_hour,
+            'energyEfficiency': -self.recent_energy_sum * 100,  # Negative means energy generation
+            'scientificValueGenerated': self.window['scientificValue'],
+            'discoveriesPerHour': self.window['discoveries'],
+            'averageBlockTime': 3600 / blocks_per_hour if blocks_per_hour else 0,
+            'networkHashrate': self.active_difficulty * 1000,
+            'totalKnowledgeCreated': self.total_discoveries
+        }
+
+    @staticmethod
+    def stored_snapshot(row: Mapping[str, Any]) -> Dict[str, Any]:
+        """A persisted network_metrics row in the /api/metrics shape"""
+        return {
+            'id': row['id'],
+            'timestamp': row['timestamp'].isoformat(),
+            'activeMiners': row['active_miners'],
+            'blocksPerHour': row['blocks_per_hour'],
+            'energyEfficiency': row['energy_efficiency'],
+            'scientificValueGenerated': row['scientific_value_generated'],
+            'discoveriesPerHour': row['discoveries_per_hour'],
+            'averageBlockTime': row['average_block_time'],
+            'networkHashrate': row['network_hashrate'],
+            'totalKnowledgeCreated': row['total_knowledge_created']
+        }
+
+    def _add(self, field: str, amount: float):
+        self._advance()
+        self.buckets[self.current_minute % WINDOW_BUCKETS][field] += amount
+        self.window[field] += amount
+
+    def _advance(self):
+        """Expire the buckets of every minute that has passed since the last event"""
+        minute = int(self.clock() // BUCKET_SECONDS)
+        if minute <= self.current_minute:
+            return
+
+        for expired in range(self.current_minute + 1, min(minute, self.current_minute + WINDOW_BUCKETS) + 1):
+            bucket = self.buckets[expired % WINDOW_BUCKETS]
+            for field in _BUCKET_FIELDS:
+                self.window[field] -= bucket[field]
+                bucket[field] = 0
+        self.current_minute = minute
+
+        # Float sums drift under repeated add/subtract; an empty window is exactly zero
+        if not self.window['discoveries']:
+            self.window['scientificValue'] = 0
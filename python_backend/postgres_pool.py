@@ -0,0 +1,162 @@
+"""
+Postgres Pool - Python Implementation
+Tuned asyncpg connection pool behind the query methods DatabaseManager uses
+"""
+
+import json
+import logging
+import os
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Iterable, List, Optional, Sequence
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_MIN_SIZE = int(os.getenv("DATABASE_POOL_MIN_SIZE", "2"))
+DEFAULT_POOL_MAX_SIZE = int(os.getenv("DATABASE_POOL_MAX_SIZE", "10"))
+
+# Prepared statements kept per connection (LRU keyed by SQL text); 0 disables the cache, e.g. behind pgbouncer
+DEFAULT_STATEMENT_CACHE_SIZE = int(os.getenv("DATABASE_STATEMENT_CACHE_SIZE", "256"))
+
+# Seconds any single query may run unless the call passes its own timeout
+DEFAULT_QUERY_TIMEOUT = float(os.getenv("DATABASE_QUERY_TIMEOUT", "30"))
+
+
+# Binary jsonb is the JSON text behind a one-byte format version
+JSONB_VERSION = b'\x01'
+
+
+def _encode_jsonb(value: Any) -> bytes:
+    return JSONB_VERSION + json.dumps(value).encode()
+
+
+def _decode_jsonb(data: bytes) -> Any:
+    return json.loads(data[1:])
+
+
+async def _initialize_connection(connection: asyncpg.Connection):
+    """Decode json/jsonb to Python objects and encode parameters from them on every pooled connection"""
+    # Binary codecs, because COPY (copy_records_to_table) only accepts binary encoders
+    await connection.set_type_codec(
+        'json', encoder=lambda value: json.dumps(value).encode(), decoder=json.loads,
+        schema='pg_catalog', format='binary'
+    )
+    await connection.set_type_codec(
+        'jsonb', encoder=_encode_jsonb, decoder=_decode_jsonb, schema='pg_catalog', format='binary'
+    )
+
+
+class PostgresPool:
+    """
+    asyncpg pool with the fetch/execute/transaction surface DatabaseManager is written against
+
+    Statements are prepared once per connection and reused from asyncpg's
+    statement cache, so a repeated query costs one Bind/Execute round trip
+    instead of a re-parse. JSON and JSONB travel through codecs, so callers
+    pass and receive dicts and lists. Rows come back as asyncpg Records;
+    DatabaseManager copies them into dicts wherever the rows leave it
+    (API responses, broadcasts, callers that modify them) and returns the
+    Records themselves only where they are just read. Inside transaction()
+    the current task keeps one connection, and every query it makes runs
+    on it.
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        min_size: int = DEFAULT_POOL_MIN_SIZE,
+        max_size: int = DEFAULT_POOL_MAX_SIZE,
+        statement_cache_size: int = DEFAULT_STATEMENT_CACHE_SIZE,
+        query_timeout: float = DEFAULT_QUERY_TIMEOUT
+    ):
+        self.database_url = database_url
+        self.min_size = min_size
+        self.max_size = max(max_size, min_size, 1)
+        self.statement_cache_size = statement_cache_size
+        self.query_timeout = query_timeout
+
+        self.pool: Optional[asyncpg.Pool] = None
+        self._transaction_connection: ContextVar[Optional[asyncpg.Connection]] = ContextVar(
+            'transaction_connection', default=None
+        )
+
+    async def connect(self):
+        self.pool = await asyncpg.create_pool(
+            self.database_url,
+            min_size=self.min_size,
+            max_size=self.max_size,
+            statement_cache_size=self.statement_cache_size,
+            command_timeout=self.query_timeout,
+            init=_initialize_connection
+        )
+        logger.info(f"🏊 POSTGRES POOL: {self.min_size}-{self.max_size} connections, "
+                    f"{self.statement_cache_size} cached statements each, {self.query_timeout}s query timeout")
+
+    async def disconnect(self):
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+
+    async def fetch_all(self, query: str, *args, timeout: Optional[float] = None) -> List[asyncpg.Record]:
+        async with self._connection() as connection:
+            return await connection.fetch(query, *args, timeout=timeout)
+
+    async def fetch_one(self, query: str, *args, timeout: Optional[float] = None) -> Optional[asyncpg.Record]:
+        async with self._connection() as connection:
+            return await connection.fetchrow(query, *args, timeout=timeout)
+
+    async def fetch_val(self, query: str, *args, timeout: Optional[float] = None) -> Any:
+        async with self._connection() as connection:
+            return await connection.fetchval(query, *args, timeout=timeout)
+
+    async def execute(self, query: str, *args, timeout: Optional[float] = None) -> str:
+        """Run a statement; returns the command status (e.g. 'UPDATE 3')"""
+        async with self._connection() as connection:
+            return await connection.execute(query, *args, timeout=timeout)
+
+    async def execute_many(self, query: str, args: Iterable[Sequence], timeout: Optional[float] = None):
+        """Run a statement once per argument tuple, pipelined in one round trip"""
+        async with self._connection() as connection:
+            await connection.executemany(query, args, timeout=timeout)
+
+    async def fetch_many(self, query: str, args: Iterable[Sequence], timeout: Optional[float] = None) -> List[asyncpg.Record]:
+        """execute_many that also returns each execution's rows (e.g. INSERT ... RETURNING *)"""
+        async with self._connection() as connection:
+            return await connection.fetchmany(query, args, timeout=timeout)
+
+    async def copy_records_to_table(
+        self, table: str, records: Iterable[Sequence], columns: List[str], timeout: Optional[float] = None
+    ) -> str:
+        """Bulk load rows with COPY FROM STDIN in binary format"""
+        async with self._connection() as connection:
+            return await connection.copy_records_to_table(table, records=records, columns=columns, timeout=timeout)
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[asyncpg.Connection]:
+        """Run the enclosed queries on one connection in one transaction (a savepoint when nested)"""
+        connection = self._transaction_connection.get()
+        if connection is not None:
+            async with connection.transaction():
+                yield connection
+            return
+
+        async with self.pool.acquire() as connection:
+            token = self._transaction_connection.set(connection)
+            try:
+                async with connection.transaction():
+                    yield connection
+            finally:
+                self._transaction_connection.reset(token)
+
+    @asynccontextmanager
+    async def _connection(self) -> AsyncIterator[asyncpg.Connection]:
+        """The task's transaction connection if it has one, else a connection borrowed for one query"""
+        connection = self._transaction_connection.get()
+        if connection is not None:
+            yield connection
+            return
+
+        async with self.pool.acquire() as connection:
+            yield connection
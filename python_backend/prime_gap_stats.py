@@ -0,0 +1,143 @@
+"""
+Prime Gap Statistics - NumPy Implementation
+Streaming, constant-memory prime-gap aggregates with checkpoint/resume state
+"""
+
+import logging
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Histogram bins for gaps 0..bins-1; the largest gap below 2^64 is 1550 and below 10^10 is 354
+DEFAULT_HISTOGRAM_BINS = 1024
+
+
+class PrimeGapStatistics:
+    """
+    Running prime-gap statistics fed one sieve segment at a time
+
+    Keeps Welford mean/variance, min/max, a fixed-size gap histogram (with a
+    sparse overflow map for gaps beyond it), the twin-prime count and the
+    maximal-gap records, so memory is independent of the range. The state
+    round-trips through to_state()/from_state() as plain JSON, letting a long
+    run be checkpointed and resumed at `position`.
+    """
+
+    def __init__(self, start: int = 2, histogram_bins: int = DEFAULT_HISTOGRAM_BINS):
+        self.position = start          # every prime below position has been consumed
+        self.last_prime = None
+        self.prime_count = 0
+
+        self.gap_count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min_gap = None
+        self.max_gap = 0
+
+        self.histogram = np.zeros(histogram_bins, dtype=np.int64)
+        self.overflow: Dict[int, int] = {}
+        self.records = []              # [gap, prime before the gap] each time the maximum grows
+
+    def consume(self, primes: np.ndarray, segment_hi: int):
+        """Fold in the primes of one segment ending (exclusive) at segment_hi, in increasing order"""
+        if primes.size:
+            if self.last_prime is None:
+                gaps = np.diff(primes)
+                before = primes[:-1]
+            else:
+                gaps = np.diff(primes, prepend=self.last_prime)
+                before = np.concatenate((np.array([self.last_prime], dtype=primes.dtype), primes[:-1]))
+
+            self.prime_count += int(primes.size)
+            self.last_prime = int(primes[-1])
+            if gaps.size:
+                self._add_gaps(gaps, before)
+
+        self.position = max(self.position, segment_hi)
+
+    @property
+    def std(self) -> float:
+        return float(np.sqrt(self.m2 / self.gap_count)) if self.gap_count else 0.0
+
+    @property
+    def twin_primes(self) -> int:
+        return int(self.histogram[2])
+
+    def distribution(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (gap values, counts) for every gap seen, in increasing order"""
+        values = np.flatnonzero(self.histogram)
+        counts = self.histogram[values]
+        if self.overflow:
+            extra = sorted(self.overflow.items())
+            values = np.concatenate((values, np.array([gap for gap, _ in extra], dtype=np.int64)))
+            counts = np.concatenate((counts, np.array([count for _, count in extra], dtype=np.int64)))
+        return values, counts
+
+    def to_state(self) -> Dict[str, Any]:
+        """JSON-serializable checkpoint of the running statistics"""
+        nonzero = np.flatnonzero(self.histogram)
+        return {
+            'position': self.position,
+            'lastPrime': self.last_prime,
+            'primeCount': self.prime_count,
+            'gapCount': self.gap_count,
+            'mean': self.mean,
+            'm2': self.m2,
+            'minGap': self.min_gap,
+            'maxGap': self.max_gap,
+            'histogramBins': int(self.histogram.size),
+            'histogram': {str(gap): int(self.histogram[gap]) for gap in nonzero.tolist()},
+            'overflow': {str(gap): count for gap, count in self.overflow.items()},
+            'records': self.records
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> 'PrimeGapStatistics':
+        """Resume from a checkpoint produced by to_state()"""
+        stats = cls(state['position'], state['histogramBins'])
+        stats.last_prime = state['lastPrime']
+        stats.prime_count = state['primeCount']
+        stats.gap_count = state['gapCount']
+        stats.mean = state['mean']
+        stats.m2 = state['m2']
+        stats.min_gap = state['minGap']
+        stats.max_gap = state['maxGap']
+        for gap, count in state['histogram'].items():
+            stats.histogram[int(gap)] = count
+        stats.overflow = {int(gap): count for gap, count in state['overflow'].items()}
+        stats.records = [list(record) for record in state['records']]
+        return stats
+
+    def _add_gaps(self, gaps: np.ndarray, before: np.ndarray):
+        """Merge a chunk of gaps into the running aggregates"""
+        # Chan et al. pairwise combination of the chunk's moments with the running Welford state
+        count = int(gaps.size)
+        chunk_mean = float(gaps.mean())
+        chunk_m2 = float(np.square(gaps - chunk_mean).sum())
+        total = self.gap_count + count
+        delta = chunk_mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += chunk_m2 + delta * delta * self.gap_count * count / total
+        self.gap_count = total
+
+        chunk_min = int(gaps.min())
+        self.min_gap = chunk_min if self.min_gap is None else min(self.min_gap, chunk_min)
+
+        # Maximal gaps: strictly larger than every gap before them
+        chunk_max = int(gaps.max())
+        if chunk_max > self.max_gap:
+            running = np.maximum.accumulate(gaps)
+            previous = np.concatenate(([self.max_gap], np.maximum(running[:-1], self.max_gap)))
+            for index in np.flatnonzero(gaps > previous).tolist():
+                self.records.append([int(gaps[index]), int(before[index])])
+            self.max_gap = chunk_max
+
+        bins = self.histogram.size
+        in_range = gaps[gaps < bins]
+        self.histogram += np.bincount(in_range, minlength=bins)[:bins]
+        if in_range.size < count:
+            values, counts = np.unique(gaps[gaps >= bins], return_counts=True)
+            for gap, gap_count in zip(values.tolist(), counts.tolist()):
+                self.overflow[gap] = self.overflow.get(gap, 0) + gap_count
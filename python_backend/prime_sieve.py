@@ -0,0 +1,303 @@
+"""
+Prime Sieve - NumPy Implementation
+Vectorized, segmented and shared prime sieves used by the real mathematical engines
+"""
+
+import logging
+import math
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: extensions are still atomic, just not serialized
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Odd numbers held per segment byte; 256 KiB keeps one segment resident in a typical L2 cache
+DEFAULT_SEGMENT_BYTES = int(os.getenv("PRIME_SEGMENT_BYTES", str(256 * 1024)))
+
+# Shared prime table location and size cap (2*10^8 is ~11M primes, ~88 MB mapped)
+DEFAULT_PRIME_TABLE_PATH = os.getenv(
+    "PRIME_TABLE_PATH", os.path.join(tempfile.gettempdir(), "productive_mining_primes.npy")
+)
+DEFAULT_PRIME_TABLE_MAX_LIMIT = int(os.getenv("PRIME_TABLE_MAX_LIMIT", str(2 * 10**8)))
+
+
+def sieve_primes(limit: int) -> np.ndarray:
+    """
+    Generate all primes <= limit as an int64 ndarray
+
+    Only odd numbers are stored (index i represents 2i + 1) in a uint8 array,
+    and composites are struck with strided slice assignment, so sieving 10^8
+    needs ~50 MB and no per-element Python work.
+    """
+    if limit < 2:
+        return np.empty(0, dtype=np.int64)
+    if limit == 2:
+        return np.array([2], dtype=np.int64)
+
+    odd_count = (limit + 1) // 2
+    is_prime = np.ones(odd_count, dtype=np.uint8)
+    is_prime[0] = 0  # 1 is not prime
+
+    root_index = (math.isqrt(limit) - 1) // 2
+    for i in range(1, root_index + 1):
+        if is_prime[i]:
+            p = 2 * i + 1
+            is_prime[p * p // 2::p] = 0
+
+    odd_primes = np.flatnonzero(is_prime).astype(np.int64)
+    odd_primes *= 2
+    odd_primes += 1
+
+    primes = np.empty(odd_primes.size + 1, dtype=np.int64)
+    primes[0] = 2
+    primes[1:] = odd_primes
+    return primes
+
+
+def prime_count_upper_bound(limit: int) -> int:
+    """Rosser-Schoenfeld bound on pi(limit), used to preallocate prime buffers"""
+    if limit < 2:
+        return 0
+    return int(1.25506 * limit / math.log(limit)) + 1
+
+
+class PrimeSegments:
+    """
+    Segmented Sieve of Eratosthenes over an arbitrary [lo, hi) range
+
+    Iterating yields the primes of each cache-sized segment as an int64
+    ndarray, in increasing order. Only the base primes up to sqrt(hi) and a
+    single segment buffer are held in memory, however large the range is.
+    """
+
+    def __init__(self, lo: int, hi: int, segment_bytes: int = DEFAULT_SEGMENT_BYTES):
+        if segment_bytes <= 0:
+            raise ValueError("segment_bytes must be positive")
+
+        self.lo = max(lo, 0)
+        self.hi = max(hi, self.lo)
+        self.segment_span = 2 * segment_bytes
+
+        base_primes = sieve_primes(math.isqrt(self.hi - 1)) if self.hi > 1 else sieve_primes(0)
+        self._odd_base_primes = base_primes[1:]
+
+    def __iter__(self):
+        for _, _, primes in self.with_bounds():
+            yield primes
+
+    def with_bounds(self):
+        """Yield (segment_lo, segment_hi, primes) so consumers know which range is complete"""
+        for segment_lo in range(self.lo, self.hi, self.segment_span):
+            segment_hi = min(segment_lo + self.segment_span, self.hi)
+            yield segment_lo, segment_hi, self._sieve_segment(segment_lo, segment_hi)
+
+    def _sieve_segment(self, segment_lo: int, segment_hi: int) -> np.ndarray:
+        """Return the primes in [segment_lo, segment_hi)"""
+        first_odd = segment_lo | 1
+        odd_count = max(0, (segment_hi - first_odd + 1) // 2)
+
+        is_prime = np.ones(odd_count, dtype=np.uint8)
+        if first_odd == 1 and odd_count:
+            is_prime[0] = 0  # 1 is not prime
+
+        base = self._odd_base_primes
+        base = base[base * base < segment_hi]
+        if base.size and odd_count:
+            # First odd multiple of each base prime inside the segment, never below p^2
+            starts = np.maximum(base * base, -(-first_odd // base) * base)
+            starts += base * (starts % 2 == 0)
+            offsets = (starts - first_odd) // 2
+            for p, offset in zip(base.tolist(), offsets.tolist()):
+                if offset < odd_count:
+                    is_prime[offset::p] = 0
+
+        primes = np.flatnonzero(is_prime).astype(np.int64)
+        primes *= 2
+        primes += first_odd
+
+        if segment_lo <= 2 < segment_hi:
+            primes = np.concatenate((np.array([2], dtype=np.int64), primes))
+        return primes
+
+
+class PrimeTable:
+    """
+    Process-wide, incrementally extended prime table backed by a memory-mapped .npy file
+
+    The file holds one int64 array: element 0 is the sieve limit the table
+    covers and the remaining elements are every prime up to that limit.
+    Extensions sieve only the new range, are written to a temporary file and
+    atomically renamed into place, so other processes (uvicorn workers,
+    process-pool children) map the same read-only pages and pick up a larger
+    table without re-sieving.
+    """
+
+    def __init__(self, path: Optional[str] = None, max_limit: int = DEFAULT_PRIME_TABLE_MAX_LIMIT):
+        self.path = path or DEFAULT_PRIME_TABLE_PATH
+        self.max_limit = max_limit
+
+        self._lock = threading.Lock()
+        self._table = None
+        self._limit = 0
+
+        # Savings counters
+        self.hits = 0
+        self.extends = 0
+        self.disk_loads = 0
+        self.primes_sieved = 0
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def primes_up_to(self, limit: int) -> np.ndarray:
+        """Return a read-only view of every prime <= limit, extending the table if needed"""
+        if limit > self.max_limit:
+            raise ValueError(f"Prime table limit {limit} exceeds maximum {self.max_limit}")
+        if limit < 2:
+            return np.empty(0, dtype=np.int64)
+
+        with self._lock:
+            if limit <= self._limit:
+                self.hits += 1
+            elif self._load_from_disk() and limit <= self._limit:
+                self.disk_loads += 1
+            else:
+                self._extend(limit)
+
+            primes = self._table[1:]
+            return primes[:np.searchsorted(primes, limit, side='right')]
+
+    def segments(self, lo: int, hi: int, segment_bytes: int = DEFAULT_SEGMENT_BYTES):
+        """
+        Yield (segment_lo, segment_hi, primes) over [lo, hi) like PrimeSegments.with_bounds
+
+        Ranges the table can cover are served as slices of the shared table;
+        larger ranges fall back to sieving segment by segment.
+        """
+        if hi - 1 > self.max_limit:
+            yield from PrimeSegments(lo, hi, segment_bytes).with_bounds()
+            return
+
+        primes = self.primes_up_to(max(hi - 1, 0))
+        span = 2 * segment_bytes
+        for segment_lo in range(max(lo, 0), hi, span):
+            segment_hi = min(segment_lo + span, hi)
+            start, stop = np.searchsorted(primes, (segment_lo, segment_hi))
+            yield segment_lo, segment_hi, primes[start:stop]
+
+    def indicator(self, lo: int, hi: int) -> np.ndarray:
+        """Boolean primality indicator for [lo, hi); entry i says whether lo + i is prime"""
+        lo = max(lo, 0)
+        is_prime = np.zeros(max(hi - lo, 0), dtype=bool)
+        for _, _, primes in self.segments(lo, hi):
+            is_prime[primes - lo] = True
+        return is_prime
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get table size and hit/extend counters"""
+        lookups = self.hits + self.disk_loads + self.extends
+        return {
+            'path': self.path,
+            'limit': self._limit,
+            'primeCount': 0 if self._table is None else int(self._table.size - 1),
+            'hits': self.hits,
+            'extends': self.extends,
+            'diskLoads': self.disk_loads,
+            'primesSieved': self.primes_sieved,
+            'hitRate': round((self.hits + self.disk_loads) / lookups, 4) if lookups else 0.0
+        }
+
+    def _load_from_disk(self) -> bool:
+        """Map the on-disk table if it covers more than the one already mapped"""
+        try:
+            table = np.load(self.path, mmap_mode='r')
+        except (OSError, ValueError):
+            return False
+
+        if table.size == 0 or int(table[0]) <= self._limit:
+            return False
+
+        self._table = table
+        self._limit = int(table[0])
+        return True
+
+    def _extend(self, limit: int):
+        """Sieve the range above the current limit and publish the larger table"""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        with _file_lock(self.path + '.lock'):
+            # Another process may have extended the table while we waited for the lock
+            self._load_from_disk()
+            if limit <= self._limit:
+                self.disk_loads += 1
+                return
+
+            # Grow geometrically so runs at increasing difficulty extend rarely
+            new_limit = min(max(limit, 2 * self._limit, 1 << 20), self.max_limit)
+            new_primes = [segment for segment in PrimeSegments(self._limit + 1, new_limit + 1) if segment.size]
+            new_count = sum(segment.size for segment in new_primes)
+            old_count = 0 if self._table is None else self._table.size - 1
+
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.npy')
+            os.close(fd)
+            try:
+                table = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=np.int64, shape=(1 + old_count + new_count,))
+                table[0] = new_limit
+                if old_count:
+                    table[1:1 + old_count] = self._table[1:]
+                offset = 1 + old_count
+                for segment in new_primes:
+                    table[offset:offset + segment.size] = segment
+                    offset += segment.size
+                table.flush()
+                del table
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+
+            self._table = np.load(self.path, mmap_mode='r')
+            self._limit = new_limit
+            self.extends += 1
+            self.primes_sieved += new_count
+
+        logger.info(f"🔢 PRIME TABLE: Extended to {new_limit} ({old_count + new_count} primes)")
+
+
+@contextmanager
+def _file_lock(path: str):
+    """Exclusive advisory lock serializing table extensions across processes"""
+    if fcntl is None:
+        yield
+        return
+
+    with open(path, 'a') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+_prime_table: Optional[PrimeTable] = None
+
+
+def get_prime_table() -> PrimeTable:
+    """Get the process-wide shared prime table"""
+    global _prime_table
+    if _prime_table is None:
+        _prime_table = PrimeTable()
+    return _prime_table
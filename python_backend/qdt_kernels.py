@@ -0,0 +1,104 @@
+"""
+QDT Kernels - NumPy Implementation
+Whole-array QDT analytics kernels shared by the real mathematical engines
+"""
+
+import logging
+from typing import Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def gap_energies(gaps: np.ndarray, alpha: float, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """QDT gap energy sin(alpha * g) * exp(-g / 100) for every gap, written into `out` if given"""
+    gaps = np.asarray(gaps, dtype=np.float64)
+    if out is None:
+        out = np.empty(gaps.shape, dtype=np.float64)
+    decay = np.empty_like(out)
+
+    np.multiply(gaps, alpha, out=out)
+    np.sin(out, out=out)
+    np.multiply(gaps, -0.01, out=decay)
+    np.exp(decay, out=decay)
+    np.multiply(out, decay, out=out)
+    return out
+
+
+def ratio_deviations(ratios: np.ndarray, target: float, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Absolute deviation |r - target| of every ratio, written into `out` if given"""
+    ratios = np.asarray(ratios, dtype=np.float64)
+    if out is None:
+        out = np.empty(ratios.shape, dtype=np.float64)
+
+    np.subtract(ratios, target, out=out)
+    np.abs(out, out=out)
+    return out
+
+
+def weighted_mean_std(values: np.ndarray, weights: Optional[np.ndarray] = None) -> Tuple[float, float]:
+    """Mean and population standard deviation, optionally weighted by occurrence counts"""
+    values = np.asarray(values, dtype=np.float64)
+    if weights is None:
+        mean = float(values.mean())
+        centered = np.subtract(values, mean)
+        np.square(centered, out=centered)
+        return mean, float(np.sqrt(centered.mean()))
+
+    weights = np.asarray(weights, dtype=np.float64)
+    total = weights.sum()
+    mean = float(np.dot(weights, values) / total)
+    centered = np.subtract(values, mean)
+    np.square(centered, out=centered)
+    return mean, float(np.sqrt(np.dot(weights, centered) / total))
+
+
+def gap_resonance(gaps: np.ndarray, alpha: float, lambda_param: float,
+                  counts: Optional[np.ndarray] = None) -> Tuple[float, float, float]:
+    """
+    Return (resonance strength, pattern coherence, energy spread) for a set of prime gaps
+
+    `gaps` is either every gap, or the distinct gap values with their
+    occurrence `counts`; both give the same statistics.
+    """
+    energies = gap_energies(gaps, alpha)
+    energy_mean, energy_std = weighted_mean_std(energies, counts)
+    np.abs(energies, out=energies)
+    strength, _ = weighted_mean_std(energies, counts)
+
+    gap_mean, gap_std = weighted_mean_std(gaps, counts)
+    coherence = lambda_param * gap_std / gap_mean if gap_mean > 0 else 0
+    return strength, coherence, energy_std
+
+
+def fibonacci_resonance(ratios: np.ndarray, beta: float, phi: float) -> Tuple[float, float, float]:
+    """Return (fractal dimension, pattern stability, convergence quality) of ratios around phi"""
+    deviations = ratio_deviations(ratios, phi)
+    if not deviations.size:
+        return 0, 1.0, 1.0
+
+    total = float(deviations.sum())
+    fractal_dimension = beta * np.log(deviations.size) / np.log(total) if total > 0 else 0
+    mean, std = weighted_mean_std(deviations)
+    return fractal_dimension, 1.0 / (1.0 + std), 1.0 - mean
+
+
+def collatz_patterns(steps: np.ndarray, max_values: np.ndarray, gamma: float) -> Tuple[float, float, float]:
+    """Return (pattern strength, energy balance, steps/peak correlation) for Collatz trajectories"""
+    steps_mean, steps_std = weighted_mean_std(steps)
+    peaks_mean, peaks_std = weighted_mean_std(max_values)
+
+    pattern_strength = gamma * steps_std / steps_mean if steps_mean > 0 else 0
+    energy_balance = 1.0 / (1.0 + peaks_std**2 / peaks_mean**2) if peaks_mean > 0 else 0
+
+    if steps.size < 2:
+        return pattern_strength, energy_balance, 0
+
+    # Pearson correlation from centered buffers, without stacking the two series
+    centered_steps = np.subtract(steps, steps_mean, dtype=np.float64)
+    centered_peaks = np.subtract(max_values, peaks_mean, dtype=np.float64)
+    covariance = float(np.dot(centered_steps, centered_peaks))
+    scale = float(np.sqrt(np.dot(centered_steps, centered_steps) * np.dot(centered_peaks, centered_peaks)))
+    correlation = covariance / scale if scale > 0 else float('nan')
+    return pattern_strength, energy_balance, correlation
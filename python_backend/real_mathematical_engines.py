@@ -4,14 +4,28 @@ Implements tractable mathematical computations for productive mining
 """
 
 import logging
+import os
 import time
 import hashlib
-from typing import Dict, Any, List, Tuple
+import json
+from typing import Dict, Any, List, Optional, Tuple
 import numpy as np
 from datetime import datetime
 
+from collatz_engine import CollatzEngine
+from deadline import Deadline
+from fibonacci_engine import FibonacciEngine, decimal_digits, fibonacci_lucas, summarize_int
+from goldbach_engine import GoldbachVerifier
+from prime_gap_stats import PrimeGapStatistics
+from prime_sieve import get_prime_table, sieve_primes
+import qdt_kernels
+
 logger = logging.getLogger(__name__)
 
+def result_signature(computation_result: Dict[str, Any]) -> str:
+    """SHA-256 over a computationResult's sorted JSON; lets the coordinator re-check results from remote workers"""
+    return hashlib.sha256(json.dumps(computation_result, sort_keys=True, default=str).encode()).hexdigest()
+
 class RealMathematicalEngines:
     """
     Real mathematical computation engines for tractable problems
@@ -26,10 +40,32 @@ class RealMathematicalEngines:
             'lambda': 0.867,    # QDT coupling constant
             'phi': 1.618033988749895  # Golden ratio
         }
+        
+        # Shared, incrementally extended prime table (memory-mapped across processes)
+        self.prime_table = get_prime_table()
+        self.goldbach_verifier = GoldbachVerifier(self.prime_table)
+        self.collatz_engine = CollatzEngine()
+        self.fibonacci_engine = FibonacciEngine()
+        
+        # Goldbach pair counting ("averagePairs") is optional and budgeted apart from verification
+        self.goldbach_settings = {
+            'pair_mode': os.getenv('GOLDBACH_PAIR_MODE', 'fft'),    # fft | exhaustive | none
+            'pair_limit': int(os.getenv('GOLDBACH_PAIR_LIMIT', '1000000')),
+            'pair_budget_seconds': float(os.getenv('GOLDBACH_PAIR_BUDGET', '5'))
+        }
         logger.info("🔬 REAL ENGINES: Initialized for tractable mathematical computation")
     
-    def compute_real_mathematics(self, work_type: str, difficulty: int) -> Dict[str, Any]:
-        """Route to specific real mathematical computation"""
+    def compute_real_mathematics(
+        self, work_type: str, difficulty: int, deadline: Optional[Deadline] = None, **options
+    ) -> Dict[str, Any]:
+        """
+        Route to specific real mathematical computation, passing engine-specific options through
+        
+        Range-based engines stop between chunks when the deadline expires or
+        is cancelled and return the prefix covered so far, with 'complete'
+        False and 'stopReason' set. Work without a partial result raises
+        ComputationCancelled instead.
+        """
         
         computation_methods = {
             'goldbach_verification': self._compute_goldbach_verification,
@@ -42,8 +78,9 @@ class RealMathematicalEngines:
             raise ValueError(f"Real computation not available for: {work_type}")
         
         start_time = time.time()
-        result = computation_methods[work_type](difficulty)
+        result = computation_methods[work_type](difficulty, deadline=deadline or Deadline(), **options)
         computation_time = time.time() - start_time
+        stop_reason = result['verificationData'].get('stopReason')
         
         # Add metadata
         result['computationTime'] = computation_time
@@ -52,72 +89,90 @@ class RealMathematicalEngines:
         result['timestamp'] = datetime.now().isoformat()
         result['energyConsumed'] = computation_time * 0.08  # kWh estimate
         result['realComputation'] = True  # Mark as real computation
+        result['complete'] = stop_reason is None
+        result['stopReason'] = stop_reason
+        result['signature'] = result_signature(result['computationResult'])
         
         return result
     
-    def _compute_goldbach_verification(self, difficulty: int) -> Dict[str, Any]:
-        """Actually verify Goldbach conjecture for even numbers"""
+    def get_frontier_span(self, work_type: str, difficulty: int) -> Optional[int]:
+        """Integers one resumable operation covers at this difficulty, or None if the work type is not resumable"""
+        spans = {
+            'goldbach_verification': 1000 + (difficulty * 100000),
+            'collatz_verification': 1000 + (difficulty * 100000)
+        }
+        return spans.get(work_type)
+    
+    def supports_checkpoints(self, work_type: str) -> bool:
+        """Whether the work type takes a time_budget and returns a checkpoint to resume from when it runs out"""
+        return work_type in ('prime_gap_analysis',)
+    
+    def _compute_goldbach_verification(
+        self, difficulty: int, deadline: Deadline, pair_mode: Optional[str] = None,
+        interval: Optional[Tuple[int, int]] = None
+    ) -> Dict[str, Any]:
+        """Actually verify Goldbach conjecture for even numbers, from 4 or over an assigned [start, end) interval"""
         
         # Scale range based on difficulty
-        max_even = 1000 + (difficulty * 2000)  # Up to ~400k for difficulty 200
-        
-        verified_count = 0
-        total_pairs = 0
-        failures = []
-        largest_verified = 0
-        
-        start_time = time.time()
-        
-        # Generate primes up to max_even using Sieve of Eratosthenes
-        primes = self._sieve_of_eratosthenes(max_even)
-        prime_set = set(primes)
-        
-        # Verify Goldbach conjecture for even numbers
-        for even_num in range(4, max_even + 1, 2):
-            pairs_found = 0
-            
-            for prime in primes:
-                if prime > even_num // 2:
-                    break
-                    
-                complement = even_num - prime
-                if complement in prime_set:
-                    pairs_found += 1
-                    
-            if pairs_found > 0:
-                verified_count += 1
-                largest_verified = even_num
-                total_pairs += pairs_found
-            else:
-                failures.append(even_num)
-                
-            # Break if taking too long (safety measure)
-            if time.time() - start_time > 30:
-                break
-        
-        total_tested = (even_num - 2) // 2
+        max_even = 1000 + (difficulty * 100000)  # Up to ~100M for difficulty 1000
+        range_start, range_end = interval if interval else (4, max_even + 1)
+        
+        # Verify by minimal partitions over whole blocks of even numbers (30s safety budget)
+        verification = self.goldbach_verifier.verify_range(range_start, range_end, time_budget=30, deadline=deadline)
+        first_even, covered_end = verification['coveredRange']
+        last_even = covered_end - 1
+        last_even -= last_even & 1
+        
+        failures = verification['failureNumbers']
+        verified_count = verification['verified']
+        total_tested = verification['totalTested']
         success_rate = verified_count / total_tested if total_tested > 0 else 0
-        avg_pairs = total_pairs / verified_count if verified_count > 0 else 0
         
         result = {
-            'testedRange': [4, even_num],
+            'testedRange': [first_even, last_even],
             'totalTested': total_tested,
             'verified': verified_count,
             'failures': len(failures),
             'successRate': round(success_rate, 6),
-            'largestVerified': largest_verified,
-            'averagePairs': round(avg_pairs, 2),
+            'largestVerified': verification['largestVerified'],
             'failureNumbers': failures[:10],  # First 10 failures if any
-            'primesUsed': len(primes)
+            'minimalPartitions': {
+                'maxMinimalPrime': verification['maxMinimalPrime'],
+                'maxMinimalPrimeAt': verification['maxMinimalPrimeAt'],
+                'meanMinimalPrime': round(verification['meanMinimalPrime'], 4)
+            },
+            'primesUsed': int(self.prime_table.primes_up_to(min(last_even, self.prime_table.max_limit)).size)
         }
         
+        # Optional pair counting, budgeted separately from verification
+        pair_mode = pair_mode or self.goldbach_settings['pair_mode']
+        if pair_mode != 'none':
+            pair_counters = {
+                'fft': self.goldbach_verifier.count_pairs_fft,
+                'exhaustive': self.goldbach_verifier.count_pairs_exhaustive
+            }
+            if pair_mode not in pair_counters:
+                raise ValueError(f"Unknown Goldbach pair mode: {pair_mode}")
+            
+            pair_limit = min(last_even, self.goldbach_settings['pair_limit'])
+            if pair_limit >= first_even and not deadline.expired():
+                pairs = pair_counters[pair_mode](
+                    first_even, pair_limit + 1, time_budget=self.goldbach_settings['pair_budget_seconds'],
+                    deadline=deadline
+                )
+                result['averagePairs'] = round(pairs['averagePairs'], 2)
+                result['totalPairs'] = pairs['totalPairs']
+                result['pairCounting'] = {k: v for k, v in pairs.items() if k not in ('averagePairs', 'totalPairs')}
+        
         verification_data = {
             'theorem': 'goldbach_conjecture',
             'verified': len(failures) == 0,
             'statement': 'Every even integer > 2 is sum of two primes',
             'counterexamplesFound': len(failures),
-            'method': 'exhaustive_prime_search',
-            'primeSieveSize': max_even,
+            'method': 'vectorized_minimal_partition_search',
+            'primeSieveSize': range_end - 1,
+            'interval': {'assigned': [range_start, range_end], 'covered': [range_start, covered_end]},
+            'stopReason': verification['stopReason'],
             'independentVerification': True
         }
         
@@ -126,106 +181,120 @@ class RealMathematicalEngines:
             'verificationData': verification_data
         }
     
-    def _compute_prime_gap_analysis(self, difficulty: int) -> Dict[str, Any]:
-        """Analyze gaps between consecutive primes"""
+    def _compute_prime_gap_analysis(
+        self, difficulty: int, deadline: Deadline, search_limit: Optional[int] = None,
+        checkpoint: Optional[Dict[str, Any]] = None, time_budget: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Analyze gaps between consecutive primes in constant memory
         
-        # Scale range based on difficulty  
-        max_prime_search = 10000 + (difficulty * 2000)  # Up to ~310k for difficulty 150
-        
-        start_time = time.time()
+        search_limit overrides the difficulty-scaled range (up to ~10^10), and
+        a checkpoint returned by an interrupted run resumes where it stopped.
+        """
         
-        # Generate primes
-        primes = self._sieve_of_eratosthenes(max_prime_search)
-        
-        # Calculate gaps
-        gaps = []
-        for i in range(1, len(primes)):
-            gap = primes[i] - primes[i-1]
-            gaps.append(gap)
+        # Scale range based on difficulty  
+        max_prime_search = search_limit or 10000 + (difficulty * 2000)  # Up to ~2M for difficulty 1000
         
-        # Statistical analysis
-        gaps_array = np.array(gaps)
-        mean_gap = np.mean(gaps_array)
-        std_gap = np.std(gaps_array)
-        max_gap = np.max(gaps_array)
-        min_gap = np.min(gaps_array)
+        deadline = Deadline.bound(deadline, time_budget)
         
-        # Find twin primes (gap = 2)
-        twin_primes = sum(1 for gap in gaps if gap == 2)
+        # Stream primes segment by segment into running aggregates; nothing proportional to the range is kept
+        gap_stats = PrimeGapStatistics.from_state(checkpoint) if checkpoint else PrimeGapStatistics(2)
+        for _, segment_hi, segment in self.prime_table.segments(gap_stats.position, max_prime_search + 1):
+            gap_stats.consume(segment, segment_hi)
+            if deadline.expired():
+                break
+        complete = gap_stats.position > max_prime_search
         
         # Gap distribution
-        unique_gaps, gap_counts = np.unique(gaps_array, return_counts=True)
+        unique_gaps, gap_counts = gap_stats.distribution()
         gap_distribution = dict(zip(unique_gaps.tolist(), gap_counts.tolist()))
         
         # QDT-enhanced analysis using your constants
-        qdt_resonance = self._analyze_gap_resonance(gaps_array)
+        qdt_resonance = self._analyze_gap_resonance(unique_gaps, gap_counts)
         
         result = {
-            'primeCount': len(primes),
+            'primeCount': gap_stats.prime_count,
             'searchRange': [2, max_prime_search],
             'gapStatistics': {
-                'mean': round(mean_gap, 3),
-                'standardDeviation': round(std_gap, 3),
-                'maximum': int(max_gap),
-                'minimum': int(min_gap)
+                'mean': round(gap_stats.mean, 3),
+                'standardDeviation': round(gap_stats.std, 3),
+                'maximum': gap_stats.max_gap,
+                'minimum': gap_stats.min_gap or 0
             },
-            'twinPrimes': twin_primes,
-            'largestPrime': primes[-1],
+            'twinPrimes': gap_stats.twin_primes,
+            'largestPrime': gap_stats.last_prime,
+            'maximalGaps': gap_stats.records,
             'gapDistribution': {str(k): v for k, v in gap_distribution.items() if k <= 20},
             'qdtResonance': qdt_resonance
         }
         
         verification_data = {
             'theorem': 'prime_gap_analysis',
-            'verified': True,
-            'method': 'sieve_of_eratosthenes_with_gap_calculation',
-            'totalGapsAnalyzed': len(gaps),
-            'gapDistributionComplete': len(gap_distribution) == len(unique_gaps),
+            'verified': complete,
+            'method': 'streaming_segmented_gap_statistics',
+            'totalGapsAnalyzed': gap_stats.gap_count,
+            'gapDistributionComplete': True,
+            'coveredRange': [2, min(gap_stats.position - 1, max_prime_search)],
+            'stopReason': None if complete else deadline.reason,
             'independentVerification': True
         }
+        if not complete:
+            verification_data['checkpoint'] = gap_stats.to_state()
         
         return {
             'computationResult': result,
             'verificationData': verification_data
         }
     
-    def _compute_fibonacci_patterns(self, difficulty: int) -> Dict[str, Any]:
-        """Analyze Fibonacci sequence patterns and golden ratio convergence"""
-        
-        # Scale sequence length based on difficulty
-        sequence_length = 100 + (difficulty * 10)  # Up to 3100 terms for difficulty 300
+    def _compute_fibonacci_patterns(
+        self, difficulty: int, deadline: Deadline, precision: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Analyze Fibonacci sequence patterns and golden ratio convergence by fast doubling
         
-        start_time = time.time()
+        There is no partial result, so the deadline is checked between the
+        big-integer stages and raises ComputationCancelled.
+        """
         
-        # Generate Fibonacci sequence
-        fib = [0, 1]
-        for i in range(2, sequence_length):
-            fib.append(fib[i-1] + fib[i-2])
+        # Scale sequence length based on difficulty
+        sequence_length = 100 + (difficulty * 3000)  # Up to ~900K terms (about a second) for difficulty 300
+        last_index = sequence_length - 1
+        engine = FibonacciEngine(precision) if precision else self.fibonacci_engine
         
-        # Golden ratio analysis
-        ratios = []
-        for i in range(2, len(fib)):
-            if fib[i-1] != 0:
-                ratio = fib[i] / fib[i-1]
-                ratios.append(ratio)
+        # Only the last ~100 terms are materialized, stepped forward from F(start) by fast doubling
+        tail_start = max(last_index - 100, 1)
+        tail = engine.terms(tail_start, last_index - tail_start + 1)
+        ratios = [tail[i] / tail[i-1] for i in range(1, len(tail))]
         
         # Convergence to golden ratio
         golden_ratio = self.constants['phi']
-        ratio_errors = [abs(r - golden_ratio) for r in ratios[-50:]]  # Last 50 ratios
+        ratio_errors = qdt_kernels.ratio_deviations(ratios[-50:], golden_ratio)  # Last 50 ratios
         convergence_rate = np.mean(ratio_errors)
         
+        # Exact convergence digits at the configured precision
+        deadline.check()
+        ratio_analysis = engine.ratio_analysis(last_index)
+        
         # Pattern analysis using QDT constants
-        pattern_resonance = self._analyze_fibonacci_resonance(fib, ratios)
+        pattern_resonance = self._analyze_fibonacci_resonance(tail, ratios)
+        
+        # Lucas numbers relationship: F(n)/L(n) -> 1/sqrt(5)
+        deadline.check()
+        largest_fibonacci, lucas = fibonacci_lucas(last_index)
+        fibonacci_lucas_ratio = largest_fibonacci / lucas
         
-        # Lucas numbers relationship
-        lucas = self._generate_lucas_sequence(min(sequence_length, 1000))
-        fibonacci_lucas_ratio = fib[min(50, len(fib)-1)] / lucas[min(50, len(lucas)-1)] if len(lucas) > 50 else 1.0
+        # Identity checks at sampled indices instead of re-adding the sequence; the doubling
+        # identity evaluates F(2n), so sampling at most last_index // 2 stays within F(last_index)
+        deadline.check()
+        identity_checks = engine.check_identities(sorted({2, 10, last_index // 6, last_index // 4, last_index // 2}))
         
         result = {
             'sequenceLength': sequence_length,
-            'largestFibonacci': fib[-1] if fib else 0,
+            'largestFibonacci': summarize_int(largest_fibonacci),
+            'largestFibonacciDigits': decimal_digits(largest_fibonacci),
             'goldenRatioApproximation': round(ratios[-1], 10) if ratios else 0,
             'convergenceRate': round(convergence_rate, 10),
+            'ratioAnalysis': ratio_analysis,
             'patternResonance': pattern_resonance,
             'fibonacciLucasRatio': round(fibonacci_lucas_ratio, 6),
             'lastTenRatios': [round(r, 6) for r in ratios[-10:]] if len(ratios) >= 10 else ratios
@@ -235,8 +304,10 @@ class RealMathematicalEngines:
             'theorem': 'fibonacci_golden_ratio_convergence',
             'verified': True,
             'goldenRatioTarget': golden_ratio,
-            'convergenceConfirmed': convergence_rate < 0.001,
-            'sequenceValid': all(fib[i] == fib[i-1] + fib[i-2] for i in range(2, min(100, len(fib)))),
+            'convergenceConfirmed': bool(convergence_rate < 0.001),
+            'sequenceValid': identity_checks['valid'],
+            'identityChecks': identity_checks,
+            'method': 'fast_doubling_with_identity_checks',
             'independentVerification': True
         }
         
@@ -245,45 +316,41 @@ class RealMathematicalEngines:
             'verificationData': verification_data
         }
     
-    def _compute_collatz_verification(self, difficulty: int) -> Dict[str, Any]:
-        """Verify Collatz conjecture for multiple starting numbers"""
-        
-        # Scale range based on difficulty
-        max_start = 1000 + (difficulty * 2000)  # Up to ~200k for difficulty 100
-        
-        start_time = time.time()
-        
-        verified_count = 0
-        total_steps = 0
-        max_steps = 0
-        failures = []
-        convergence_data = []
-        
-        for n in range(1, max_start + 1):
-            steps, path_length, converged = self._collatz_sequence(n, max_iterations=10000)
-            
-            if converged:
-                verified_count += 1
-                total_steps += steps
-                max_steps = max(max_steps, steps)
-                convergence_data.append({'start': n, 'steps': steps, 'max_value': path_length})
-            else:
-                failures.append(n)
-            
-            # Safety break for long computations
-            if time.time() - start_time > 20:
-                break
-        
-        total_tested = n
+    def _compute_collatz_verification(
+        self, difficulty: int, deadline: Deadline, interval: Optional[Tuple[int, int]] = None
+    ) -> Dict[str, Any]:
+        """Verify Collatz conjecture for multiple starting numbers, from 1 or over an assigned [start, end) interval"""
+        
+        # Scale range based on difficulty (residue sieve iterates only ~3% of starts)
+        max_start = 1000 + (difficulty * 100000)  # Up to ~10^8 for difficulty 1000
+        range_start, range_end = interval if interval else (1, max_start + 1)
+        
+        # Batched lockstep trajectories, finished from the memoized stopping-time table;
+        # above the table only residue classes mod 2^k that may not drop below their start are iterated
+        engine = self.collatz_engine
+        verification = self.collatz_engine.verify_range(range_start, range_end, time_budget=20, deadline=deadline)
+        steps = verification['steps']
+        failures = verification['failureNumbers']
+        covered_end = verification['coveredRange'][1]
+        
+        total_tested = verification['totalTested']
+        verified_count = verification['verified']
         convergence_rate = verified_count / total_tested if total_tested > 0 else 0
-        avg_steps = total_steps / verified_count if verified_count > 0 else 0
+        avg_steps = float(steps.mean()) if verified_count > 0 else 0
+        max_steps = int(steps.max()) if verified_count > 0 else 0
         
         # QDT analysis of convergence patterns
-        qdt_analysis = self._analyze_collatz_qdt_patterns(convergence_data)
+        qdt_analysis = self._analyze_collatz_qdt_patterns(steps, verification['maxValues'])
         
         result = {
-            'testedRange': [1, total_tested],
+            'testedRange': [range_start, covered_end - 1],
             'totalTested': total_tested,
+            'valuesCovered': total_tested,
+            'valuesIterated': verification['valuesIterated'],
+            'residueSieve': {
+                'bits': engine.sieve_bits,
+                'survivingClasses': int(engine.survivors.size) if engine.sieve_bits else 0
+            },
             'verified': verified_count,
             'failures': len(failures),
             'convergenceRate': round(convergence_rate, 6),
@@ -299,7 +366,9 @@ class RealMathematicalEngines:
             'statement': 'All positive integers eventually reach 1',
             'counterexamplesFound': len(failures),
             'maxIterationsAllowed': 10000,
-            'method': 'direct_sequence_computation',
+            'method': 'residue_sieve_with_batched_stopping_times' if engine.sieve_bits else 'batched_stopping_time_memoization',
+            'interval': {'assigned': [range_start, range_end], 'covered': [range_start, covered_end]},
+            'stopReason': verification['stopReason'],
             'independentVerification': True
         }
         
@@ -308,108 +377,51 @@ class RealMathematicalEngines:
             'verificationData': verification_data
         }
     
-    def _sieve_of_eratosthenes(self, limit: int) -> List[int]:
-        """Generate primes up to limit using Sieve of Eratosthenes"""
-        if limit < 2:
-            return []
-        
-        sieve = [True] * (limit + 1)
-        sieve[0] = sieve[1] = False
-        
-        for i in range(2, int(limit**0.5) + 1):
-            if sieve[i]:
-                for j in range(i*i, limit + 1, i):
-                    sieve[j] = False
-        
-        return [i for i in range(2, limit + 1) if sieve[i]]
+    def _sieve_of_eratosthenes(self, limit: int) -> np.ndarray:
+        """Generate primes up to limit using the vectorized odd-only sieve"""
+        return sieve_primes(limit)
     
-    def _analyze_gap_resonance(self, gaps: np.ndarray) -> Dict[str, float]:
-        """Analyze prime gaps using QDT constants"""
+    def _analyze_gap_resonance(self, gap_values: np.ndarray, gap_counts: np.ndarray) -> Dict[str, float]:
+        """Analyze prime gaps using QDT constants, from the (gap value, count) distribution"""
         
-        # Apply QDT resonance analysis
-        alpha = self.constants['alpha']
-        lambda_param = self.constants['lambda']
+        if not gap_counts.size:
+            return {'resonanceStrength': 0.0, 'patternCoherence': 0, 'energyDistribution': 0.0}
         
-        # Calculate resonance patterns
-        gap_energies = np.array([np.sin(alpha * gap) * np.exp(-gap/100) for gap in gaps])
-        resonance_strength = np.mean(np.abs(gap_energies))
-        
-        # Pattern coherence
-        coherence = lambda_param * np.std(gaps) / np.mean(gaps) if np.mean(gaps) > 0 else 0
+        # Apply QDT resonance analysis (each distinct gap's energy, weighted by how often it occurs)
+        resonance_strength, coherence, energy_spread = qdt_kernels.gap_resonance(
+            gap_values, self.constants['alpha'], self.constants['lambda'], counts=gap_counts
+        )
         
         return {
             'resonanceStrength': round(resonance_strength, 6),
             'patternCoherence': round(coherence, 6),
-            'energyDistribution': round(np.std(gap_energies), 6)
+            'energyDistribution': round(energy_spread, 6)
         }
     
     def _analyze_fibonacci_resonance(self, fib: List[int], ratios: List[float]) -> Dict[str, float]:
         """Analyze Fibonacci patterns using QDT constants"""
         
-        beta = self.constants['beta']
-        phi = self.constants['phi']
-        
-        # Fractal analysis of ratios
-        ratio_deviations = [abs(r - phi) for r in ratios[-100:]]
-        fractal_dimension = beta * np.log(len(ratio_deviations)) / np.log(np.sum(ratio_deviations)) if np.sum(ratio_deviations) > 0 else 0
-        
-        # Pattern stability
-        stability = 1.0 / (1.0 + np.std(ratio_deviations)) if ratio_deviations else 1.0
+        # Fractal analysis and stability of the last 100 ratios
+        fractal_dimension, stability, convergence_quality = qdt_kernels.fibonacci_resonance(
+            ratios[-100:], self.constants['beta'], self.constants['phi']
+        )
         
         return {
             'fractalDimension': round(fractal_dimension, 6),
             'patternStability': round(stability, 6),
-            'convergenceQuality': round(1.0 - np.mean(ratio_deviations), 6) if ratio_deviations else 1.0
+            'convergenceQuality': round(convergence_quality, 6)
         }
     
-    def _generate_lucas_sequence(self, length: int) -> List[int]:
-        """Generate Lucas sequence: L(0)=2, L(1)=1, L(n)=L(n-1)+L(n-2)"""
-        if length <= 0:
-            return []
-        elif length == 1:
-            return [2]
-        
-        lucas = [2, 1]
-        for i in range(2, length):
-            lucas.append(lucas[i-1] + lucas[i-2])
-        
-        return lucas
-    
-    def _collatz_sequence(self, n: int, max_iterations: int = 10000) -> Tuple[int, int, bool]:
-        """Compute Collatz sequence until 1 or max_iterations"""
-        
-        steps = 0
-        max_value = n
-        current = n
-        
-        while current != 1 and steps < max_iterations:
-            if current % 2 == 0:
-                current = current // 2
-            else:
-                current = 3 * current + 1
-            
-            max_value = max(max_value, current)
-            steps += 1
-        
-        converged = (current == 1)
-        return steps, max_value, converged
-    
-    def _analyze_collatz_qdt_patterns(self, convergence_data: List[Dict]) -> Dict[str, float]:
+    def _analyze_collatz_qdt_patterns(self, steps: np.ndarray, max_values: np.ndarray) -> Dict[str, float]:
         """Analyze Collatz convergence using QDT principles"""
         
-        if not convergence_data:
+        if not steps.size:
             return {'patternStrength': 0, 'energyBalance': 0, 'chaosOrder': 0}
         
-        gamma = self.constants['gamma']
-        
-        # Extract steps and max values
-        steps = [d['steps'] for d in convergence_data]
-        max_values = [d['max_value'] for d in convergence_data]
-        
         # QDT analysis
-        pattern_strength = gamma * np.std(steps) / np.mean(steps) if np.mean(steps) > 0 else 0
-        energy_balance = 1.0 / (1.0 + np.var(max_values) / np.mean(max_values)**2) if np.mean(max_values) > 0 else 0
-        chaos_order = np.corrcoef(steps, max_values)[0,1] if len(steps) > 1 else 0
+        pattern_strength, energy_balance, chaos_order = qdt_kernels.collatz_patterns(
+            steps, max_values, self.constants['gamma']
+        )
         
         return {
             'patternStrength': round(pattern_strength, 6),
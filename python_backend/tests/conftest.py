@@ -0,0 +1,9 @@
+"""
+Test configuration - Python Implementation
+Puts the flat python_backend modules on sys.path, as run_python.py does
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
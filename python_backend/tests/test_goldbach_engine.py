@@ -0,0 +1,48 @@
+"""
+Goldbach Engine Tests - Python Implementation
+FFT representation counts against the exhaustive per-number count on small ranges
+"""
+
+import numpy as np
+import pytest
+
+from goldbach_engine import GoldbachVerifier, ordered_sum_counts_fft
+from prime_sieve import PrimeTable
+
+# Small enough that the ranges below span several overlap-add chunks
+FFT_CHUNK = 256
+
+
+@pytest.fixture(scope="module")
+def prime_table(tmp_path_factory):
+    return PrimeTable(path=str(tmp_path_factory.mktemp("primes") / "primes.npy"))
+
+
+@pytest.mark.parametrize("lo, hi", [
+    (4, 5001),     # the range the exhaustive method was checked on by hand
+    (4, 5),        # a single even number
+    (3, 100),      # odd start
+    (250, 777),    # unaligned endpoints crossing the 256 and 512 chunk boundaries
+    (511, 1030),   # odd start just below a boundary, odd end
+    (1001, 1002),  # empty after rounding the start up to even
+])
+def test_fft_pair_counts_match_exhaustive(prime_table, lo, hi):
+    verifier = GoldbachVerifier(prime_table, fft_chunk=FFT_CHUNK)
+    fft = verifier.count_pairs_fft(lo, hi)
+    exhaustive = verifier.count_pairs_exhaustive(lo, hi)
+
+    for key in ('range', 'numbersCounted', 'totalPairs', 'averagePairs'):
+        assert fft[key] == exhaustive[key]
+
+
+def test_fft_pair_counts_with_default_chunk(prime_table):
+    verifier = GoldbachVerifier(prime_table)
+    assert verifier.count_pairs_fft(4, 5001)['totalPairs'] == verifier.count_pairs_exhaustive(4, 5001)['totalPairs'] == 127623
+
+
+@pytest.mark.parametrize("size, chunk_size", [(1, 256), (255, 256), (256, 256), (1000, 256), (1000, 7)])
+def test_chunked_convolution_matches_direct(size, chunk_size):
+    indicator = np.random.default_rng(size).integers(0, 2, size).astype(bool)
+    counts, _ = ordered_sum_counts_fft(indicator, chunk_size)
+    direct = np.convolve(indicator.astype(np.int64), indicator.astype(np.int64))[:size]
+    assert np.array_equal(counts, direct)
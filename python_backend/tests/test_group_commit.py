@@ -0,0 +1,210 @@
+"""
+Group Commit Tests - Python Implementation
+Transactions per discovery when many frontier operations write through one GroupCommitWriter,
+and shutdown draining running operations before the writer stops
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+from deadline import Deadline
+from group_commit import GroupCommitWriter
+from mining_operations import PRIORITY_AUTONOMOUS, MiningOperationManager
+from verification_frontier import claim_interval, commit_interval, new_frontier_state, release_interval
+
+ORIGIN = 4
+SPAN = 1000
+DISCOVERIES = 50
+
+
+class FakeDatabase:
+    """The DatabaseManager batch methods GroupCommitWriter calls, kept in memory and counting transactions"""
+
+    def __init__(self):
+        self.transactions = 0
+        self.operations = {}
+        self.works = []
+        self.frontiers = {}
+
+    @asynccontextmanager
+    async def _transaction(self):
+        self.transactions += 1
+        yield
+
+    def transaction(self):
+        return self._transaction()
+
+    async def create_mining_operation_batch(self, operations):
+        stored = []
+        for operation in operations:
+            row = {**operation, 'id': len(self.operations) + 1, 'claimed_interval': None}
+            self.operations[row['id']] = row
+            stored.append(row)
+        return stored
+
+    async def activate_mining_operation_batch(self, operation_ids):
+        for operation_id in operation_ids:
+            self.operations[operation_id]['status'] = 'active'
+
+    async def update_mining_operation_batch(self, updates):
+        for operation_id, progress, result in updates:
+            self.operations[operation_id].update(progress=progress, current_result=result)
+
+    async def save_operation_checkpoint_batch(self, checkpoints):
+        pass
+
+    async def create_mathematical_work_batch(self, works):
+        stored = []
+        for work in works:
+            row = {**work, 'id': len(self.works) + 1}
+            self.works.append(row)
+            stored.append(row)
+        return stored
+
+    async def complete_mining_operation_batch(self, completions):
+        for operation_id, status in completions:
+            self.operations[operation_id]['status'] = status
+
+    async def claim_verification_interval_batch(self, claims):
+        intervals = []
+        for work_type, origin, span, operation_id in claims:
+            interval = claim_interval(self.frontiers.setdefault(work_type, new_frontier_state(origin)), span)
+            self.operations[operation_id]['claimed_interval'] = list(interval)
+            intervals.append(interval)
+        return intervals
+
+    async def commit_verification_interval_batch(self, commits):
+        for work_type, origin, start, covered_end, claimed_end, operation_id in commits:
+            commit_interval(self.frontiers.setdefault(work_type, new_frontier_state(origin)), start, covered_end, claimed_end)
+            self.operations[operation_id]['claimed_interval'] = None
+        return {work_type: state['frontier'] for work_type, state in self.frontiers.items()}
+
+    async def release_verification_interval_batch(self, releases):
+        for work_type, origin, start, end, operation_id in releases:
+            release_interval(self.frontiers.setdefault(work_type, new_frontier_state(origin)), start, end)
+            self.operations[operation_id]['claimed_interval'] = None
+
+
+class FrontierEngines:
+    def get_frontier_spec(self, work_type, difficulty):
+        return ORIGIN, SPAN
+
+    def supports_checkpoints(self, work_type, difficulty):
+        return False
+
+
+class FlatValuation:
+    def calculate_scientific_value(self, **kwargs):
+        return {'computational_cost': 1.0, 'total_value': 1500.0}
+
+
+class SilentWebSocket:
+    async def broadcast(self, message):
+        pass
+
+
+class FrontierExecutor:
+    """ComputeExecutor stand-in running every frontier job on the process route"""
+
+    def __init__(self, compute, workers=2):
+        self.compute = compute
+        self.workers = workers
+        self.simulation_threads = 1
+        self.stats = {'process': {'running': 0}, 'thread': {'running': 0}}
+
+    def route(self, work_type, difficulty):
+        return 'process'
+
+
+async def _verify_interval(work_type, difficulty, deadline, interval=None, **options):
+    await asyncio.sleep(0.01)
+    return {
+        'computationResult': {'verified': True},
+        'verificationData': {'interval': {'assigned': list(interval), 'covered': list(interval)}},
+        'signature': f"{interval[0]:x}",
+        'computationTime': 0.01,
+        'energyConsumed': 0.001
+    }
+
+
+def _manager(db, compute=_verify_interval):
+    """A MiningOperationManager over the in-memory database, with its own group commit writer"""
+    return MiningOperationManager(
+        db, SilentWebSocket(), FlatValuation(), FrontierEngines(),
+        compute_executor=FrontierExecutor(compute), group_commit=GroupCommitWriter(db)
+    )
+
+
+async def _mine(manager, miner):
+    operation = await manager.group_commit.create_mining_operation(
+        'goldbach_verification', miner, None, 10, {"status": "pending"}
+    )
+    manager.group_commit.activate_mining_operation(operation['id'])
+    await manager._execute_mining_operation(operation['id'], 'goldbach_verification', 10, miner, Deadline())
+
+
+def test_frontier_discoveries_share_transactions():
+    db = FakeDatabase()
+    manager = _manager(db)
+
+    async def run():
+        manager.group_commit.start()
+        await asyncio.gather(*[_mine(manager, f"miner_{number}") for number in range(DISCOVERIES)])
+        await manager.group_commit.stop()
+
+    asyncio.run(run())
+
+    assert len(db.works) == DISCOVERIES
+    assert all(operation['status'] == 'completed' for operation in db.operations.values())
+    assert all(operation['claimed_interval'] is None for operation in db.operations.values())
+
+    # Every claim was a distinct interval and together they extend the frontier without gaps
+    covered = sorted((work['range_start'], work['range_end']) for work in db.works)
+    assert covered == [(ORIGIN + number * SPAN, ORIGIN + (number + 1) * SPAN) for number in range(DISCOVERIES)]
+    assert db.frontiers['goldbach_verification']['frontier'] == ORIGIN + DISCOVERIES * SPAN
+
+    # Create, claim, progress, discovery and frontier commit writes all ride shared transactions
+    assert db.transactions / DISCOVERIES < 0.2
+
+
+def test_shutdown_drains_running_operations_before_the_writer_stops():
+    db = FakeDatabase()
+
+    # Engines only stop between chunks, reporting the prefix they covered
+    async def verify_until_stopped(work_type, difficulty, deadline, interval=None, **options):
+        while not deadline.expired():
+            await asyncio.sleep(0.01)
+        return {
+            'computationResult': {'verified': True},
+            'verificationData': {'interval': {'assigned': list(interval), 'covered': [interval[0], interval[0] + 10]}},
+            'signature': f"{interval[0]:x}",
+            'stopReason': deadline.reason,
+            'computationTime': 0.01,
+            'energyConsumed': 0.001
+        }
+
+    manager = _manager(db, verify_until_stopped)
+
+    async def run():
+        manager.group_commit.start()
+        for number in range(3):
+            operation = await manager.group_commit.create_mining_operation(
+                'goldbach_verification', f"miner_{number}", None, 10, {"status": "pending"}
+            )
+            manager.scheduler.reserve()
+            manager._submit_operation(
+                operation['id'], 'goldbach_verification', 10, f"miner_{number}", f"miner_{number}", PRIORITY_AUTONOMOUS
+            )
+        await asyncio.sleep(0.05)
+
+        await manager.drain_operations(timeout=5)
+        await manager.group_commit.stop()
+
+    asyncio.run(run())
+
+    # Both running operations recorded their covered prefix; the queued one was left for recovery
+    statuses = sorted(operation['status'] for operation in db.operations.values())
+    assert statuses == ['active', 'cancelled', 'cancelled']
+    assert len(db.works) == 2
+    assert len(manager.scheduler.queue) == 1
+    assert all(operation['claimed_interval'] is None for operation in db.operations.values())
@@ -0,0 +1,46 @@
+"""
+Merkle Tree Tests - Python Implementation
+Inclusion proofs for every leaf of trees whose levels have an odd node to promote
+"""
+
+import pytest
+
+from merkle_tree import EMPTY_ROOT, discovery_leaf, inclusion_proof, merkle_root, verify_inclusion
+
+
+def _leaves(count):
+    return [discovery_leaf(f"{number:064x}", {'index': number, 'verified': True}) for number in range(count)]
+
+
+@pytest.mark.parametrize("count", [1, 3, 5, 7, 13])
+def test_every_leaf_proves_against_the_root(count):
+    leaves = _leaves(count)
+    root = merkle_root(leaves)
+
+    for index, leaf in enumerate(leaves):
+        assert verify_inclusion(leaf, inclusion_proof(leaves, index), root)
+
+
+def test_proof_rejects_another_leaf_and_another_root():
+    leaves = _leaves(7)
+    root = merkle_root(leaves)
+    proof = inclusion_proof(leaves, 6)
+
+    assert not verify_inclusion(leaves[5], proof, root)
+    assert not verify_inclusion(leaves[6], proof, merkle_root(leaves[:6]))
+
+
+def test_promoted_node_is_not_duplicated():
+    # Pairing an odd node with itself would give [a, b, c] and [a, b, c, c] the same root
+    leaves = _leaves(3)
+    assert merkle_root(leaves) != merkle_root(leaves + leaves[-1:])
+
+
+def test_result_text_and_dict_make_the_same_leaf():
+    assert discovery_leaf('ab', '{"verified": true, "index": 1}') == discovery_leaf('ab', {'index': 1, 'verified': True})
+
+
+def test_empty_tree():
+    assert merkle_root([]) == EMPTY_ROOT
+    with pytest.raises(IndexError):
+        inclusion_proof([], 0)
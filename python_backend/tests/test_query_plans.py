@@ -0,0 +1,110 @@
+"""
+Query Plan Tests - Python Implementation
+EXPLAIN the hot DatabaseManager queries against DATABASE_URL and check they use the 0002 indexes
+"""
+
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Set
+
+import pytest
+
+from database import DatabaseManager, run_migrations
+from postgres_pool import PostgresPool
+
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(not DATABASE_URL, reason="DATABASE_URL is not set")
+
+INDEX_SCANS = ('Index Scan', 'Index Only Scan')
+
+
+class ExplainingPool(PostgresPool):
+    """
+    PostgresPool that plans queries instead of running them
+
+    Every query DatabaseManager sends is prefixed with EXPLAIN and its plan
+    recorded; callers get no rows back. Sequential scans are disabled for
+    the statement, because on the nearly empty tables of a test database
+    the planner would rather read the whole table than any index.
+    """
+
+    def __init__(self, database_url: str):
+        super().__init__(database_url, min_size=1, max_size=1)
+        self.plans: List[Dict[str, Any]] = []
+
+    async def fetch_all(self, query: str, *args, timeout=None):
+        await self._explain(query, args)
+        return []
+
+    async def fetch_one(self, query: str, *args, timeout=None):
+        await self._explain(query, args)
+        return None
+
+    async def _explain(self, query: str, args):
+        async with self.transaction() as connection:
+            await connection.execute("SET LOCAL enable_seqscan = off")
+            plan = await connection.fetchval(f"EXPLAIN (FORMAT JSON) {query}", *args)
+        self.plans.append(plan[0]['Plan'])
+
+
+def _scanned_indexes(plan: Dict[str, Any], node_types=INDEX_SCANS) -> Set[str]:
+    """Names of the indexes read by scans of `node_types` anywhere in a plan"""
+    indexes = {plan['Index Name']} if plan['Node Type'] in node_types else set()
+    for child in plan.get('Plans', []):
+        indexes |= _scanned_indexes(child, node_types)
+    return indexes
+
+
+@pytest.fixture(scope="module")
+def schema():
+    run_migrations(DATABASE_URL)
+
+
+def _plan(schema, call: Callable[[DatabaseManager], Awaitable[Any]]) -> Dict[str, Any]:
+    """Plan of the single query `call` makes"""
+    async def explain():
+        db_manager = DatabaseManager()
+        db_manager.database = ExplainingPool(DATABASE_URL)
+        await db_manager.database.connect()
+        try:
+            await call(db_manager)
+        finally:
+            await db_manager.database.disconnect()
+        return db_manager.database.plans
+
+    plans = asyncio.run(explain())
+    assert len(plans) == 1
+    return plans[0]
+
+
+@pytest.mark.parametrize("page", [{}, {'before_index': 500}, {'after_index': 500}])
+def test_get_blocks_scans_block_index(schema, page):
+    plan = _plan(schema, lambda db_manager: db_manager.get_blocks(limit=20, **page))
+    assert 'blocks_index_unique' in _scanned_indexes(plan)
+
+
+def test_get_latest_block_scans_block_index(schema):
+    plan = _plan(schema, lambda db_manager: db_manager.get_latest_block())
+    assert 'blocks_index_unique' in _scanned_indexes(plan)
+
+
+def test_get_block_discoveries_scans_block_work_index(schema):
+    plan = _plan(schema, lambda db_manager: db_manager.get_block_discoveries(1))
+    assert 'mathematical_work_block_idx' in _scanned_indexes(plan)
+
+
+def test_get_active_mining_operations_scans_active_index(schema):
+    plan = _plan(schema, lambda db_manager: db_manager.get_active_mining_operations())
+    assert 'mining_operations_active_idx' in _scanned_indexes(plan)
+
+
+def test_claim_orphaned_operations_scans_lease_index(schema):
+    plan = _plan(schema, lambda db_manager: db_manager.claim_orphaned_operations('test-owner', 30.0))
+    # "lease_expires_at IS NULL OR ... < now" may be planned as a BitmapOr of two scans of the same index
+    assert 'mining_operations_lease_idx' in _scanned_indexes(plan, INDEX_SCANS + ('Bitmap Index Scan',))
+
+
+def test_get_latest_metrics_scans_timestamp_index(schema):
+    plan = _plan(schema, lambda db_manager: db_manager.get_latest_metrics())
+    assert 'network_metrics_timestamp_idx' in _scanned_indexes(plan)
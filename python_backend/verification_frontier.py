@@ -0,0 +1,74 @@
+"""
+Verification Frontier - Python Implementation
+Interval bookkeeping that lets successive Goldbach/Collatz operations extend coverage instead of redoing it
+"""
+
+import logging
+from typing import Any, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Where coverage starts for each resumable work type
+FRONTIER_ORIGINS = {
+    'goldbach_verification': 4,
+    'collatz_verification': 1
+}
+
+
+def new_frontier_state(origin: int) -> Dict[str, Any]:
+    """
+    Fresh frontier state
+
+    frontier:   everything in [origin, frontier) is verified
+    next_start: everything in [frontier, next_start) has been handed out
+    completed:  verified intervals above the frontier, waiting for the gap below them to close
+    released:   handed-out intervals that were abandoned and must be re-assigned first
+    """
+    return {'frontier': origin, 'next_start': origin, 'completed': [], 'released': []}
+
+
+def claim_interval(state: Dict[str, Any], span: int) -> Tuple[int, int]:
+    """Assign the next unverified interval of at most `span` integers, mutating state"""
+    if state['released']:
+        start, end = state['released'].pop(0)
+        if end - start > span:
+            state['released'].insert(0, [start + span, end])
+            end = start + span
+        return start, end
+
+    start = state['next_start']
+    state['next_start'] = start + span
+    return start, start + span
+
+
+def commit_interval(state: Dict[str, Any], start: int, covered_end: int, claimed_end: int):
+    """Record [start, covered_end) as verified and hand back any uncovered tail of the claim"""
+    if covered_end > start:
+        state['completed'] = _merge(state['completed'] + [[start, covered_end]])
+    if covered_end < claimed_end:
+        release_interval(state, max(start, covered_end), claimed_end)
+
+    # Advance the frontier over every completed interval that now touches it
+    while state['completed'] and state['completed'][0][0] <= state['frontier']:
+        state['frontier'] = max(state['frontier'], state['completed'].pop(0)[1])
+
+
+def release_interval(state: Dict[str, Any], start: int, end: int):
+    """Return an abandoned claim so the next operation picks it up"""
+    if end <= start:
+        return
+    if end == state['next_start']:
+        state['next_start'] = start
+    else:
+        state['released'] = _merge(state['released'] + [[start, end]])
+
+
+def _merge(intervals: List[List[int]]) -> List[List[int]]:
+    """Sort and coalesce overlapping or touching [start, end) intervals"""
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Compute Worker - Python Implementation
+Remote compute node that leases mining jobs from the coordinator and runs them on the local engines
+
+Usage:
+    WORKER_TOKEN=... python -m python_backend.worker --coordinator http://localhost:5001 [--name node-1]
+
+Start it several times (on one machine or many) for several workers. The
+coordinator keeps valuation, discovery records and block assembly; a worker
+only runs the engine and posts back the result with its verificationData
+and signature. When the coordinator runs several uvicorn workers, only the
+elected leader accepts worker calls; the others answer 503 and the call is
+retried until it reaches the leader.
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import socket
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from typing import Any, Dict, Optional, Union
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from compute_executor import DEFAULT_PREWARM_PRIME_LIMIT, prewarm_engines
+from deadline import ComputationCancelled, Deadline
+from hybrid_mathematical_system import HybridMathematicalSystem
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COORDINATOR_URL = os.getenv("COORDINATOR_URL", "http://localhost:5001")
+
+# Shared secret the coordinator expects in X-Worker-Token
+DEFAULT_WORKER_TOKEN = os.getenv("WORKER_TOKEN")
+
+# Longest a lease request waits on the coordinator for a job before asking again
+LEASE_WAIT_SECONDS = 20.0
+
+# A follower process answers 503; retry after this long so the request lands on the leader
+LEADER_RETRY_SECONDS = 0.1
+
+# Back-off bounds while the coordinator is unreachable
+MIN_RETRY_SECONDS = 1.0
+MAX_RETRY_SECONDS = 30.0
+
+
+class LeaseLost(Exception):
+    """The coordinator no longer recognises this worker as the job's holder"""
+
+
+class ComputeWorker:
+    """
+    Pull loop of one worker process
+
+    A lease request long-polls the coordinator; a job is computed here with a
+    Deadline built from the time the coordinator has left for it, while a
+    heartbeat thread renews the lease. A heartbeat reply asking to stop (the
+    operation was cancelled) cancels the deadline, and a refused heartbeat
+    means the job was handed to another worker, so the result is dropped.
+    """
+
+    def __init__(self, coordinator_url: str, name: str, prewarm_prime_limit: int = DEFAULT_PREWARM_PRIME_LIMIT,
+                 token: Optional[str] = DEFAULT_WORKER_TOKEN):
+        self.coordinator_url = coordinator_url.rstrip('/')
+        self.name = name
+        self.token = token
+        self.worker_id = uuid.uuid4().hex
+        self.hybrid_system = HybridMathematicalSystem()
+        self.prewarm_prime_limit = prewarm_prime_limit
+        self.jobs_completed = 0
+
+    def run(self):
+        """Lease and run jobs until interrupted"""
+        logger.info(f"🔥 WORKER {self.name}: Prewarming engines...")
+        prewarm_engines(self.hybrid_system, self.prewarm_prime_limit)
+        logger.info(f"🛰️ WORKER {self.name}: Leasing jobs from {self.coordinator_url}")
+
+        retry_seconds = MIN_RETRY_SECONDS
+        while True:
+            try:
+                job = self._lease()
+                retry_seconds = MIN_RETRY_SECONDS
+            except (urllib.error.URLError, ConnectionError, TimeoutError) as e:
+                logger.warning(f"⚠️ WORKER {self.name}: Coordinator unreachable ({e}), retrying in {retry_seconds:.0f}s")
+                time.sleep(retry_seconds * random.uniform(1.0, 1.5))
+                retry_seconds = min(retry_seconds * 2, MAX_RETRY_SECONDS)
+                continue
+
+            if job:
+                self._run_job(job)
+
+    def _run_job(self, job: Dict[str, Any]):
+        """Compute one leased job under heartbeats and post the outcome"""
+        job_id = job['jobId']
+        deadline = Deadline(job['deadlineSeconds'])
+        lease_lost = threading.Event()
+        finished = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=(job_id, job['leaseSeconds'] / 3, deadline, lease_lost, finished),
+            name=f"heartbeat-{job_id[:8]}", daemon=True
+        )
+        heartbeat.start()
+
+        logger.info(f"⚙️ WORKER {self.name}: Running {job['workType']} (difficulty {job['difficulty']})")
+        payload: Dict[str, Any] = {'workerId': self.worker_id}
+        try:
+            payload['result'] = self.hybrid_system.compute_mathematical_work(
+                job['workType'], job['difficulty'], deadline, **job['options']
+            )
+        except ComputationCancelled as e:
+            payload.update(error=str(e), stopped=True)
+        except Exception as e:
+            logger.error(f"❌ WORKER {self.name}: {job['workType']} failed: {e}")
+            payload['error'] = str(e)
+        finally:
+            finished.set()
+            heartbeat.join()
+
+        if lease_lost.is_set():
+            logger.warning(f"⚠️ WORKER {self.name}: Lease on job {job_id[:8]} was lost, dropping its result")
+            return
+        try:
+            body = self._encode(payload)
+        except (TypeError, ValueError) as e:
+            # An unserializable result fails this job, not the worker
+            logger.error(f"❌ WORKER {self.name}: Result of job {job_id[:8]} could not be serialized: {e}")
+            body = self._encode({'workerId': self.worker_id, 'error': f"Unserializable result: {e}"})
+        try:
+            self._post(f"/api/workers/jobs/{job_id}/result", body, timeout=30)
+            self.jobs_completed += 1
+        except LeaseLost:
+            logger.warning(f"⚠️ WORKER {self.name}: Coordinator refused the result of job {job_id[:8]}")
+        except (urllib.error.URLError, ConnectionError, TimeoutError) as e:
+            # The lease will expire and the coordinator dispatches the job again
+            logger.error(f"❌ WORKER {self.name}: Could not deliver job {job_id[:8]}: {e}")
+
+    def _heartbeat(self, job_id: str, interval: float, deadline: Deadline,
+                   lease_lost: threading.Event, finished: threading.Event):
+        """Renew the job's lease until it finishes; stop the computation if asked to or if the lease is gone"""
+        while not finished.wait(interval):
+            try:
+                reply = self._post(f"/api/workers/jobs/{job_id}/heartbeat", {'workerId': self.worker_id}, timeout=interval)
+            except LeaseLost:
+                lease_lost.set()
+                deadline.cancel()
+                return
+            except (urllib.error.URLError, ConnectionError, TimeoutError) as e:
+                logger.warning(f"⚠️ WORKER {self.name}: Heartbeat failed: {e}")
+                continue
+            if reply and reply.get('cancel'):
+                logger.info(f"⏹️ WORKER {self.name}: Coordinator cancelled job {job_id[:8]}")
+                deadline.cancel()
+
+    def _lease(self) -> Optional[Dict[str, Any]]:
+        return self._post('/api/workers/lease', {
+            'workerId': self.worker_id,
+            'name': self.name,
+            'slots': 1,
+            'waitSeconds': LEASE_WAIT_SECONDS
+        }, timeout=LEASE_WAIT_SECONDS + 10)
+
+    def _encode(self, payload: Dict[str, Any]) -> bytes:
+        # Simulation fallbacks carry datetimes; the coordinator stores results as JSON text anyway
+        return json.dumps(payload, default=str).encode()
+
+    def _post(self, path: str, payload: Union[Dict[str, Any], bytes], timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        POST JSON (a dict or already encoded) to the coordinator; None for 204 No Content, LeaseLost for 409 Conflict
+
+        503 comes from a coordinator process that is not the leader; the
+        call is repeated until it reaches the leader or `timeout` runs out.
+        """
+        data = payload if isinstance(payload, bytes) else self._encode(payload)
+        give_up_at = time.monotonic() + timeout
+        while True:
+            request = urllib.request.Request(
+                self.coordinator_url + path,
+                data=data,
+                headers={'Content-Type': 'application/json', 'X-Worker-Token': self.token or ''},
+                method='POST'
+            )
+            try:
+                with urllib.request.urlopen(request, timeout=timeout) as response:
+                    body = response.read()
+                    return json.loads(body) if response.status != 204 and body else None
+            except urllib.error.HTTPError as e:
+                if e.code == 409:
+                    raise LeaseLost(path) from e
+                if e.code != 503 or time.monotonic() + LEADER_RETRY_SECONDS >= give_up_at:
+                    raise
+            time.sleep(LEADER_RETRY_SECONDS * random.uniform(0.5, 1.5))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a compute worker for the productive mining coordinator")
+    parser.add_argument('--coordinator', default=DEFAULT_COORDINATOR_URL, help="Coordinator base URL")
+    parser.add_argument('--token', default=DEFAULT_WORKER_TOKEN, help="Shared worker token (default: WORKER_TOKEN)")
+    parser.add_argument('--name', default=f"{socket.gethostname()}-{os.getpid()}", help="Name shown in /api/workers")
+    parser.add_argument('--prewarm-prime-limit', type=int, default=DEFAULT_PREWARM_PRIME_LIMIT,
+                        help="Primes to sieve before taking work")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    if not args.token:
+        parser.error("a worker token is required (--token or WORKER_TOKEN)")
+    worker = ComputeWorker(args.coordinator, args.name, args.prewarm_prime_limit, args.token)
+    try:
+        worker.run()
+    except KeyboardInterrupt:
+        logger.info(f"🛑 WORKER {worker.name}: Stopped after {worker.jobs_completed} jobs")
+
+
+if __name__ == "__main__":
+    main()
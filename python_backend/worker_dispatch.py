@@ -0,0 +1,364 @@
+"""
+Worker Dispatch - Python Implementation
+Coordinator side of the remote worker protocol: jobs leased to compute nodes over HTTP
+"""
+
+import asyncio
+import hmac
+import logging
+import os
+import time
+import uuid
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Set
+
+from deadline import ComputationCancelled, Deadline
+from real_mathematical_engines import result_signature
+
+logger = logging.getLogger(__name__)
+
+
+class DispatchWithdrawn(RuntimeError):
+    """This process stopped coordinating workers (it lost leadership) before the job finished"""
+
+# A leased job whose worker sends no heartbeat or result for this long is dispatched again
+DEFAULT_WORKER_LEASE_SECONDS = float(os.getenv("WORKER_LEASE_SECONDS", "30"))
+
+# Leases of one job that may expire before it fails instead of being dispatched again
+MAX_JOB_ATTEMPTS = int(os.getenv("WORKER_MAX_JOB_ATTEMPTS", "3"))
+
+# Shared secret workers send in X-Worker-Token; remote workers are refused while it is unset
+WORKER_TOKEN = os.getenv("WORKER_TOKEN")
+
+
+class WorkerDispatcher:
+    """
+    Queue of engine computations waiting for remote workers
+
+    submit() has the same shape as ComputeExecutor.compute, so a mining
+    operation can run on a remote node without the manager changing how it
+    values, records and assembles the result. Workers long-poll lease() for
+    a job, heartbeat() while it runs and post the engine result back through
+    complete(). A lease that is not renewed in time (a dead or partitioned
+    worker) puts the job back at the front of the queue; a late result from
+    the old holder is refused. Cancelling the caller's deadline is passed to
+    the worker in its next heartbeat reply.
+
+    Jobs, leases and workers live in this process's memory, so with several
+    uvicorn workers only the elected leader serves /api/workers/* (followers
+    answer 503 and the worker retries until it reaches the leader). A
+    process that loses leadership calls withdraw(): its queued and leased
+    jobs fail with DispatchWithdrawn and the operations run them locally.
+
+    Workers authenticate with the shared WORKER_TOKEN, and a result is only
+    accepted if its signature matches its computationResult and it covers
+    the interval the job was leased for.
+    """
+
+    POLL_SECONDS = 0.5
+
+    def __init__(self, lease_seconds: float = DEFAULT_WORKER_LEASE_SECONDS, max_attempts: int = MAX_JOB_ATTEMPTS,
+                 token: Optional[str] = WORKER_TOKEN):
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max(max_attempts, 1)
+        self.token = token
+
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.pending: Deque[str] = deque()
+        self.leases: Dict[str, Dict[str, Any]] = {}
+        self.workers: Dict[str, Dict[str, Any]] = {}
+        self.waiting: Set[str] = set()  # workers currently long-polling for a job
+        self._job_available = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self.on_capacity_changed: Optional[Callable[[int], None]] = None
+
+        self.stats = {
+            'submitted': 0, 'dispatched': 0, 'completed': 0, 'failed': 0,
+            'expiredLeases': 0, 'staleResults': 0, 'rejectedResults': 0
+        }
+
+    def start(self):
+        """Start the task that expires leases and forgets silent workers"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._reap())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def capacity(self) -> int:
+        """Job slots offered by the live workers"""
+        return sum(worker['slots'] for worker in self.workers.values())
+
+    def has_idle_worker(self) -> bool:
+        return bool(self.waiting) and not self.pending
+
+    def authorize(self, token: Optional[str]) -> bool:
+        """Whether a request carries the shared worker token (always False while none is configured)"""
+        return bool(self.token) and token is not None and hmac.compare_digest(token.encode(), self.token.encode())
+
+    # ===== COORDINATOR SIDE =====
+
+    async def submit(self, work_type: str, difficulty: int, deadline: Optional[Deadline] = None,
+                     **options) -> Dict[str, Any]:
+        """Queue a computation for the next free worker and wait for its result"""
+        deadline = deadline or Deadline()
+        job_id = uuid.uuid4().hex
+        job = {
+            'jobId': job_id,
+            'workType': work_type,
+            'difficulty': difficulty,
+            'options': options,
+            'deadline': deadline,
+            'future': asyncio.get_running_loop().create_future(),
+            'attempts': 0,
+            'workerId': None
+        }
+        self.jobs[job_id] = job
+        self._enqueue(job_id)
+        self.stats['submitted'] += 1
+
+        try:
+            while True:
+                try:
+                    return await asyncio.wait_for(asyncio.shield(job['future']), self.POLL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+                # A job nobody has picked up yet stops here; a leased one hears about it in its next heartbeat
+                if deadline.expired() and job_id not in self.leases:
+                    raise ComputationCancelled(f"Computation stopped before a worker took it: {deadline.reason}")
+        finally:
+            job['future'].cancel()
+            if job_id not in self.leases:
+                self._forget(job_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get job counters, queue depth and the live workers"""
+        now = time.time()
+        return {
+            **self.stats,
+            'pending': len(self.pending),
+            'leased': len(self.leases),
+            'capacity': self.capacity,
+            'leaseSeconds': self.lease_seconds,
+            'workers': [
+                {
+                    'workerId': worker_id,
+                    'name': worker['name'],
+                    'slots': worker['slots'],
+                    'running': sum(1 for job in self.leases.values() if job['workerId'] == worker_id),
+                    'waiting': worker_id in self.waiting,
+                    'lastSeenSeconds': round(now - worker['lastSeen'], 1),
+                    'completed': worker['completed']
+                }
+                for worker_id, worker in self.workers.items()
+            ]
+        }
+
+    def withdraw(self):
+        """Stop coordinating: fail every queued or leased job with DispatchWithdrawn and forget the workers"""
+        jobs = list(self.jobs.values())
+        for job in jobs:
+            self._resolve(job, error=DispatchWithdrawn("Coordinator lost leadership before the job finished"))
+        self.jobs.clear()
+        self.pending.clear()
+        self.leases.clear()
+        if self.workers:
+            self.workers.clear()
+            self._capacity_changed()
+        if jobs:
+            logger.warning(f"🛰️ WORKER DISPATCH: Withdrew {len(jobs)} jobs after losing leadership")
+
+    # ===== WORKER SIDE =====
+
+    async def lease(self, worker_id: str, name: str, slots: int = 1,
+                    wait_seconds: float = 20.0) -> Optional[Dict[str, Any]]:
+        """Hand the next queued job to a worker, waiting up to wait_seconds for one; None if there is none"""
+        self._touch(worker_id, name, slots)
+        give_up_at = time.monotonic() + min(wait_seconds, self.lease_seconds / 2)
+
+        while True:
+            while self.pending:
+                job = self.jobs.get(self.pending.popleft())
+                if job is None or job['future'].done():
+                    continue
+                return self._grant(job, worker_id)
+
+            remaining = give_up_at - time.monotonic()
+            if remaining <= 0:
+                return None
+            self._job_available.clear()
+            self.waiting.add(worker_id)
+            try:
+                await asyncio.wait_for(self._job_available.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self.waiting.discard(worker_id)
+                self._touch(worker_id, name, slots)
+
+    def heartbeat(self, worker_id: str, job_id: str) -> Optional[Dict[str, Any]]:
+        """Renew a job's lease; None if the worker no longer holds it. The reply says whether to stop."""
+        job = self.leases.get(job_id)
+        if job is None or job['workerId'] != worker_id:
+            return None
+
+        job['leaseExpiresAt'] = time.monotonic() + self.lease_seconds
+        self.workers[worker_id]['lastSeen'] = time.time()
+        return {'cancel': job['future'].done() or job['deadline'].cancelled, 'leaseSeconds': self.lease_seconds}
+
+    def complete(self, worker_id: str, job_id: str, result: Optional[Dict[str, Any]] = None,
+                 error: Optional[str] = None, stopped: bool = False) -> bool:
+        """
+        Accept a worker's result (or error) for a job it holds; False if its lease was lost
+
+        A result that fails validation fails the job and raises ValueError.
+        """
+        job = self.leases.get(job_id)
+        if job is None or job['workerId'] != worker_id:
+            self.stats['staleResults'] += 1
+            logger.warning(f"⚠️ WORKER DISPATCH: Ignored result for job {job_id[:8]} from a worker without its lease")
+            return False
+
+        self._forget(job_id)
+        worker = self.workers.get(worker_id)
+        if worker:
+            worker['lastSeen'] = time.time()
+            worker['completed'] += 1
+
+        problem = self._validate(job, result) if error is None else None
+        if problem:
+            self.stats['rejectedResults'] += 1
+            self.stats['failed'] += 1
+            logger.warning(f"⚠️ WORKER DISPATCH: Rejected result of job {job_id[:8]} from {job['workerName']}: {problem}")
+            self._resolve(job, error=RuntimeError(f"Worker {job['workerName']} sent an invalid result: {problem}"))
+            raise ValueError(problem)
+        if error is None:
+            self.stats['completed'] += 1
+            self._resolve(job, result=result)
+        else:
+            self.stats['failed'] += 1
+            failure = ComputationCancelled(error) if stopped else RuntimeError(f"Worker {job['workerName']}: {error}")
+            self._resolve(job, error=failure)
+        return True
+
+    # ===== INTERNALS =====
+
+    def _validate(self, job: Dict[str, Any], result: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Why a worker's result cannot be accepted for this job, or None if it can"""
+        if not isinstance(result, dict) or 'computationResult' not in result:
+            return "no computationResult"
+        if result.get('workType') != job['workType'] or result.get('difficulty') != job['difficulty']:
+            return f"result is for {result.get('workType')} at difficulty {result.get('difficulty')}"
+        if result.get('signature') != result_signature(result['computationResult']):
+            return "signature does not match computationResult"
+
+        interval = job['options'].get('interval')
+        if interval:
+            reported = (result.get('verificationData') or {}).get('interval') or {}
+            assigned, covered = reported.get('assigned'), reported.get('covered')
+            if assigned is None or list(assigned) != list(interval):
+                return f"verified interval {assigned} is not the leased {list(interval)}"
+            if not covered or covered[0] != interval[0] or not interval[0] <= covered[1] <= interval[1]:
+                return f"covered range {covered} is outside the leased interval {list(interval)}"
+        return None
+
+    def _enqueue(self, job_id: str, front: bool = False):
+        if front:
+            self.pending.appendleft(job_id)
+        else:
+            self.pending.append(job_id)
+        self._job_available.set()
+
+    def _grant(self, job: Dict[str, Any], worker_id: str) -> Dict[str, Any]:
+        """Lease a job to a worker and build the payload it runs"""
+        job['attempts'] += 1
+        job['workerId'] = worker_id
+        job['workerName'] = self.workers[worker_id]['name']
+        job['leaseExpiresAt'] = time.monotonic() + self.lease_seconds
+        self.leases[job['jobId']] = job
+        self.stats['dispatched'] += 1
+        logger.info(f"📤 WORKER DISPATCH: {job['workType']} job {job['jobId'][:8]} leased to {job['workerName']}")
+
+        return {
+            'jobId': job['jobId'],
+            'workType': job['workType'],
+            'difficulty': job['difficulty'],
+            'options': job['options'],
+            'deadlineSeconds': job['deadline'].remaining(),
+            'leaseSeconds': self.lease_seconds
+        }
+
+    def _resolve(self, job: Dict[str, Any], result: Optional[Dict[str, Any]] = None,
+                 error: Optional[Exception] = None):
+        # The submitter may have given up (cancelled task), leaving nobody to read the outcome
+        if job['future'].done():
+            return
+        if error is not None:
+            job['future'].set_exception(error)
+        else:
+            job['future'].set_result(result)
+
+    def _forget(self, job_id: str):
+        self.jobs.pop(job_id, None)
+        self.leases.pop(job_id, None)
+
+    def _touch(self, worker_id: str, name: str, slots: int):
+        worker = self.workers.get(worker_id)
+        if worker is None:
+            self.workers[worker_id] = {'name': name, 'slots': max(slots, 1), 'lastSeen': time.time(), 'completed': 0}
+            logger.info(f"🛰️ WORKER DISPATCH: Worker {name} joined ({self.capacity} remote slots)")
+            self._capacity_changed()
+        else:
+            worker['lastSeen'] = time.time()
+
+    def _capacity_changed(self):
+        if self.on_capacity_changed:
+            self.on_capacity_changed(self.capacity)
+
+    async def _reap(self):
+        """Re-dispatch jobs whose lease lapsed and drop workers that stopped polling"""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            now = time.monotonic()
+
+            for job_id, job in list(self.leases.items()):
+                if job['leaseExpiresAt'] > now:
+                    continue
+                del self.leases[job_id]
+                self.stats['expiredLeases'] += 1
+                if job['future'].done():
+                    self._forget(job_id)
+                elif job['deadline'].expired():
+                    self._forget(job_id)
+                    self._resolve(job, error=ComputationCancelled(
+                        f"Worker {job['workerName']} was lost and the deadline has passed"
+                    ))
+                elif job['attempts'] >= self.max_attempts:
+                    self._forget(job_id)
+                    self.stats['failed'] += 1
+                    self._resolve(job, error=RuntimeError(
+                        f"Job lost by {job['attempts']} workers, last {job['workerName']}"
+                    ))
+                else:
+                    logger.warning(
+                        f"⏰ WORKER DISPATCH: Lease of job {job_id[:8]} held by {job['workerName']} expired, re-dispatching"
+                    )
+                    job['workerId'] = None
+                    self._enqueue(job_id, front=True)
+
+            silent = [
+                worker_id for worker_id, worker in self.workers.items()
+                if worker_id not in self.waiting and time.time() - worker['lastSeen'] > self.lease_seconds
+                and not any(job['workerId'] == worker_id for job in self.leases.values())
+            ]
+            for worker_id in silent:
+                logger.warning(f"🛰️ WORKER DISPATCH: Worker {self.workers.pop(worker_id)['name']} went silent")
+            if silent:
+                self._capacity_changed()